@@ -4,13 +4,13 @@ Provides REST API and WebSocket endpoints for network visualization
 """
 
 from flask import Flask, jsonify, request, send_from_directory
-from flask_socketio import SocketIO, emit
+from flask_socketio import SocketIO, emit, join_room, leave_room
 from flask_cors import CORS
-import threading
 import time
 import logging
 import sys
 import os
+from collections import deque
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -18,6 +18,14 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import config
 from mininet_manager import MininetManager
 from ryu_client import RyuClient
+from topology_cache import TopologyCache, delta_size
+from rate_engine import PortRateEngine
+from stats_store import StatsHistory
+from stats_archive import StatsArchive
+from subscriptions import Subscription, SubscriptionRegistry, normalize_dpid
+from scheduler import TieredScheduler
+from jobs import JobRunner
+from topology_generators import GENERATORS, from_spec, size_limits
 
 # Configure logging
 logging.basicConfig(
@@ -41,10 +49,17 @@ socketio = SocketIO(
 # Global instances
 mininet_manager = MininetManager()
 ryu_client = RyuClient()
+rate_engine = PortRateEngine()
+stats_history = StatsHistory()
+stats_archive = StatsArchive() if config.STATS_ARCHIVE_ENABLED else None
+subscriptions = SubscriptionRegistry()
+job_runner = JobRunner()  # serializes every MininetManager operation
+throughput_runs = deque(maxlen=config.IPERF_HISTORY)  # finished iperf runs, oldest first
 
-# Stats monitoring thread control
-stats_thread = None
+# Stats monitoring control
+scheduler = TieredScheduler()
 stats_running = False
+last_stats_poll = 0.0  # monotonic time of the last port stats poll
 
 
 # ============== HELPER FUNCTIONS ==============
@@ -53,19 +68,28 @@ def get_topology_data():
     """
     Fetch current topology from Ryu and format for D3.js
     
+    Switches, links and hosts are read in parallel. A read that fails
+    reuses the last list read successfully. If there is none the snapshot
+    is still returned, marked "partial", and only contains edges whose
+    endpoints are both present as nodes. If nothing could be read or
+    reused the snapshot carries an "error" instead.
+    
     Returns:
         Dictionary with nodes and edges arrays
     """
     try:
-        switches = ryu_client.get_switches()
-        links = ryu_client.get_links()
-        hosts = ryu_client.get_hosts()
+        topology = ryu_client.get_topology()
+        switches = topology['switches']
+        links = topology['links']
+        hosts = topology['hosts']
         
         nodes = []
         edges = []
         
         # Add switch nodes
+        switch_ids = set()
         for switch in switches:
+            switch_ids.add(f"s{switch['dpid_int']}")
             nodes.append({
                 "id": f"s{switch['dpid_int']}",
                 "name": f"s{switch['dpid_int']}",
@@ -87,6 +111,10 @@ def get_topology_data():
             port_info = host.get('port', {})
             switch_dpid = port_info.get('dpid', '')
             
+            # Drop attachments to switches missing from this snapshot
+            if switch_dpid and f"s{int(switch_dpid, 16)}" not in switch_ids:
+                switch_dpid = ''
+            
             # Get host IP or use MAC-based name
             ip_list = host.get('ipv4', [])
             ip_addr = ip_list[0] if ip_list else None
@@ -115,6 +143,10 @@ def get_topology_data():
             src_dpid = int(link['src']['dpid'], 16)
             dst_dpid = int(link['dst']['dpid'], 16)
             
+            # Skip links to switches missing from this snapshot
+            if f"s{src_dpid}" not in switch_ids or f"s{dst_dpid}" not in switch_ids:
+                continue
+            
             # Create a canonical link ID (smaller dpid first)
             link_id = tuple(sorted([src_dpid, dst_dpid]))
             
@@ -131,7 +163,7 @@ def get_topology_data():
                 "type": "switch-switch"
             })
         
-        return {
+        data = {
             "nodes": nodes,
             "edges": edges,
             "switch_count": len(switches),
@@ -140,6 +172,23 @@ def get_topology_data():
             "topology_type": mininet_manager.topology_type
         }
         
+        if topology['stale']:
+            logger.warning(f"Reusing last good {', '.join(topology['stale'])}: "
+                           f"{topology['errors']}")
+        
+        missing = {part: error for part, error in topology['errors'].items()
+                   if part not in topology['stale']}
+        if len(missing) == 3:
+            # Nothing was read, so this is an outage rather than an empty network
+            raise RuntimeError(f"All topology reads failed: {missing}")
+        
+        if missing:
+            logger.warning(f"Partial topology snapshot: {missing}")
+            data["partial"] = True
+            data["errors"] = missing
+        
+        return data
+    
     except Exception as e:
         logger.error(f"Error fetching topology data: {e}")
         return {
@@ -153,57 +202,176 @@ def get_topology_data():
         }
 
 
+def empty_topology_data():
+    """
+    Build the snapshot published when no network is running
+    
+    Returns:
+        Dictionary with empty nodes and edges arrays
+    """
+    return {
+        "nodes": [],
+        "edges": [],
+        "switch_count": 0,
+        "host_count": 0,
+        "link_count": 0,
+        "topology_type": None
+    }
+
+
+def broadcast_topology(snapshot, delta):
+    """
+    Push a topology change to all clients subscribed to topology events
+    
+    Sends a topology_delta when a previous version exists and the delta
+    is smaller than the full snapshot, otherwise a full topology_update.
+    """
+    full_size = len(snapshot['nodes']) + len(snapshot['edges'])
+    
+    if delta is None or delta_size(delta) >= full_size:
+        event, payload = 'topology_update', snapshot
+    else:
+        event, payload = 'topology_delta', delta
+    
+    for room, subscription in subscriptions.rooms().items():
+        if subscription.wants('topology'):
+            socketio.emit(event, payload, to=room)
+
+
+def broadcast_stats(stats_data):
+    """Send each subscription room its slice of a stats_update"""
+    for room, subscription in subscriptions.rooms().items():
+        if subscription.wants('stats'):
+            socketio.emit('stats_update', subscription.slice_stats(stats_data), to=room)
+
+
+def broadcast_job_progress(job, event):
+    """Send progress events for topology and measurement jobs"""
+    if job.kind in ('create', 'modify', 'stop'):
+        socketio.emit('topology_progress', event)
+    elif job.kind in ('ping_matrix', 'iperf'):
+        socketio.emit('measurement_progress', event)
+
+
+topology_cache = TopologyCache(get_topology_data)
+topology_cache.add_listener(broadcast_topology)
+job_runner.add_listener(broadcast_job_progress)
+
+
 def start_stats_monitoring():
-    """Start the statistics monitoring thread"""
-    global stats_thread, stats_running
+    """Start the scheduled statistics polling"""
+    global stats_running
     
     if not stats_running:
         stats_running = True
-        stats_thread = threading.Thread(target=stats_monitoring_loop, daemon=True)
-        stats_thread.start()
-        logger.info("Started stats monitoring thread")
+        scheduler.start()
+        logger.info("Started stats monitoring")
 
 
 def stop_stats_monitoring():
-    """Stop the statistics monitoring thread"""
+    """Stop the scheduled statistics polling"""
     global stats_running
     stats_running = False
-    logger.info("Stopped stats monitoring thread")
+    logger.info("Stopped stats monitoring")
 
 
-def stats_monitoring_loop():
-    """Background thread that polls Ryu for statistics"""
-    global stats_running
+def poll_port_stats():
+    """
+    Scheduled task that polls Ryu for port statistics
     
-    while stats_running:
-        try:
-            # Get port statistics from all switches
-            port_stats = ryu_client.get_port_stats()
-            
-            # Calculate total packet counts
-            total_packets = 0
-            total_bytes = 0
-            
-            for switch_dpid, ports in port_stats.items():
-                for port in ports:
-                    total_packets += port.get('rx_packets', 0) + port.get('tx_packets', 0)
-                    total_bytes += port.get('rx_bytes', 0) + port.get('tx_bytes', 0)
-            
-            # Emit stats update to all connected clients
-            stats_data = {
-                "total_packets": total_packets,
-                "total_bytes": total_bytes,
-                "port_stats": port_stats,
-                "timestamp": time.time()
-            }
-            
-            socketio.emit('stats_update', stats_data)
-            
-        except Exception as e:
-            logger.error(f"Error in stats monitoring: {e}")
-        
-        # Wait before next update
-        time.sleep(config.STATS_UPDATE_INTERVAL)
+    Polls only the switches current subscribers want and skips its ticks
+    (apart from a heartbeat every STATS_IDLE_HEARTBEAT seconds) while
+    nobody wants stats, unless the archive is enabled, which always gets
+    every switch at the full rate. Per-switch requests are spread over
+    part of the interval; each switch keeps a fixed offset, so using the
+    tick time as the sample timestamp still gives every switch evenly
+    spaced samples.
+    """
+    global last_stats_poll
+    
+    if not stats_running:
+        return
+    
+    now = time.monotonic()
+    if stats_archive is not None:
+        # Archive readers expect every switch at the full rate
+        dpids = None
+    elif subscriptions.wants_stats():
+        dpids = subscriptions.wanted_dpids()
+    elif config.STATS_IDLE_HEARTBEAT and now - last_stats_poll >= config.STATS_IDLE_HEARTBEAT:
+        logger.debug("Heartbeat stats poll")
+        dpids = None
+    else:
+        return
+    last_stats_poll = now
+    
+    # Get port statistics from the switches subscribers care about
+    timestamp = time.time()
+    port_stats = ryu_client.get_port_stats(
+        dpids=dpids,
+        spread=config.STATS_UPDATE_INTERVAL * config.STATS_SPREAD_FRACTION
+    )
+    
+    # Per-port pps/bps since the previous sample
+    rates = rate_engine.update(port_stats, timestamp)
+    stats_history.record(port_stats, rates, timestamp)
+    if stats_archive is not None:
+        stats_archive.append(port_stats, rates, timestamp)
+    
+    # Calculate total packet counts
+    total_packets = 0
+    total_bytes = 0
+    
+    for switch_dpid, ports in port_stats.items():
+        for port in ports:
+            total_packets += port.get('rx_packets', 0) + port.get('tx_packets', 0)
+            total_bytes += port.get('rx_bytes', 0) + port.get('tx_bytes', 0)
+    
+    # Emit stats update to subscribed clients
+    stats_data = {
+        "total_packets": total_packets,
+        "total_bytes": total_bytes,
+        "port_stats": port_stats,
+        "port_rates": rates['ports'],
+        "total_rates": rates['totals'],
+        "timestamp": timestamp
+    }
+    
+    broadcast_stats(stats_data)
+
+
+def poll_flow_stats():
+    """Scheduled task that polls aggregate flow table statistics"""
+    if not stats_running or not subscriptions.wants_stats('flows'):
+        return
+    
+    dpids = subscriptions.wanted_dpids('flows')
+    if dpids is None:
+        dpids = [switch['dpid_int'] for switch in ryu_client.get_switches()]
+    
+    timestamp = time.time()
+    flows = ryu_client.get_aggregate_flow_stats_fanout(
+        dpids,
+        spread=config.FLOW_STATS_INTERVAL * config.STATS_SPREAD_FRACTION
+    )
+    
+    flow_data = {"flows": flows, "timestamp": timestamp}
+    for room, subscription in subscriptions.rooms().items():
+        if subscription.wants('flows'):
+            socketio.emit('flow_stats_update', subscription.slice_flows(flow_data), to=room)
+
+
+def refresh_topology():
+    """Scheduled task that keeps the cached topology fresh"""
+    topology_cache.refresh()
+
+
+# Each tier runs on its own fixed-rate clock, offset so they do not coincide
+scheduler.add_task('port_stats', config.STATS_UPDATE_INTERVAL, poll_port_stats)
+scheduler.add_task('flow_stats', config.FLOW_STATS_INTERVAL, poll_flow_stats,
+                   phase=config.STATS_UPDATE_INTERVAL / 2)
+scheduler.add_task('topology', topology_cache.refresh_interval, refresh_topology,
+                   phase=config.STATS_UPDATE_INTERVAL / 4)
 
 
 # ============== REST API ENDPOINTS ==============
@@ -228,19 +396,102 @@ def health_check():
     })
 
 
+def create_topology_job(job, topology_type, size, spec=None):
+    """
+    Job that builds a topology and waits for Ryu to discover it
+    
+    Args:
+        job: The running job (for progress reports)
+        topology_type: Topology type
+        size: Topology size
+        spec: Topology spec for custom topologies
+    
+    Returns:
+        Creation result from MininetManager.create
+    """
+    result = mininet_manager.create(topology_type, size, progress=job.progress, spec=spec)
+    
+    # Wait until Ryu has registered every switch, then continue at once
+    job.progress('discovery', "Waiting for Ryu to discover the topology...")
+    missing = ryu_client.wait_for_switches(mininet_manager.get_dpids())
+    if missing:
+        logger.warning(f"Switches not connected to Ryu yet: {missing}")
+    
+    # Start stats monitoring
+    start_stats_monitoring()
+    
+    # Refresh the cached topology (broadcasts to the frontend on change)
+    topology_cache.refresh()
+    
+    logger.info(f"Successfully created {topology_type} topology")
+    return result
+
+
+def modify_topology_job(job, ops):
+    """
+    Job that applies live changes to the running topology
+    
+    Args:
+        job: The running job (for progress reports)
+        ops: Operations for MininetManager.modify
+    
+    Returns:
+        Modification result, with success False for invalid operations
+    """
+    known = set(mininet_manager.get_dpids())
+    
+    job.progress('build', f"Applying {len(ops)} topology change(s)...")
+    try:
+        result = mininet_manager.modify(ops)
+    except ValueError as e:
+        result = {"success": False, "error": str(e)}
+    
+    # Only switches added by this job need to be waited for
+    added = [dpid for dpid in mininet_manager.get_dpids() if dpid not in known]
+    if added:
+        job.progress('discovery', "Waiting for Ryu to discover the new switches...")
+        missing = ryu_client.wait_for_switches(added)
+        if missing:
+            logger.warning(f"Switches not connected to Ryu yet: {missing}")
+    
+    topology_cache.refresh()
+    return result
+
+
+def stop_topology_job(job):
+    """Job that stops the running topology"""
+    stop_stats_monitoring()
+    job.progress('cleanup', "Stopping network...")
+    result = mininet_manager.stop()
+    
+    # Notify frontend
+    topology_cache.reset(empty_topology_data())
+    
+    logger.info("Topology stopped")
+    return result
+
+
 @app.route('/api/topology/create', methods=['POST'])
 def create_topology():
     """
     Create a new Mininet topology
     
+    The topology is built by a background job; progress is reported with
+    topology_progress events and GET /api/jobs/<job_id>.
+    
     Request Body:
         {
-            "type": "star|linear|tree|mesh",
+            "type": "star|linear|tree|mesh|fat_tree|leaf_spine|torus|random_regular",
             "size": <number>
         }
+        or, with ENABLE_CUSTOM_TOPOLOGIES,
+        {
+            "type": "custom",
+            "spec": {"switches": <number>, "links": [["s1", "s2"], ...], ...}
+        }
     
     Returns:
-        Success/error status and topology info
+        202 with the job id, or an error status
     """
     try:
         data = request.get_json()
@@ -250,9 +501,16 @@ def create_topology():
         
         topology_type = data.get('type', config.DEFAULT_TOPOLOGY)
         size = data.get('size', config.DEFAULT_SIZE)
+        spec = None
         
         # Validate inputs
-        if topology_type not in config.TOPOLOGY_TYPES:
+        if topology_type == 'custom' and config.ENABLE_CUSTOM_TOPOLOGIES:
+            try:
+                spec = from_spec(data.get('spec'))
+            except ValueError as e:
+                return jsonify({"success": False, "error": f"Invalid spec: {e}"}), 400
+            size = spec.switches
+        elif topology_type not in config.TOPOLOGY_TYPES:
             return jsonify({
                 "success": False,
                 "error": f"Invalid topology type. Must be one of: {', '.join(config.TOPOLOGY_TYPES)}"
@@ -263,44 +521,32 @@ def create_topology():
         except (ValueError, TypeError):
             return jsonify({"success": False, "error": "Size must be a number"}), 400
         
-        if size < config.MIN_SIZE or size > config.MAX_SIZE:
+        min_size, max_size = size_limits(topology_type)
+        if spec is None and (size < min_size or size > max_size):
             return jsonify({
                 "success": False,
-                "error": f"Size must be between {config.MIN_SIZE} and {config.MAX_SIZE}"
+                "error": f"Size must be between {min_size} and {max_size}"
             }), 400
         
-        # Stop any existing topology
-        mininet_manager.stop()
-        time.sleep(1)
-        
-        # Create new topology
-        logger.info(f"Creating {topology_type} topology with size {size}")
-        result = mininet_manager.create(topology_type, size)
+        # Generate now, so impossible sizes (odd fat-tree k, ...) fail here
+        if topology_type in GENERATORS:
+            try:
+                spec = GENERATORS[topology_type](size)
+            except ValueError as e:
+                return jsonify({"success": False, "error": str(e)}), 400
         
-        # Wait for switches to connect to Ryu
-        logger.info("Waiting for switches to connect to Ryu...")
-        time.sleep(config.SWITCH_CONNECTION_WAIT)
-        
-        # Verify switches are connected
-        switches = ryu_client.get_switches()
-        if not switches:
-            logger.warning("No switches connected to Ryu yet")
-        
-        # Start stats monitoring
-        start_stats_monitoring()
-        
-        # Get topology data and send to frontend
-        topology_data = get_topology_data()
-        socketio.emit('topology_update', topology_data)
-        
-        logger.info(f"Successfully created {topology_type} topology")
+        logger.info(f"Queueing creation of {topology_type} topology with size {size}")
+        job = job_runner.submit(
+            'create', lambda job: create_topology_job(job, topology_type, size, spec)
+        )
         
         return jsonify({
             "success": True,
-            "message": f"Created {topology_type} topology with {size} nodes",
-            "data": result
-        })
-        
+            "message": f"Creating {topology_type} topology with {size} nodes",
+            "job_id": job.id,
+            "status": job.status
+        }), 202
+    
     except Exception as e:
         logger.error(f"Error creating topology: {e}")
         return jsonify({
@@ -309,33 +555,112 @@ def create_topology():
         }), 500
 
 
+@app.route('/api/topology/types', methods=['GET'])
+def get_topology_types():
+    """Get the supported topology types and their size limits"""
+    types = [
+        {"type": t, "min_size": size_limits(t)[0], "max_size": size_limits(t)[1]}
+        for t in config.TOPOLOGY_TYPES
+    ]
+    return jsonify({
+        "success": True,
+        "types": types,
+        "custom": config.ENABLE_CUSTOM_TOPOLOGIES
+    })
+
+
 @app.route('/api/topology/stop', methods=['POST'])
 def stop_topology():
-    """Stop the current Mininet topology"""
+    """Stop the current Mininet topology (after any queued jobs)"""
     try:
-        stop_stats_monitoring()
-        result = mininet_manager.stop()
+        result = job_runner.run('stop', stop_topology_job, timeout=config.JOB_WAIT_TIMEOUT)
+        return jsonify(result)
+    
+    except TimeoutError as e:
+        logger.warning(f"Job runner busy: {e}")
+        return jsonify({"success": False, "error": str(e)}), 503
+    except Exception as e:
+        logger.error(f"Error stopping topology: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+@app.route('/api/topology/modify', methods=['POST'])
+def modify_topology():
+    """
+    Add or remove switches, hosts and links without rebuilding the network
+    
+    Request Body:
+        {
+            "ops": [
+                {"op": "add_switch", "name": "s9", "links": ["s8"]},
+                {"op": "add_host", "switch": "s9"},
+                {"op": "remove_link", "a": "s1", "b": "s2"}
+            ]
+        }
+    """
+    try:
+        data = request.get_json() or {}
+        ops = data.get('ops')
         
-        # Notify frontend
-        socketio.emit('topology_update', {"nodes": [], "edges": [], "topology_type": None})
+        if not isinstance(ops, list) or not ops or not all(isinstance(op, dict) for op in ops):
+            return jsonify({
+                "success": False,
+                "error": "'ops' must be a non-empty list of operations"
+            }), 400
         
-        logger.info("Topology stopped")
-        return jsonify(result)
+        if mininet_manager.net is None:
+            return jsonify({"success": False, "error": "No network is running"}), 400
+        
+        result = job_runner.run('modify', lambda job: modify_topology_job(job, ops),
+                                timeout=config.JOB_WAIT_TIMEOUT)
+        if not result.get('success'):
+            return jsonify(result), 400
         
+        return jsonify(result)
+    
+    except TimeoutError as e:
+        logger.warning(f"Job runner busy: {e}")
+        return jsonify({"success": False, "error": str(e)}), 503
     except Exception as e:
-        logger.error(f"Error stopping topology: {e}")
+        logger.error(f"Error modifying topology: {e}")
         return jsonify({
             "success": False,
             "error": str(e)
         }), 500
 
 
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Get the status, current phase and result of a job"""
+    job = job_runner.get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": f"Unknown job: {job_id}"}), 404
+    
+    return jsonify({"success": True, **job.to_dict()})
+
+
 @app.route('/api/topology/data', methods=['GET'])
 def get_topology():
-    """Get current topology structure"""
+    """
+    Get current topology structure
+    
+    Served from the topology cache with an ETag, so clients sending a
+    matching If-None-Match header get 304 Not Modified.
+    """
     try:
-        data = get_topology_data()
-        return jsonify(data)
+        data, etag = topology_cache.get()
+        
+        if etag and request.if_none_match.contains(etag):
+            response = app.response_class(status=304)
+        else:
+            response = jsonify(data)
+        
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
     except Exception as e:
         logger.error(f"Error getting topology data: {e}")
         return jsonify({
@@ -349,9 +674,13 @@ def get_topology():
 def run_pingall():
     """Run pingall connectivity test"""
     try:
-        result = mininet_manager.pingall()
+        result = job_runner.run('pingall', lambda job: mininet_manager.pingall(),
+                                timeout=config.JOB_WAIT_TIMEOUT)
         logger.info(f"Pingall result: {result}")
         return jsonify(result)
+    except TimeoutError as e:
+        logger.warning(f"Job runner busy: {e}")
+        return jsonify({"success": False, "error": str(e)}), 503
     except Exception as e:
         logger.error(f"Error running pingall: {e}")
         return jsonify({
@@ -382,9 +711,13 @@ def run_ping():
                 "error": "Both 'src' and 'dst' are required"
             }), 400
         
-        result = mininet_manager.ping(src, dst)
+        result = job_runner.run('ping', lambda job: mininet_manager.ping(src, dst),
+                                timeout=config.JOB_WAIT_TIMEOUT)
         return jsonify(result)
-        
+    
+    except TimeoutError as e:
+        logger.warning(f"Job runner busy: {e}")
+        return jsonify({"success": False, "error": str(e)}), 503
     except Exception as e:
         logger.error(f"Error running ping: {e}")
         return jsonify({
@@ -393,6 +726,183 @@ def run_ping():
         }), 500
 
 
+def ping_matrix_job(job, hosts, count, parallelism):
+    """
+    Job that pings all host pairs and streams finished rows
+    
+    Args:
+        job: The running job
+        hosts: Host names, or None for all hosts
+        count: Echo requests per pair
+        parallelism: Maximum pings in flight
+    
+    Returns:
+        The ping matrix
+    """
+    def emit_row(src, row):
+        socketio.emit('ping_matrix_row', {"job_id": job.id, "src": src, "row": row})
+    
+    job.progress('ping', "Pinging all host pairs...")
+    return mininet_manager.ping_matrix(hosts, count=count, parallelism=parallelism,
+                                       on_row=emit_row)
+
+
+@app.route('/api/topology/pingmatrix', methods=['POST'])
+def run_ping_matrix():
+    """
+    Ping every pair of hosts concurrently
+    
+    The matrix is computed by a background job; each source host's row is
+    pushed as a ping_matrix_row event when it completes, and the full
+    matrix is the job's result.
+    
+    Request Body (all optional):
+        {
+            "hosts": ["h1", "h2", ...],
+            "count": <echo requests per pair>,
+            "parallelism": <max concurrent pings>
+        }
+    
+    Returns:
+        202 with the job id, or an error status
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        hosts = data.get('hosts')
+        
+        if hosts is not None and (not isinstance(hosts, list) or len(hosts) < 2):
+            return jsonify({
+                "success": False,
+                "error": "'hosts' must be a list of at least two host names"
+            }), 400
+        
+        try:
+            count = int(data.get('count', config.PING_MATRIX_COUNT))
+            parallelism = int(data.get('parallelism', config.PING_MATRIX_PARALLELISM))
+        except (ValueError, TypeError):
+            return jsonify({"success": False, "error": "Count and parallelism must be numbers"}), 400
+        
+        if count < 1 or parallelism < 1:
+            return jsonify({"success": False, "error": "Count and parallelism must be positive"}), 400
+        
+        if mininet_manager.net is None:
+            return jsonify({"success": False, "error": "No network is running"}), 400
+        
+        job = job_runner.submit(
+            'ping_matrix', lambda job: ping_matrix_job(job, hosts, count, parallelism)
+        )
+        
+        return jsonify({
+            "success": True,
+            "job_id": job.id,
+            "status": job.status
+        }), 202
+    
+    except Exception as e:
+        logger.error(f"Error running ping matrix: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+def iperf_job(job, pairs, duration, mode):
+    """
+    Job that runs throughput tests and streams each result
+    
+    Args:
+        job: The running job
+        pairs: [src, dst] host pairs, or None for all pairs
+        duration: Seconds per test
+        mode: 'isolated' or 'contention'
+    
+    Returns:
+        The throughput run, also kept in throughput_runs
+    """
+    def emit_result(src, dst, result):
+        socketio.emit('iperf_result', dict(result, job_id=job.id))
+    
+    job.progress('iperf', "Running throughput tests...")
+    run = mininet_manager.iperf_matrix(pairs, duration=duration, mode=mode,
+                                       on_result=emit_result)
+    run.update(job_id=job.id, timestamp=time.time())
+    throughput_runs.append(run)
+    return run
+
+
+@app.route('/api/topology/iperf', methods=['POST'])
+def run_iperf():
+    """
+    Measure throughput between host pairs
+    
+    Tests run in a background job. In "isolated" mode tests whose paths
+    share a link never overlap; in "contention" mode all run at once. Each
+    result is pushed as an iperf_result event.
+    
+    Request Body (all optional):
+        {
+            "pairs": [["h1", "h2"], ...],
+            "duration": <seconds per test>,
+            "mode": "isolated|contention"
+        }
+    
+    Returns:
+        202 with the job id, or an error status
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        pairs = data.get('pairs')
+        mode = data.get('mode', 'isolated')
+        
+        if pairs is not None and (not isinstance(pairs, list) or
+                                  not all(isinstance(p, list) and len(p) == 2 for p in pairs)):
+            return jsonify({
+                "success": False,
+                "error": "'pairs' must be a list of [src, dst] host names"
+            }), 400
+        
+        if pairs == []:
+            return jsonify({"success": False, "error": "'pairs' must not be empty"}), 400
+        
+        if mode not in ('isolated', 'contention'):
+            return jsonify({"success": False, "error": "Mode must be 'isolated' or 'contention'"}), 400
+        
+        try:
+            duration = int(data.get('duration', config.IPERF_DURATION))
+        except (ValueError, TypeError):
+            return jsonify({"success": False, "error": "Duration must be a number"}), 400
+        
+        if duration < 1:
+            return jsonify({"success": False, "error": "Duration must be positive"}), 400
+        
+        if mininet_manager.net is None:
+            return jsonify({"success": False, "error": "No network is running"}), 400
+        
+        job = job_runner.submit('iperf', lambda job: iperf_job(job, pairs, duration, mode))
+        
+        return jsonify({
+            "success": True,
+            "job_id": job.id,
+            "status": job.status
+        }), 202
+    
+    except Exception as e:
+        logger.error(f"Error running throughput tests: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+@app.route('/api/topology/iperf', methods=['GET'])
+def get_iperf_runs():
+    """Get the most recent throughput runs, newest first"""
+    return jsonify({
+        "success": True,
+        "runs": list(reversed(throughput_runs))
+    })
+
+
 @app.route('/api/stats/flows/<dpid>', methods=['GET'])
 def get_flows(dpid):
     """Get flow table for a specific switch"""
@@ -429,6 +939,123 @@ def get_ports(dpid):
         }), 500
 
 
+@app.route('/api/stats/history', methods=['GET'])
+def get_stats_history():
+    """
+    Get recorded counter and rate history for a switch port
+    
+    Query Parameters:
+        dpid: Switch DPID (decimal or hex)
+        port: Port number
+        from: Range start timestamp (default: 10 minutes ago)
+        to: Range end timestamp (default: now)
+        step: Sample spacing in seconds (default: raw samples)
+        counters: Comma-separated subset of counters/rates
+    """
+    try:
+        dpid = request.args.get('dpid', '')
+        port = request.args.get('port', '')
+        
+        if not dpid or not port:
+            return jsonify({
+                "success": False,
+                "error": "Both 'dpid' and 'port' are required"
+            }), 400
+        
+        try:
+            dpid = normalize_dpid(dpid)
+            port_no = int(port) if port.isdigit() else port
+            end = float(request.args.get('to', time.time()))
+            start = float(request.args.get('from', end - 600))
+            step = float(request.args.get('step', 0))
+        except ValueError:
+            return jsonify({"success": False, "error": "Invalid query parameter"}), 400
+        
+        counters = request.args.get('counters')
+        columns = counters.split(',') if counters else None
+        
+        try:
+            history = stats_history.query(dpid, port_no, start, end, step, columns)
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+        
+        if history is None:
+            return jsonify({
+                "success": False,
+                "error": f"No history for switch {dpid} port {port}"
+            }), 404
+        
+        return jsonify({"success": True, **history})
+    
+    except Exception as e:
+        logger.error(f"Error getting stats history: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+@app.route('/api/stats/archive', methods=['GET'])
+def get_stats_archive():
+    """
+    Query archived port samples in a time range
+    
+    Query Parameters:
+        from: Range start timestamp (required)
+        to: Range end timestamp (default: now)
+        dpid: Only this switch (decimal or hex)
+        port: Only this port
+        counters: Comma-separated subset of counters/rates
+    """
+    if stats_archive is None:
+        return jsonify({
+            "success": False,
+            "error": "Stats archive is disabled (STATS_ARCHIVE_ENABLED)"
+        }), 404
+    
+    try:
+        try:
+            start = float(request.args['from'])
+            end = float(request.args.get('to', time.time()))
+            dpid = request.args.get('dpid')
+            if dpid is not None:
+                dpid = int(normalize_dpid(dpid))
+            port = request.args.get('port')
+            if port is not None:
+                port = int(port)
+        except KeyError:
+            return jsonify({"success": False, "error": "'from' is required"}), 400
+        except ValueError:
+            return jsonify({"success": False, "error": "Invalid query parameter"}), 400
+        
+        counters = request.args.get('counters')
+        columns = counters.split(',') if counters else None
+        
+        try:
+            records = stats_archive.query(start, end, dpid, port, columns)
+        except ValueError as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+        
+        return jsonify({"success": True, **records})
+    
+    except Exception as e:
+        logger.error(f"Error querying stats archive: {e}")
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+@app.route('/api/stats/scheduler', methods=['GET'])
+def get_scheduler_stats():
+    """Get run counts, durations and overruns of the polling tasks"""
+    return jsonify({
+        "success": True,
+        "running": scheduler.running,
+        "tasks": scheduler.stats()
+    })
+
+
 @app.route('/api/controller/info', methods=['GET'])
 def get_controller_info():
     """Get Ryu controller information"""
@@ -451,23 +1078,71 @@ def handle_connect():
     logger.info(f"Client connected")
     emit('connection_status', {'status': 'connected', 'message': 'Connected to SDN Visualizer'})
     
+    # Everyone starts subscribed to everything
+    subscription = Subscription()
+    subscriptions.set(request.sid, subscription)
+    join_room(subscription.room)
+    
     # Send current topology if available
     if mininet_manager.net is not None:
-        topology_data = get_topology_data()
+        start_stats_monitoring()
+        topology_data, _ = topology_cache.get()
         emit('topology_update', topology_data)
 
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """Handle client disconnection"""
+    subscriptions.remove(request.sid)
     logger.info("Client disconnected")
 
 
+@socketio.on('subscribe')
+def handle_subscribe(data):
+    """
+    Restrict what this client receives
+    
+    Data:
+        {
+            "dpids": ["0000000000000001", 2],  // optional, default all
+            "ports": [1, 2],                   // optional, default all
+            "events": ["stats", "topology"]    // optional, default all
+        }
+    """
+    if data is not None and not isinstance(data, dict):
+        emit('error', {'message': "Invalid subscription: expected an object"})
+        return
+    
+    try:
+        data = data or {}
+        subscription = Subscription(
+            dpids=data.get('dpids'),
+            ports=data.get('ports'),
+            events=data.get('events')
+        )
+    except (ValueError, TypeError) as e:
+        emit('error', {'message': f"Invalid subscription: {e}"})
+        return
+    
+    previous_room = subscriptions.set(request.sid, subscription)
+    if previous_room and previous_room != subscription.room:
+        leave_room(previous_room)
+    join_room(subscription.room)
+    
+    emit('subscribed', subscription.to_dict())
+
+
+@socketio.on('unsubscribe')
+def handle_unsubscribe():
+    """Go back to receiving everything"""
+    handle_subscribe({})
+
+
 @socketio.on('request_topology')
 def handle_topology_request():
     """Handle explicit topology data request"""
     try:
-        topology_data = get_topology_data()
+        topology_data, _ = topology_cache.get()
         emit('topology_update', topology_data)
     except Exception as e:
         logger.error(f"Error sending topology: {e}")
@@ -478,8 +1153,12 @@ def handle_topology_request():
 def handle_stats_request():
     """Handle explicit stats request"""
     try:
-        port_stats = ryu_client.get_port_stats()
-        emit('stats_update', {'port_stats': port_stats})
+        subscription = subscriptions.get(request.sid) or Subscription()
+        if subscription.dpids is not None:
+            port_stats = ryu_client.get_port_stats(dpids=subscription.dpids)
+        else:
+            port_stats = ryu_client.get_port_stats()
+        emit('stats_update', subscription.slice_stats({'port_stats': port_stats}))
     except Exception as e:
         logger.error(f"Error sending stats: {e}")
         emit('error', {'message': str(e)})
@@ -518,6 +1197,13 @@ if __name__ == '__main__':
     logger.info(f"Flask Server: http://{config.FLASK_HOST}:{config.FLASK_PORT}")
     logger.info("=" * 70)
     
+    # Run the periodic polling tiers (topology refresh, stats)
+    scheduler.start()
+    
+    # Build the configured warm networks in the background
+    if config.WARM_POOL_ENABLED and config.WARM_POOL_PRESETS:
+        job_runner.submit('prewarm', lambda job: mininet_manager.prewarm(config.WARM_POOL_PRESETS))
+    
     # Run Flask with SocketIO
     socketio.run(
         app,
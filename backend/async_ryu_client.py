@@ -0,0 +1,326 @@
+"""
+Asyncio Ryu REST API Client
+Asyncio counterpart of RyuClient built on a shared aiohttp connection pool
+"""
+
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Any, Optional
+import aiohttp
+import config
+from subscriptions import normalize_dpid
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRyuClient:
+    """
+    Asyncio client for Ryu Controller REST API
+    
+    Mirrors the RyuClient API with coroutine methods that return the same
+    values, so many switches and flow tables can be polled concurrently
+    from a single event loop.
+    """
+    
+    def __init__(self, base_url: str = None):
+        """
+        Initialize async Ryu client
+        
+        The aiohttp session is created lazily on first use so that it is
+        bound to the event loop that actually runs the requests.
+        
+        Args:
+            base_url: Base URL for Ryu REST API (default from config)
+        """
+        self.base_url = base_url or config.RYU_BASE_URL
+        self.timeout = aiohttp.ClientTimeout(total=config.CONNECTION_TIMEOUT)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get (or create) the shared pooled session
+        
+        Returns:
+            aiohttp session with a bounded keep-alive connector
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=config.ASYNC_RYU_POOL_SIZE,
+                keepalive_timeout=30
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout
+            )
+            self._semaphore = asyncio.Semaphore(config.ASYNC_RYU_POOL_SIZE)
+        return self.session
+    
+    async def close(self):
+        """Close all pooled connections to Ryu"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+    
+    async def _request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Any:
+        """
+        Make a request to Ryu API with retry/backoff
+        
+        POSTs are not idempotent (a retried flow add could be applied
+        twice), so they are only retried when the connection could not be
+        opened and the request was never sent.
+        
+        Args:
+            method: HTTP method ('GET' or 'POST')
+            endpoint: API endpoint path
+            data: Optional JSON data to send
+        
+        Returns:
+            JSON response data
+        
+        Raises:
+            aiohttp.ClientError: If request fails after all retries
+        """
+        url = f"{self.base_url}{endpoint}"
+        session = self._get_session()
+        
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    async with session.request(method, url, json=data) as response:
+                        response.raise_for_status()
+                        # Ryu answers with text/plain on some endpoints
+                        return await response.json(content_type=None)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if method == 'GET':
+                    retryable = not isinstance(e, aiohttp.ClientResponseError) or e.status >= 502
+                else:
+                    retryable = isinstance(e, aiohttp.ClientConnectorError)
+                if not retryable or attempt >= config.RYU_MAX_RETRIES:
+                    logger.error(f"Ryu API {method} failed: {url} - {e}")
+                    raise
+                await asyncio.sleep(config.RYU_RETRY_BACKOFF * (2 ** attempt))
+                attempt += 1
+    
+    async def _get(self, endpoint: str) -> Any:
+        """
+        Make GET request to Ryu API
+        
+        Args:
+            endpoint: API endpoint path
+        
+        Returns:
+            JSON response data
+        """
+        return await self._request('GET', endpoint)
+    
+    async def _post(self, endpoint: str, data: Dict) -> Any:
+        """
+        Make POST request to Ryu API
+        
+        Args:
+            endpoint: API endpoint path
+            data: JSON data to send
+        
+        Returns:
+            JSON response data
+        """
+        return await self._request('POST', endpoint, data)
+    
+    async def get_switches(self) -> List[Dict]:
+        """
+        Get all connected switches
+        
+        Returns:
+            List of switch dictionaries with dpid
+        """
+        try:
+            data = await self._get("/v1.0/topology/switches")
+            for switch in data:
+                switch['dpid_int'] = int(switch['dpid'], 16)
+            return data
+        except Exception as e:
+            logger.error(f"Failed to get switches: {e}")
+            return []
+    
+    async def get_links(self) -> List[Dict]:
+        """
+        Get all links between switches
+        
+        Returns:
+            List of link dictionaries
+        """
+        try:
+            return await self._get("/v1.0/topology/links")
+        except Exception as e:
+            logger.error(f"Failed to get links: {e}")
+            return []
+    
+    async def get_hosts(self) -> List[Dict]:
+        """
+        Get all discovered hosts
+        
+        Returns:
+            List of host dictionaries
+        """
+        try:
+            return await self._get("/v1.0/topology/hosts")
+        except Exception as e:
+            logger.error(f"Failed to get hosts: {e}")
+            return []
+    
+    async def get_flow_stats(self, dpid: str) -> List[Dict]:
+        """
+        Get flow table entries for a switch
+        
+        Args:
+            dpid: Switch DPID (as hex string or int)
+        
+        Returns:
+            List of flow entries
+        """
+        try:
+            dpid = int(normalize_dpid(dpid))
+            
+            data = await self._get(f"/stats/flow/{dpid}")
+            return data.get(str(dpid), [])
+        except Exception as e:
+            logger.error(f"Failed to get flow stats for {dpid}: {e}")
+            return []
+    
+    async def get_port_stats(self, dpid: Optional[str] = None,
+                             dpids: Optional[Iterable] = None) -> Dict[str, List[Dict]]:
+        """
+        Get port statistics for switch(es)
+        
+        Args:
+            dpid: Specific switch DPID, or None for all switches
+            dpids: Optional subset of switch DPIDs to fan out to when
+                dpid is None (default: every connected switch)
+        
+        Returns:
+            Dictionary mapping DPID to list of port stats
+        """
+        try:
+            if dpid:
+                dpid = int(normalize_dpid(dpid))
+                return await self._get(f"/stats/port/{dpid}")
+            
+            if dpids is None:
+                switches = await self.get_switches()
+                dpids = [switch['dpid_int'] for switch in switches]
+            
+            return await self.get_port_stats_fanout(dpids)
+        except Exception as e:
+            logger.error(f"Failed to get port stats: {e}")
+            return {}
+    
+    async def get_port_stats_fanout(self, dpids: Iterable) -> Dict[str, List[Dict]]:
+        """
+        Fetch port statistics for many switches concurrently
+        
+        Args:
+            dpids: Switch DPIDs (hex strings or ints)
+        
+        Returns:
+            Dictionary mapping DPID to list of port stats, merged across
+            all switches that answered
+        """
+        dpid_ints = []
+        for dpid in dpids:
+            dpid_ints.append(int(normalize_dpid(dpid)))
+        
+        results = await asyncio.gather(
+            *(self._get(f"/stats/port/{dpid}") for dpid in dpid_ints),
+            return_exceptions=True
+        )
+        
+        merged = {}
+        for dpid, result in zip(dpid_ints, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to get port stats for {dpid}: {result}")
+                continue
+            merged.update(result)
+        
+        return merged
+    
+    async def get_aggregate_flow_stats(self, dpid: str) -> Dict:
+        """
+        Get aggregate flow statistics for a switch
+        
+        Args:
+            dpid: Switch DPID
+        
+        Returns:
+            Aggregate statistics (packet count, byte count, flow count)
+        """
+        try:
+            dpid = int(normalize_dpid(dpid))
+            
+            data = await self._get(f"/stats/aggregateflow/{dpid}")
+            return data.get(str(dpid), [{}])[0]
+        except Exception as e:
+            logger.error(f"Failed to get aggregate stats for {dpid}: {e}")
+            return {}
+    
+    async def add_flow(self, dpid: str, flow: Dict) -> bool:
+        """
+        Add a flow entry to a switch
+        
+        Args:
+            dpid: Switch DPID
+            flow: Flow entry dictionary
+        
+        Returns:
+            True if successful
+        """
+        try:
+            dpid = int(normalize_dpid(dpid))
+            
+            await self._post("/stats/flowentry/add", {"dpid": dpid, **flow})
+            logger.info(f"Added flow to switch {dpid}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to add flow to {dpid}: {e}")
+            return False
+    
+    async def delete_flow(self, dpid: str, flow: Dict) -> bool:
+        """
+        Delete a flow entry from a switch
+        
+        Args:
+            dpid: Switch DPID
+            flow: Flow match criteria
+        
+        Returns:
+            True if successful
+        """
+        try:
+            dpid = int(normalize_dpid(dpid))
+            
+            await self._post("/stats/flowentry/delete", {"dpid": dpid, **flow})
+            logger.info(f"Deleted flow from switch {dpid}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to delete flow from {dpid}: {e}")
+            return False
+    
+    async def is_connected(self) -> bool:
+        """
+        Check if Ryu controller is reachable
+        
+        Returns:
+            True if Ryu is responding
+        """
+        try:
+            await self._get("/v1.0/topology/switches")
+            return True
+        except Exception:
+            return False
@@ -24,18 +24,92 @@ SOCKETIO_ASYNC_MODE = 'threading'
 DEFAULT_TOPOLOGY = 'star'
 DEFAULT_SIZE = 4
 MIN_SIZE = 2
-MAX_SIZE = 20
+MAX_SIZE = 500  # upper bound for types without their own limits
 
 # Supported topology types
-TOPOLOGY_TYPES = ['star', 'linear', 'tree', 'mesh']
+TOPOLOGY_TYPES = ['star', 'linear', 'tree', 'mesh', 'fat_tree', 'leaf_spine', 'torus', 'random_regular']
+
+# Size limits per topology type: (min, max) of the "size" parameter
+TOPOLOGY_SIZE_LIMITS = {
+    'star': (2, 200),  # hosts on the central switch
+    'linear': (2, 200),  # switches
+    'tree': (2, 8),  # depth (8 = 255 switches)
+    'mesh': (2, 12),  # switches (12 = 66 inter-switch links)
+    'fat_tree': (2, 16),  # k, even (16 = 320 switches, 1024 hosts)
+    'leaf_spine': (2, 128),  # leaf switches
+    'torus': (3, 20),  # switches per side (20 = 400 switches)
+    'random_regular': (4, 500),  # switches
+}
+LEAF_SPINE_HOSTS_PER_LEAF = 2  # hosts attached to each leaf switch
+RANDOM_REGULAR_DEGREE = 3  # inter-switch links per switch
+CUSTOM_TOPOLOGY_MAX_SWITCHES = 500  # switches allowed in a custom spec
+CUSTOM_TOPOLOGY_MAX_HOSTS = 1000  # hosts allowed in a custom spec
+HOST_NETWORK = '10.0.0.0/16'  # host addresses are allocated from here in order
 
 # Monitoring Settings
-STATS_UPDATE_INTERVAL = 2  # seconds
+STATS_UPDATE_INTERVAL = 2  # seconds between port counter polls
+FLOW_STATS_INTERVAL = 10  # seconds between aggregate flow table polls
 CONNECTION_TIMEOUT = 5  # seconds for API calls
+STATS_SPREAD_FRACTION = 0.5  # share of the interval per-switch requests are spread over
+STATS_SPREAD_JITTER = 0.2  # fraction of a slot each switch's offset is shifted by
+SCHEDULER_WORKERS = 4  # periodic tasks that may run at the same time
+# Idle heartbeat: while no client wants stats, switches are polled only this
+# often. Keep it below RATE_STALE_AFTER so the history still gets valid rates
+# (at roughly the 10s rollup resolution instead of every tick); the archive,
+# when enabled, is always polled at the full interval.
+STATS_IDLE_HEARTBEAT = 8  # seconds between polls while no client wants stats (0 = never)
+RATE_STALE_AFTER = 10  # seconds before a port sample is too old to compute rates from
+
+# Stats History (in-memory, per switch port)
+STATS_HISTORY_MAX_PORTS = 256  # ports tracked; least recently updated is evicted
+STATS_HISTORY_RAW_SAMPLES = 300  # raw samples per port (10 min at 2s)
+STATS_HISTORY_TIERS = [  # rollup tiers: (name, resolution seconds, samples)
+    ('10s', 10, 360),  # 1 hour
+    ('1m', 60, 1440),  # 24 hours
+]
+
+# Stats Archive (on-disk, memory-mapped)
+STATS_ARCHIVE_ENABLED = False  # append every polled sample to the archive
+STATS_ARCHIVE_DIR = 'stats_archive'  # relative to the backend working directory
+STATS_ARCHIVE_SEGMENT_RECORDS = 1000000  # records per segment (~68 MB)
+STATS_ARCHIVE_MAX_SEGMENTS = 32  # oldest segments are deleted beyond this
+STATS_ARCHIVE_MAX_QUERY_RECORDS = 100000  # records returned per query
+
+# Ryu HTTP Connection Pool
+RYU_POOL_SIZE = 10  # keep-alive connections kept open to the Ryu REST API
+RYU_MAX_RETRIES = 2  # retries for failed connections / 5xx responses
+RYU_RETRY_BACKOFF = 0.2  # backoff factor between retries (seconds)
+STATS_FANOUT_WORKERS = 8  # concurrent per-switch stats requests
+ASYNC_RYU_POOL_SIZE = 100  # max concurrent connections for AsyncRyuClient
+TOPOLOGY_FETCH_TIMEOUT = 3  # seconds allowed for each parallel topology read
+TOPOLOGY_REFRESH_INTERVAL = 5  # seconds between background topology refreshes
+TOPOLOGY_CACHE_MAX_AGE = 10  # seconds before a cached topology is rebuilt on read
+TOPOLOGY_RETRY_BACKOFF = 1  # seconds reads serve the cache after a failed rebuild (doubles, capped at max age)
 
 # Mininet Settings
 MININET_CLEANUP_TIMEOUT = 5  # seconds to wait for cleanup
-SWITCH_CONNECTION_WAIT = 3  # seconds to wait for switches to connect to Ryu
+SWITCH_READY_TIMEOUT = 15  # max seconds to wait for all switches to connect to Ryu
+SWITCH_READY_POLL_INTERVAL = 0.05  # seconds between readiness checks
+JOB_HISTORY = 50  # finished jobs kept for GET /api/jobs/<id>
+JOB_WAIT_TIMEOUT = 120  # seconds stop/ping requests wait for their queued job
+
+# Ping Matrix Settings
+PING_MATRIX_COUNT = 3  # echo requests per host pair
+PING_MATRIX_PARALLELISM = 16  # max concurrent pings
+PING_MATRIX_TIMEOUT = 1  # seconds to wait for each reply
+
+# Throughput Test Settings
+IPERF_DURATION = 5  # seconds per iperf test
+IPERF_BASE_PORT = 5201  # first iperf server port (numbered per destination host)
+IPERF_MAX_PARALLEL = 32  # iperf tests running at once (also caps contention mode)
+IPERF_CONNECT_RETRIES = 20  # client attempts while the server starts
+IPERF_HISTORY = 20  # finished throughput runs kept for GET /api/topology/iperf
+
+# Warm Pool Settings
+WARM_POOL_ENABLED = False  # keep stopped networks running, detached, for instant re-creation
+WARM_POOL_SIZE = 3  # max idle networks kept warm
+WARM_POOL_MAX_NODES = 150  # max switches + hosts across all warm networks
+WARM_POOL_PRESETS = []  # (type, size) pairs built at startup, e.g. [('tree', 3)]
 
 # OpenFlow Settings
 OPENFLOW_VERSION = 'OpenFlow13'  # OpenFlow 1.3
@@ -54,4 +128,4 @@ SECRET_KEY = 'dev-secret-key-change-in-production'  # Flask secret key
 ENABLE_FLOW_STATS = True
 ENABLE_PORT_STATS = True
 ENABLE_PACKET_CAPTURE = False  # Future feature
-ENABLE_CUSTOM_TOPOLOGIES = False  # Future feature
+ENABLE_CUSTOM_TOPOLOGIES = False  # allow 'custom' topologies from a JSON spec
@@ -0,0 +1,240 @@
+"""
+Background Jobs
+Single-worker job runner that serializes all Mininet operations
+"""
+
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+import config
+
+logger = logging.getLogger(__name__)
+
+# Job states
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+
+
+class Job:
+    """A unit of work run by the JobRunner"""
+    
+    def __init__(self, kind: str, func: Callable[['Job'], Any]):
+        """
+        Initialize job
+        
+        Args:
+            kind: Job kind (e.g. 'create', 'stop')
+            func: Function run with the job as its only argument
+        """
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.func = func
+        self.status = QUEUED
+        self.phase: Optional[str] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        
+        self._done = threading.Event()
+        self._state_lock = threading.Lock()
+        self._listeners: List[Callable[['Job', Dict], None]] = []
+    
+    @property
+    def done(self) -> bool:
+        """Whether the job has finished (successfully or not)"""
+        return self._done.is_set()
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the job finishes
+        
+        Returns:
+            True if the job finished within the timeout
+        """
+        return self._done.wait(timeout)
+    
+    def cancel(self, reason: str = "Cancelled before it started") -> bool:
+        """
+        Cancel the job if it has not started yet
+        
+        A cancelled job is finished as failed with the reason as its error
+        and is skipped by the worker.
+        
+        Returns:
+            True if the job was cancelled, False if it already started
+        """
+        with self._state_lock:
+            if self.status != QUEUED:
+                return False
+            self.status = FAILED
+            self.error = reason
+            self.finished_at = time.time()
+        
+        self._notify()
+        self._done.set()
+        return True
+    
+    def progress(self, phase: str, message: str = None, **info):
+        """
+        Report that the job entered a new phase
+        
+        Args:
+            phase: Phase name
+            message: Human readable description
+            **info: Extra fields passed on to listeners
+        """
+        self.phase = phase
+        logger.debug(f"Job {self.id} ({self.kind}): {message or phase}")
+        self._notify(dict(info, message=message))
+    
+    def _notify(self, extra: Dict = None):
+        """Call the progress listeners"""
+        event = dict(self.to_dict(), **(extra or {}))
+        for listener in self._listeners:
+            try:
+                listener(self, event)
+            except Exception as e:
+                logger.error(f"Job listener failed: {e}")
+    
+    def to_dict(self) -> Dict:
+        """Serializable job status"""
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "phase": self.phase,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+
+class JobRunner:
+    """
+    Runs jobs one at a time on a single worker thread
+    
+    Every operation that touches the Mininet network goes through the
+    runner, so a create can never interleave with a stop or a ping and
+    request threads never block on network setup.
+    """
+    
+    def __init__(self, history: int = None):
+        """
+        Initialize job runner
+        
+        Args:
+            history: Finished jobs kept for status lookups
+        """
+        self.history = history or config.JOB_HISTORY
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._queue: 'queue.Queue[Job]' = queue.Queue()
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Job, Dict], None]] = []
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+    
+    def add_listener(self, listener: Callable[[Job, Dict], None]):
+        """
+        Register a callback for job progress
+        
+        Args:
+            listener: Called as listener(job, event) on every phase change
+                and when a job starts and finishes
+        """
+        self._listeners.append(listener)
+    
+    def submit(self, kind: str, func: Callable[[Job], Any]) -> Job:
+        """
+        Queue a job
+        
+        Args:
+            kind: Job kind
+            func: Function run with the job as its only argument
+        
+        Returns:
+            The queued job
+        """
+        job = Job(kind, func)
+        job._listeners = self._listeners
+        
+        with self._lock:
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.history:
+                oldest = next(iter(self._jobs.values()))
+                if not oldest.done:
+                    break
+                self._jobs.popitem(last=False)
+        
+        self._queue.put(job)
+        return job
+    
+    def run(self, kind: str, func: Callable[[Job], Any],
+            timeout: Optional[float] = None) -> Any:
+        """
+        Queue a job and wait for its result
+        
+        Args:
+            kind: Job kind
+            func: Function run with the job as its only argument
+            timeout: Seconds to wait (default: no limit)
+        
+        Returns:
+            The job function's return value
+        
+        Raises:
+            TimeoutError: If the job did not finish in time (a job still
+                waiting in the queue is cancelled, so it never runs late)
+            RuntimeError: If the job failed
+        """
+        if threading.current_thread() is self._thread:
+            # Already on the worker: queueing would deadlock
+            return func(Job(kind, func))
+        
+        job = self.submit(kind, func)
+        if not job.wait(timeout):
+            if job.cancel(f"Cancelled: waited {timeout}s behind other jobs"):
+                raise TimeoutError(f"Job {job.id} ({kind}) cancelled: other jobs "
+                                   f"kept the runner busy for {timeout}s")
+            raise TimeoutError(f"Job {job.id} ({kind}) did not finish in {timeout}s")
+        if job.status == FAILED:
+            raise RuntimeError(job.error)
+        return job.result
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by id"""
+        with self._lock:
+            return self._jobs.get(job_id)
+    
+    def _worker(self):
+        """Worker thread: run queued jobs in order"""
+        while True:
+            job = self._queue.get()
+            with job._state_lock:
+                if job.status != QUEUED:
+                    # Cancelled while waiting
+                    continue
+                job.status = RUNNING
+            job.started_at = time.time()
+            job._notify()
+            
+            try:
+                job.result = job.func(job)
+                job.status = SUCCEEDED
+            except Exception as e:
+                logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+                job.error = str(e)
+                job.status = FAILED
+            finally:
+                job.finished_at = time.time()
+                job._notify()
+                job._done.set()
@@ -0,0 +1,232 @@
+"""
+Host Measurements
+Concurrent ping matrix, link-aware throughput test scheduling and parsing
+of measurement tool output
+"""
+
+import logging
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, FrozenSet, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+PACKETS_RE = re.compile(r'(\d+) packets transmitted, (\d+) (?:packets )?received')
+RTT_RE = re.compile(r'(?:rtt|round-trip) min/avg/max/(?:mdev|stddev) = '
+                    r'([\d.]+)/([\d.]+)/([\d.]+)/([\d.]+) ms')
+
+
+def parse_ping(output: str) -> Dict:
+    """
+    Parse the summary of a ping run
+    
+    Args:
+        output: Standard output of ping -c N
+    
+    Returns:
+        Dictionary with "sent", "received", "loss" (percent) and "rtt"
+        ({"min", "avg", "max"} in ms, None if nothing came back)
+    """
+    packets = PACKETS_RE.search(output)
+    if packets is None:
+        # ping failed before sending (e.g. network unreachable)
+        return {"sent": 0, "received": 0, "loss": 100.0, "rtt": None}
+    
+    sent, received = int(packets.group(1)), int(packets.group(2))
+    loss = 100.0 * (sent - received) / sent if sent else 100.0
+    
+    rtt = None
+    match = RTT_RE.search(output)
+    if match and received:
+        rtt_min, rtt_avg, rtt_max, _ = (float(v) for v in match.groups())
+        rtt = {"min": rtt_min, "avg": rtt_avg, "max": rtt_max}
+    
+    return {"sent": sent, "received": received, "loss": round(loss, 1), "rtt": rtt}
+
+
+def ping_matrix(hosts: Sequence[str],
+                ping: Callable[[str, str], str],
+                parallelism: int,
+                on_row: Optional[Callable[[str, Dict], None]] = None) -> Dict:
+    """
+    Ping every ordered pair of hosts, several pairs at a time
+    
+    Pairs are submitted row by row, so rows tend to finish in order and can
+    be streamed while the rest of the matrix is still running.
+    
+    Args:
+        hosts: Host names, in matrix order
+        ping: Function pinging dst from src and returning ping's output;
+            it is called from several threads at once
+        parallelism: Maximum pings in flight
+        on_row: Called as on_row(src, row) once all pings from src are
+            done, where row maps each destination to its parse_ping result
+    
+    Returns:
+        Dictionary with "hosts", "loss" (N×N percent, None on the diagonal),
+        "rtt" (N×N {"min", "avg", "max"} or None) and overall "packet_loss"
+    """
+    index = {name: i for i, name in enumerate(hosts)}
+    results: List[List[Optional[Dict]]] = [[None] * len(hosts) for _ in hosts]
+    remaining = {src: len(hosts) - 1 for src in hosts}
+    lock = threading.Lock()
+    
+    def run(src: str, dst: str):
+        try:
+            result = parse_ping(ping(src, dst))
+        except Exception as e:
+            logger.error(f"Ping {src} -> {dst} failed: {e}")
+            result = {"sent": 0, "received": 0, "loss": 100.0, "rtt": None,
+                      "error": str(e)}
+        
+        with lock:
+            results[index[src]][index[dst]] = result
+            remaining[src] -= 1
+            done = remaining[src] == 0
+        if done and on_row is not None:
+            row = results[index[src]]
+            on_row(src, {dst: row[index[dst]] for dst in hosts if dst != src})
+    
+    pairs = [(src, dst) for src in hosts for dst in hosts if src != dst]
+    with ThreadPoolExecutor(max_workers=max(1, parallelism)) as executor:
+        for future in [executor.submit(run, src, dst) for src, dst in pairs]:
+            future.result()
+    
+    sent = sum(r["sent"] for row in results for r in row if r)
+    received = sum(r["received"] for row in results for r in row if r)
+    
+    return {
+        "hosts": list(hosts),
+        "loss": [[r["loss"] if r else None for r in row] for row in results],
+        "rtt": [[r["rtt"] if r else None for r in row] for row in results],
+        "packet_loss": round(100.0 * (sent - received) / sent, 1) if sent else 0.0
+    }
+
+
+def parse_iperf(output: str) -> Dict:
+    """
+    Parse the client report of an iperf (v2) run with -y C
+    
+    Args:
+        output: Client standard output in CSV mode
+    
+    Returns:
+        Dictionary with "bytes" transferred and "bps" (bits per second)
+    
+    Raises:
+        ValueError: If the output holds no report line
+    """
+    lines = [line for line in output.strip().splitlines() if line.count(',') >= 8]
+    if not lines:
+        raise ValueError(f"No iperf report in output: {output.strip()[:200]}")
+    
+    fields = lines[-1].split(',')
+    return {"bytes": int(fields[7]), "bps": int(fields[8])}
+
+
+def shortest_path(adjacency: Dict[Hashable, Iterable[Hashable]],
+                  src: Hashable, dst: Hashable) -> List[Hashable]:
+    """
+    Breadth-first shortest path between two nodes
+    
+    Args:
+        adjacency: Neighbors of every node
+        src: Start node
+        dst: End node
+    
+    Returns:
+        Nodes along the path including both ends (empty if unreachable)
+    """
+    previous = {src: None}
+    queue = deque([src])
+    while queue:
+        node = queue.popleft()
+        if node == dst:
+            path = []
+            while node is not None:
+                path.append(node)
+                node = previous[node]
+            return path[::-1]
+        for neighbor in adjacency.get(node, ()):
+            if neighbor not in previous:
+                previous[neighbor] = node
+                queue.append(neighbor)
+    return []
+
+
+def path_links(path: Sequence[Hashable]) -> FrozenSet[FrozenSet]:
+    """Undirected links (node pairs) traversed by a path"""
+    return frozenset(frozenset(hop) for hop in zip(path, path[1:]))
+
+
+def schedule_rounds(pairs: Sequence[Tuple[str, str]],
+                    links: Dict[Tuple[str, str], FrozenSet]) -> List[List[Tuple[str, str]]]:
+    """
+    Group tests into rounds whose paths share no link
+    
+    Greedy first fit: each pair goes into the first round none of whose
+    tests uses one of its links, keeping the number of rounds small while
+    no test competes with another for bandwidth.
+    
+    Args:
+        pairs: (src, dst) tests in request order
+        links: Links used by each pair's path
+    
+    Returns:
+        Rounds of pairs, to be run one round after the other
+    """
+    rounds: List[List[Tuple[str, str]]] = []
+    used: List[set] = []
+    
+    for pair in pairs:
+        for i, taken in enumerate(used):
+            if not taken & links[pair]:
+                rounds[i].append(pair)
+                taken |= links[pair]
+                break
+        else:
+            rounds.append([pair])
+            used.append(set(links[pair]))
+    
+    return rounds
+
+
+def run_rounds(rounds: Sequence[Sequence[Tuple[str, str]]],
+               measure: Callable[[str, str], Dict],
+               on_result: Optional[Callable[[str, str, Dict], None]] = None,
+               parallelism: int = None) -> List[Dict]:
+    """
+    Run each round's tests together and the rounds one after another
+    
+    Args:
+        rounds: Rounds from schedule_rounds (or one round for contention)
+        measure: Function measuring src -> dst, called concurrently
+        on_result: Called as on_result(src, dst, result) per finished test
+        parallelism: Tests running at once at most (default: a whole round)
+    
+    Returns:
+        One result per pair with "src", "dst" and "round" added
+    """
+    results = []
+    for number, pairs in enumerate(rounds):
+        def run(pair):
+            src, dst = pair
+            try:
+                result = dict(measure(src, dst), success=True)
+            except Exception as e:
+                logger.error(f"Throughput test {src} -> {dst} failed: {e}")
+                result = {"success": False, "error": str(e)}
+            result.update(src=src, dst=dst, round=number)
+            if on_result is not None:
+                on_result(src, dst, result)
+            return result
+        
+        if not pairs:
+            continue
+        workers = min(len(pairs), parallelism or len(pairs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results.extend(executor.map(run, pairs))
+    
+    return results
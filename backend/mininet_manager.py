@@ -6,16 +6,49 @@ Handles creation, management, and cleanup of Mininet topologies
 import os
 import time
 import logging
-from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
 from mininet.net import Mininet
 from mininet.node import RemoteController, OVSSwitch
 from mininet.link import TCLink
 from mininet.cli import CLI
 from mininet.log import setLogLevel
+from mininet.util import decode
 import config
+import measurements
+import ovs
+from topology_generators import AddressAllocator, GENERATORS, TopologySpec, size_limits
+
+# Let Mininet create all bridges and controller targets in one ovs-vsctl batch
+BatchOVSSwitch = partial(OVSSwitch, batch=True)
 
 logger = logging.getLogger(__name__)
 
+CONTROLLER_TARGET = f"tcp:127.0.0.1:{config.OPENFLOW_PORT}"
+
+
+class WarmNetwork:
+    """A started network kept detached from the controller for reuse"""
+    
+    def __init__(self, net: Mininet, prefix: str, result: Dict):
+        """
+        Initialize pool entry
+        
+        Args:
+            net: The started Mininet network
+            prefix: Switch name prefix of the network
+            result: Creation result returned when it is activated
+        """
+        self.net = net
+        self.prefix = prefix
+        self.result = result
+    
+    @property
+    def nodes(self) -> int:
+        """Switches and hosts held by the network"""
+        return len(self.net.switches) + len(self.net.hosts)
+
 
 class MininetManager:
     """Manager for Mininet network topologies"""
@@ -25,9 +58,40 @@ class MininetManager:
         self.net: Optional[Mininet] = None
         self.topology_type: Optional[str] = None
         self.topology_size: int = 0
+        self._progress: Optional[Callable[..., None]] = None
         
+        # Warm pool: idle networks keyed by (type, size), least recently used first
+        self.pool: 'OrderedDict[Tuple[str, int], WarmNetwork]' = OrderedDict()
+        self._prefix = 's'  # Switch name prefix of the active network
+        self._result: Optional[Dict] = None  # Creation result of the active network
+        self._modified = False  # Active network changed by modify() (not poolable)
+        self._serial = 0
+        self.addresses = AddressAllocator()
+    
+    def _report(self, phase: str, message: str):
+        """Log a creation phase and pass it to the progress callback"""
+        logger.info(message)
+        if self._progress is not None:
+            self._progress(phase, message)
+    
     def _cleanup_existing(self):
         """Clean up any existing Mininet network"""
+        if (self.net is not None and config.WARM_POOL_ENABLED and
+                self.topology_type != 'custom' and not self._modified):
+            self._park_active()
+        self._discard_active()
+        
+        # Nuclear cleanup (skipped while warm networks are alive)
+        if self.pool:
+            return
+        try:
+            self._report('cleanup', "Running Mininet cleanup...")
+            os.system('sudo mn -c > /dev/null 2>&1')
+        except Exception as e:
+            logger.error(f"Cleanup error: {e}")
+    
+    def _discard_active(self):
+        """Stop the active network for good"""
         if self.net is not None:
             try:
                 logger.info("Stopping existing network...")
@@ -36,53 +100,182 @@ class MininetManager:
                 logger.error(f"Error stopping network: {e}")
             finally:
                 self.net = None
+    
+    def _park_active(self):
+        """
+        Move the active network into the warm pool
+        
+        Its bridges are detached from the controller in one transaction, so
+        Ryu forgets them, while hosts, links and OVS state stay up.
+        """
+        key = (self.topology_type, self.topology_size)
+        self._report('cleanup', f"Parking {key[0]} topology with size {key[1]} in the warm pool")
         
-        # Nuclear cleanup
         try:
-            logger.info("Running Mininet cleanup...")
-            os.system('sudo mn -c > /dev/null 2>&1')
-            time.sleep(1)
+            ovs.run_vsctl(*[['del-controller', s.name] for s in self.net.switches])
         except Exception as e:
-            logger.error(f"Cleanup error: {e}")
+            logger.error(f"Failed to detach network, stopping it instead: {e}")
+            return
+        
+        previous = self.pool.pop(key, None)
+        if previous is not None:
+            previous.net.stop()
+        
+        self.pool[key] = WarmNetwork(self.net, self._prefix, self._result)
+        self.net = None
+        self._evict()
     
-    def create(self, topology_type: str, size: int) -> Dict:
+    def _evict(self):
+        """Stop least recently used warm networks beyond the pool budget"""
+        while self.pool and (len(self.pool) > config.WARM_POOL_SIZE or
+                             sum(w.nodes for w in self.pool.values()) > config.WARM_POOL_MAX_NODES):
+            key, warm = self.pool.popitem(last=False)
+            logger.info(f"Evicting warm {key[0]} topology with size {key[1]}")
+            try:
+                warm.net.stop()
+            except Exception as e:
+                logger.error(f"Error stopping warm network: {e}")
+    
+    def _activate(self, key: Tuple[str, int]) -> Dict:
         """
-        Create a new Mininet topology
+        Make a warm network the active one
+        
+        Re-attaches its bridges to the controller in one transaction and
+        waits for them to connect, skipping build and start entirely.
         
         Args:
-            topology_type: Type of topology ('star', 'linear', 'tree', 'mesh')
-            size: Number of hosts/switches
-            
+            key: (type, size) of the pooled network
+        
         Returns:
-            Dictionary with creation status and info
+            The network's creation result, marked as warm
         """
-        # Validate inputs
-        if topology_type not in config.TOPOLOGY_TYPES:
-            raise ValueError(f"Invalid topology type: {topology_type}")
+        warm = self.pool.pop(key)
+        self.net = warm.net
+        self._prefix = warm.prefix
+        self._result = warm.result
+        self.topology_type, self.topology_size = key
+        self._modified = False
         
-        if size < config.MIN_SIZE or size > config.MAX_SIZE:
-            raise ValueError(f"Size must be between {config.MIN_SIZE} and {config.MAX_SIZE}")
+        try:
+            self._report('ovs_config', "Attaching warm network to the controller...")
+            ovs.configure_bridges([s.name for s in self.net.switches],
+                                  config.OPENFLOW_VERSION, controller=CONTROLLER_TARGET)
+            
+            self._report('controller_connect', "Waiting for switches to connect to Ryu...")
+            status = self._wait_for_switches(config.SWITCH_READY_TIMEOUT)
+            self._verify_switches(status)
+        except Exception as e:
+            logger.error(f"Failed to activate warm network: {e}")
+            self._discard_active()
+            raise
         
-        # Clean up any existing network
-        self._cleanup_existing()
+        return dict(warm.result, warm=True)
+    
+    def prewarm(self, presets: List[Tuple[str, int]]):
+        """
+        Build networks into the warm pool ahead of time
+        
+        Args:
+            presets: (type, size) pairs to keep warm
+        """
+        for topology_type, size in presets:
+            if (topology_type, size) not in self.pool:
+                self.create(topology_type, size)
+        if self.net is not None:
+            self._park_active()
+    
+    def clear_pool(self):
+        """Stop every warm network"""
+        while self.pool:
+            _, warm = self.pool.popitem()
+            try:
+                warm.net.stop()
+            except Exception as e:
+                logger.error(f"Error stopping warm network: {e}")
+    
+    def _add_switch(self, number: int):
+        """
+        Add switch number N to the network being built
         
-        # Store topology info
-        self.topology_type = topology_type
-        self.topology_size = size
+        The DPID is always N, so Ryu sees s1..sN in every network. In warm
+        pool mode the bridge name gets a per-network prefix because OVS
+        bridge and port names are shared by all networks on the host.
+        """
+        return self.net.addSwitch(f'{self._prefix}{number}', dpid=f'{number:016x}',
+                                  protocols=config.OPENFLOW_VERSION)
+    
+    def create(self, topology_type: str, size: int,
+               progress: Optional[Callable[..., None]] = None,
+               spec: Optional[TopologySpec] = None) -> Dict:
+        """
+        Create a new Mininet topology
         
-        # Create topology based on type
-        logger.info(f"Creating {topology_type} topology with size {size}")
+        Args:
+            topology_type: Type of topology (one of config.TOPOLOGY_TYPES,
+                or 'custom' with ENABLE_CUSTOM_TOPOLOGIES)
+            size: Number of hosts/switches, tree depth, fat-tree k, leaf
+                count or torus side (ignored for 'custom')
+            progress: Optional callback, called as progress(phase, message)
+                when creation enters the cleanup, build, start, ovs_config
+                and controller_connect phases
+            spec: Topology spec for the 'custom' type, or an already
+                generated one for the GENERATORS types
         
-        if topology_type == 'star':
-            return self._create_star(size)
-        elif topology_type == 'linear':
-            return self._create_linear(size)
-        elif topology_type == 'tree':
-            return self._create_tree(size)
-        elif topology_type == 'mesh':
-            return self._create_mesh(size)
+        Returns:
+            Dictionary with creation status and info
+        """
+        # Validate inputs
+        if topology_type == 'custom' and config.ENABLE_CUSTOM_TOPOLOGIES:
+            if spec is None:
+                raise ValueError("Custom topologies need a spec")
+            spec.validate()
+            size = spec.switches
+        elif topology_type not in config.TOPOLOGY_TYPES:
+            raise ValueError(f"Invalid topology type: {topology_type}")
         else:
-            raise ValueError(f"Unsupported topology: {topology_type}")
+            min_size, max_size = size_limits(topology_type)
+            if size < min_size or size > max_size:
+                raise ValueError(f"Size must be between {min_size} and {max_size}")
+        
+        self._progress = progress
+        try:
+            # Clean up any existing network
+            self._cleanup_existing()
+            
+            # Reuse a warm network of the same shape if there is one
+            if topology_type != 'custom' and (topology_type, size) in self.pool:
+                return self._activate((topology_type, size))
+            
+            if config.WARM_POOL_ENABLED:
+                self._serial += 1
+                self._prefix = f'w{self._serial}s'
+            else:
+                self._prefix = 's'
+            
+            # Store topology info
+            self.topology_type = topology_type
+            self.topology_size = size
+            self._modified = False
+            
+            # Create topology based on type
+            self._report('build', f"Creating {topology_type} topology with size {size}")
+            
+            if topology_type == 'star':
+                return self._create_star(size)
+            elif topology_type == 'linear':
+                return self._create_linear(size)
+            elif topology_type == 'tree':
+                return self._create_tree(size)
+            elif topology_type == 'mesh':
+                return self._create_mesh(size)
+            elif topology_type == 'custom':
+                return self._create_spec(spec)
+            elif topology_type in GENERATORS:
+                return self._create_spec(spec or GENERATORS[topology_type](size))
+            else:
+                raise ValueError(f"Unsupported topology: {topology_type}")
+        finally:
+            self._progress = None
     
     def _create_star(self, num_hosts: int) -> Dict:
         """
@@ -90,13 +283,13 @@ class MininetManager:
         
         Args:
             num_hosts: Number of hosts to connect
-            
+        
         Returns:
             Creation status dictionary
         """
         self.net = Mininet(
             controller=RemoteController,
-            switch=OVSSwitch,
+            switch=BatchOVSSwitch,
             link=TCLink,
             autoSetMacs=True
         )
@@ -110,12 +303,12 @@ class MininetManager:
         )
         
         # Add central switch
-        s1 = self.net.addSwitch('s1', protocols=config.OPENFLOW_VERSION)
+        s1 = self._add_switch(1)
         
         # Add hosts and connect to central switch
         hosts = []
         for i in range(1, num_hosts + 1):
-            h = self.net.addHost(f'h{i}', ip=f'10.0.0.{i}')
+            h = self.net.addHost(f'h{i}', ip=self.addresses.address(i))
             self.net.addLink(h, s1)
             hosts.append(h)
         
@@ -127,13 +320,13 @@ class MininetManager:
         
         Args:
             num_switches: Number of switches to create
-            
+        
         Returns:
             Creation status dictionary
         """
         self.net = Mininet(
             controller=RemoteController,
-            switch=OVSSwitch,
+            switch=BatchOVSSwitch,
             link=TCLink,
             autoSetMacs=True
         )
@@ -152,11 +345,11 @@ class MininetManager:
         
         for i in range(1, num_switches + 1):
             # Add switch
-            s = self.net.addSwitch(f's{i}', protocols=config.OPENFLOW_VERSION)
+            s = self._add_switch(i)
             switches.append(s)
             
             # Add host connected to this switch
-            h = self.net.addHost(f'h{i}', ip=f'10.0.0.{i}')
+            h = self.net.addHost(f'h{i}', ip=self.addresses.address(i))
             self.net.addLink(h, s)
             hosts.append(h)
             
@@ -172,14 +365,14 @@ class MininetManager:
         Create binary tree topology
         
         Args:
-            depth: Depth of tree (2-4 recommended)
-            
+            depth: Depth of tree (levels of switches)
+        
         Returns:
             Creation status dictionary
         """
         self.net = Mininet(
             controller=RemoteController,
-            switch=OVSSwitch,
+            switch=BatchOVSSwitch,
             link=TCLink,
             autoSetMacs=True
         )
@@ -198,12 +391,12 @@ class MininetManager:
         host_count = 0
         
         # Level 0: Root switch
-        s1 = self.net.addSwitch('s1', protocols=config.OPENFLOW_VERSION)
+        s1 = self._add_switch(1)
         switches.append(s1)
         
         # Build tree levels
         switch_count = 1
-        for level in range(1, min(depth, 3)):  # Limit depth to avoid too many switches
+        for level in range(1, depth):
             parent_start = len(switches) - (2 ** (level - 1))
             parent_end = len(switches)
             
@@ -213,15 +406,15 @@ class MininetManager:
                 # Add two child switches
                 for child in range(2):
                     switch_count += 1
-                    s = self.net.addSwitch(f's{switch_count}', protocols=config.OPENFLOW_VERSION)
+                    s = self._add_switch(switch_count)
                     switches.append(s)
                     self.net.addLink(parent, s)
         
         # Add hosts to leaf switches (last level)
-        leaf_start = len(switches) - (2 ** (min(depth, 3) - 1))
+        leaf_start = len(switches) - (2 ** (depth - 1))
         for i, switch in enumerate(switches[leaf_start:], 1):
             host_count += 1
-            h = self.net.addHost(f'h{host_count}', ip=f'10.0.0.{host_count}')
+            h = self.net.addHost(f'h{host_count}', ip=self.addresses.address(host_count))
             self.net.addLink(h, switch)
             hosts.append(h)
         
@@ -233,17 +426,14 @@ class MininetManager:
         Create full mesh topology (all switches connected)
         
         Args:
-            num_switches: Number of switches (2-6 recommended)
-            
+            num_switches: Number of switches
+        
         Returns:
             Creation status dictionary
         """
-        # Limit mesh size to avoid explosion
-        num_switches = min(num_switches, 6)
-        
         self.net = Mininet(
             controller=RemoteController,
-            switch=OVSSwitch,
+            switch=BatchOVSSwitch,
             link=TCLink,
             autoSetMacs=True
         )
@@ -259,7 +449,7 @@ class MininetManager:
         # Create switches
         switches = []
         for i in range(1, num_switches + 1):
-            s = self.net.addSwitch(f's{i}', protocols=config.OPENFLOW_VERSION)
+            s = self._add_switch(i)
             switches.append(s)
         
         # Create full mesh (every switch connected to every other)
@@ -272,13 +462,52 @@ class MininetManager:
         # Add one host per switch
         hosts = []
         for i in range(1, num_switches + 1):
-            h = self.net.addHost(f'h{i}', ip=f'10.0.0.{i}')
+            h = self.net.addHost(f'h{i}', ip=self.addresses.address(i))
             self.net.addLink(h, switches[i-1])
             hosts.append(h)
         
         links = mesh_links + len(hosts)
         return self._start_network(switches=num_switches, hosts=num_switches, links=links)
     
+    def _create_spec(self, spec: TopologySpec) -> Dict:
+        """
+        Create a topology from a generated or declarative spec
+        
+        All nodes and links are added before the network starts, so the
+        switches are created and attached to the controller in one batch.
+        
+        Args:
+            spec: Topology spec
+        
+        Returns:
+            Creation status dictionary
+        """
+        self.net = Mininet(
+            controller=RemoteController,
+            switch=BatchOVSSwitch,
+            link=TCLink,
+            autoSetMacs=True
+        )
+        
+        # Add controller
+        self.net.addController(
+            'c0',
+            controller=RemoteController,
+            ip='127.0.0.1',
+            port=config.OPENFLOW_PORT
+        )
+        
+        switches = {n: self._add_switch(n) for n in range(1, spec.switches + 1)}
+        
+        for a, b in spec.links:
+            self.net.addLink(switches[a], switches[b])
+        
+        for i, n in enumerate(spec.hosts, 1):
+            h = self.net.addHost(f'h{i}', ip=self.addresses.address(i))
+            self.net.addLink(h, switches[n])
+        
+        return self._start_network(**spec.to_dict())
+    
     def _start_network(self, switches: int, hosts: int, links: int) -> Dict:
         """
         Start the Mininet network and wait for controller connection
@@ -287,32 +516,26 @@ class MininetManager:
             switches: Number of switches created
             hosts: Number of hosts created
             links: Number of links created
-            
+        
         Returns:
             Status dictionary
         """
         try:
-            logger.info("Starting Mininet network...")
+            self._report('start', "Starting Mininet network...")
             self.net.start()
             
-            # Set OpenFlow version for all switches
-            logger.info("Setting OpenFlow 1.3 for all switches...")
-            for switch in self.net.switches:
-                switch.cmd(f'ovs-vsctl set Bridge {switch.name} protocols={config.OPENFLOW_VERSION}')
+            # Set OpenFlow version for all switches in one transaction
+            self._report('ovs_config', "Setting OpenFlow 1.3 for all switches...")
+            ovs.configure_bridges([s.name for s in self.net.switches], config.OPENFLOW_VERSION)
             
-            # Wait for switches to connect to controller
-            logger.info(f"Waiting {config.SWITCH_CONNECTION_WAIT}s for switches to connect to Ryu...")
-            time.sleep(config.SWITCH_CONNECTION_WAIT)
-            
-            # Verify switches are connected
-            for switch in self.net.switches:
-                result = switch.cmd('ovs-vsctl show')
-                if 'is_connected: true' not in result:
-                    logger.warning(f"Switch {switch.name} may not be connected to controller")
+            # Wait until every switch reports a controller connection
+            self._report('controller_connect', "Waiting for switches to connect to Ryu...")
+            status = self._wait_for_switches(config.SWITCH_READY_TIMEOUT)
+            self._verify_switches(status)
             
             logger.info("Network started successfully")
             
-            return {
+            self._result = {
                 "success": True,
                 "topology_type": self.topology_type,
                 "size": self.topology_size,
@@ -320,12 +543,299 @@ class MininetManager:
                 "hosts": hosts,
                 "links": links
             }
-            
+            return self._result
+        
         except Exception as e:
             logger.error(f"Failed to start network: {e}")
+            self._discard_active()
             self._cleanup_existing()
             raise
     
+    def _wait_for_switches(self, timeout: float) -> Dict[str, Dict]:
+        """
+        Poll OVS until every switch of the network is connected
+        
+        Each poll is a single bulk ovs-vsctl query, and the wait ends as
+        soon as the last switch connects.
+        
+        Args:
+            timeout: Seconds to wait at most
+        
+        Returns:
+            Last bridge status (see ovs.bridge_status) of the network's switches
+        """
+        deadline = time.monotonic() + timeout
+        names = {switch.name for switch in self.net.switches}
+        status = {}
+        
+        while True:
+            try:
+                status = {name: st for name, st in ovs.bridge_status().items()
+                          if name in names}
+            except Exception as e:
+                logger.error(f"Failed to query OVS bridge state: {e}")
+            
+            connected = {name for name, st in status.items() if st['connected']}
+            if connected >= names or time.monotonic() >= deadline:
+                return status
+            time.sleep(config.SWITCH_READY_POLL_INTERVAL)
+    
+    def _verify_switches(self, status: Dict[str, Dict]):
+        """Log switches whose OVS state differs from what was configured"""
+        for switch in self.net.switches:
+            st = status.get(switch.name)
+            if st is None:
+                logger.warning(f"Switch {switch.name} not found in OVS")
+                continue
+            if config.OPENFLOW_VERSION not in st['protocols']:
+                logger.warning(f"Switch {switch.name} protocols are {st['protocols']}")
+            if not st['targets']:
+                logger.warning(f"Switch {switch.name} has no controller target")
+            elif not st['connected']:
+                logger.warning(f"Switch {switch.name} may not be connected to controller")
+    
+    def get_dpids(self) -> List[int]:
+        """
+        Get the DPIDs of the running network's switches
+        
+        Returns:
+            List of integer DPIDs (empty if no network is running)
+        """
+        if self.net is None:
+            return []
+        return [int(switch.dpid, 16) for switch in self.net.switches]
+    
+    # ---------- Live modification ----------
+    
+    def _require_network(self):
+        """Raise if no network is running"""
+        if self.net is None:
+            raise RuntimeError("No network is running")
+    
+    def _node(self, name: str, kind: str = None):
+        """
+        Look up a node of the running network
+        
+        Args:
+            name: Node name (e.g. 's1', 'h2')
+            kind: 'switch' or 'host' to require a node type
+        
+        Raises:
+            ValueError: If the node does not exist or has the wrong type
+        """
+        node = self.net.nameToNode.get(name)
+        if node is None and name[:1] == 's' and name[1:].isdigit():
+            # Switches are addressed as sN (their DPID) whatever the bridge name
+            node = self.net.nameToNode.get(f'{self._prefix}{name[1:]}')
+        if node is None:
+            raise ValueError(f"Node not found: {name}")
+        if kind == 'switch' and node not in self.net.switches:
+            raise ValueError(f"{name} is not a switch")
+        if kind == 'host' and node not in self.net.hosts:
+            raise ValueError(f"{name} is not a host")
+        return node
+    
+    def _next_name(self, prefix: str) -> str:
+        """Lowest free node name with the given prefix"""
+        i = 1
+        while f'{prefix}{i}' in self.net.nameToNode:
+            i += 1
+        return f'{prefix}{i}'
+    
+    def _next_ip(self) -> str:
+        """Lowest free host address in config.HOST_NETWORK"""
+        return self.addresses.next_free(host.IP() for host in self.net.hosts)
+    
+    def _link(self, node1, node2):
+        """Create a link in the running network and plug it into switches"""
+        link = self.net.addLink(node1, node2)
+        for intf in (link.intf1, link.intf2):
+            if intf.node in self.net.switches:
+                intf.node.attach(intf)
+        return link
+    
+    def _unlink(self, link):
+        """Unplug a link from its switches and delete it"""
+        for intf in (link.intf1, link.intf2):
+            if intf.node in self.net.switches:
+                intf.node.detach(intf)
+        self.net.delLink(link)
+    
+    def _node_links(self, node) -> List:
+        """All links with an end on a node"""
+        return [link for link in self.net.links
+                if node in (link.intf1.node, link.intf2.node)]
+    
+    def add_switch(self, name: str = None, links: List[str] = ()) -> str:
+        """
+        Add a switch to the running network
+        
+        Args:
+            name: Switch name (default: lowest free sN)
+            links: Names of existing switches to link it to
+        
+        Returns:
+            Name of the new switch
+        """
+        self._require_network()
+        used = set(self.get_dpids())
+        if name is None:
+            number = next(i for i in range(1, len(used) + 2) if i not in used)
+        elif name[:1] == 's' and name[1:].isdigit():
+            number = int(name[1:])
+        else:
+            raise ValueError(f"Switch names must be sN: {name}")
+        if number in used:
+            raise ValueError(f"Node already exists: s{number}")
+        peers = [self._node(peer, 'switch') for peer in links]
+        
+        switch = self._add_switch(number)
+        switch.start(self.net.controllers)
+        type(switch).batchStartup([switch])
+        
+        for peer in peers:
+            self._link(switch, peer)
+        return f's{number}'
+    
+    def remove_switch(self, name: str):
+        """
+        Remove a switch and all of its links from the running network
+        
+        Args:
+            name: Switch name
+        """
+        self._require_network()
+        switch = self._node(name, 'switch')
+        for link in self._node_links(switch):
+            self._unlink(link)
+        self.net.delSwitch(switch)
+    
+    def add_host(self, switch: str, name: str = None) -> str:
+        """
+        Add a host attached to a switch of the running network
+        
+        Args:
+            switch: Name of the switch to attach to
+            name: Host name (default: lowest free hN)
+        
+        Returns:
+            Name of the new host
+        """
+        self._require_network()
+        name = name or self._next_name('h')
+        if name in self.net.nameToNode:
+            raise ValueError(f"Node already exists: {name}")
+        peer = self._node(switch, 'switch')
+        
+        host = self.net.addHost(name, ip=self._next_ip())
+        self._link(host, peer)
+        host.configDefault()
+        return name
+    
+    def remove_host(self, name: str):
+        """
+        Remove a host and its links from the running network
+        
+        Args:
+            name: Host name
+        """
+        self._require_network()
+        host = self._node(name, 'host')
+        for link in self._node_links(host):
+            self._unlink(link)
+        self.net.delHost(host)
+    
+    def add_link(self, node1: str, node2: str):
+        """
+        Link two existing nodes of the running network
+        
+        Args:
+            node1: First node name
+            node2: Second node name
+        """
+        self._require_network()
+        self._link(self._node(node1), self._node(node2))
+    
+    def remove_link(self, node1: str, node2: str):
+        """
+        Remove every link between two nodes of the running network
+        
+        Args:
+            node1: First node name
+            node2: Second node name
+        """
+        self._require_network()
+        links = self.net.linksBetween(self._node(node1), self._node(node2))
+        if not links:
+            raise ValueError(f"No link between {node1} and {node2}")
+        for link in links:
+            self._unlink(link)
+    
+    def modify(self, ops: List[Dict]) -> Dict:
+        """
+        Apply a list of changes to the running network
+        
+        Only the listed nodes and links are touched; the rest of the network
+        keeps running. Operations are applied in order and stop at the first
+        invalid one (operations before it stay applied).
+        
+        Args:
+            ops: Operations, each one of
+                {"op": "add_switch", "name": "s9", "links": ["s8"]}
+                {"op": "remove_switch", "name": "s9"}
+                {"op": "add_host", "switch": "s3", "name": "h9"}
+                {"op": "remove_host", "name": "h9"}
+                {"op": "add_link", "a": "s1", "b": "s3"}
+                {"op": "remove_link", "a": "s1", "b": "s3"}
+        
+        Returns:
+            Dictionary with the applied operations and new node counts
+        
+        Raises:
+            ValueError: If an operation is invalid
+        """
+        self._require_network()
+        handlers = {
+            'add_switch': lambda op: self.add_switch(op.get('name'), op.get('links', [])),
+            'remove_switch': lambda op: self.remove_switch(op['name']),
+            'add_host': lambda op: self.add_host(op['switch'], op.get('name')),
+            'remove_host': lambda op: self.remove_host(op['name']),
+            'add_link': lambda op: self.add_link(op['a'], op['b']),
+            'remove_link': lambda op: self.remove_link(op['a'], op['b']),
+        }
+        
+        applied = []
+        try:
+            for i, op in enumerate(ops):
+                handler = handlers.get(op.get('op'))
+                if handler is None:
+                    raise ValueError(f"Operation {i}: unknown operation {op.get('op')}")
+                try:
+                    name = handler(op)
+                except KeyError as e:
+                    raise ValueError(f"Operation {i}: {op['op']} needs {e}")
+                except ValueError as e:
+                    raise ValueError(f"Operation {i}: {e}")
+                
+                applied.append(dict(op, name=name) if name else op)
+                logger.info(f"Applied {op['op']}: {name or op}")
+        finally:
+            if applied:
+                # No longer the shape its (type, size) pool key promises
+                self._modified = True
+                self._result = dict(self._result or {},
+                                    switches=len(self.net.switches),
+                                    hosts=len(self.net.hosts),
+                                    links=len(self.net.links))
+        
+        return {
+            "success": True,
+            "applied": applied,
+            "switches": len(self.net.switches),
+            "hosts": len(self.net.hosts),
+            "links": len(self.net.links)
+        }
+    
     def stop(self) -> Dict:
         """
         Stop the current Mininet network
@@ -367,6 +877,139 @@ class MininetManager:
                 "error": str(e)
             }
     
+    def ping_matrix(self, hosts: List[str] = None, count: int = None,
+                    parallelism: int = None,
+                    on_row: Optional[Callable[[str, Dict], None]] = None) -> Dict:
+        """
+        Ping every pair of hosts concurrently
+        
+        Each ping runs as its own process in the source host's namespace,
+        so pairs do not serialize on the host's shell like pingAll does.
+        
+        Args:
+            hosts: Host names (default: all hosts)
+            count: Echo requests per pair
+            parallelism: Maximum pings in flight
+            on_row: Called as on_row(src, row) as each source's row completes
+        
+        Returns:
+            Matrix dictionary from measurements.ping_matrix
+        """
+        if self.net is None:
+            raise RuntimeError("No network is running")
+        
+        names = hosts or [h.name for h in self.net.hosts]
+        nodes = {name: self._node(name, 'host') for name in names}
+        count = count or config.PING_MATRIX_COUNT
+        
+        def ping(src: str, dst: str) -> str:
+            proc = nodes[src].popen(['ping', '-c', str(count), '-i', '0.2',
+                                     '-W', str(config.PING_MATRIX_TIMEOUT),
+                                     nodes[dst].IP()])
+            out, _ = proc.communicate()
+            return decode(out)
+        
+        logger.info(f"Running ping matrix over {len(names)} hosts...")
+        return measurements.ping_matrix(names, ping,
+                                        parallelism or config.PING_MATRIX_PARALLELISM,
+                                        on_row=on_row)
+    
+    def _host_pairs(self, pairs: List[List[str]] = None) -> List[Tuple[str, str]]:
+        """Validated (src, dst) host pairs, default every unordered pair"""
+        if pairs is None:
+            names = [h.name for h in self.net.hosts]
+            return [(a, b) for i, a in enumerate(names) for b in names[i + 1:]]
+        
+        result = []
+        for pair in pairs:
+            if len(pair) != 2 or pair[0] == pair[1]:
+                raise ValueError(f"Invalid host pair: {pair}")
+            result.append((self._node(pair[0], 'host').name, self._node(pair[1], 'host').name))
+        return result
+    
+    def _path_links(self, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], frozenset]:
+        """Links on the shortest path of every pair through the network"""
+        adjacency: Dict[str, set] = {}
+        for link in self.net.links:
+            a, b = link.intf1.node.name, link.intf2.node.name
+            adjacency.setdefault(a, set()).add(b)
+            adjacency.setdefault(b, set()).add(a)
+        
+        return {
+            pair: measurements.path_links(measurements.shortest_path(adjacency, *pair))
+            for pair in pairs
+        }
+    
+    def iperf_matrix(self, pairs: List[List[str]] = None, duration: int = None,
+                     mode: str = 'isolated',
+                     on_result: Optional[Callable[[str, str, Dict], None]] = None) -> Dict:
+        """
+        Measure TCP throughput between host pairs with iperf
+        
+        In 'isolated' mode tests are grouped into rounds whose paths share
+        no link, so each test sees the path's full capacity while disjoint
+        tests still run in parallel. In 'contention' mode all tests run at
+        once to measure how flows share the fabric.
+        
+        Args:
+            pairs: [src, dst] host pairs (default: every unordered pair)
+            duration: Seconds per test
+            mode: 'isolated' or 'contention'
+            on_result: Called as on_result(src, dst, result) per finished test
+        
+        Returns:
+            Dictionary with "mode", "duration", "rounds" and per-pair "results"
+        """
+        if self.net is None:
+            raise RuntimeError("No network is running")
+        if mode not in ('isolated', 'contention'):
+            raise ValueError(f"Invalid mode: {mode}")
+        
+        duration = duration or config.IPERF_DURATION
+        tests = list(dict.fromkeys(self._host_pairs(pairs)))
+        if not tests:
+            raise ValueError("No host pairs to test")
+        if mode == 'isolated':
+            rounds = measurements.schedule_rounds(tests, self._path_links(tests))
+        else:
+            rounds = [tests]
+        
+        # Each host is its own namespace: number server ports per destination,
+        # so ports stay below IPERF_BASE_PORT + host count
+        ports = {}
+        incoming = {}
+        for src, dst in tests:
+            ports[(src, dst)] = config.IPERF_BASE_PORT + incoming.get(dst, 0)
+            incoming[dst] = incoming.get(dst, 0) + 1
+        
+        def measure(src: str, dst: str) -> Dict:
+            client, server = self.net.get(src), self.net.get(dst)
+            port = str(ports[(src, dst)])
+            listener = server.popen(['iperf', '-s', '-p', port])
+            try:
+                for _ in range(config.IPERF_CONNECT_RETRIES):
+                    proc = client.popen(['iperf', '-c', server.IP(), '-p', port,
+                                         '-t', str(duration), '-y', 'C'])
+                    out, err = proc.communicate()
+                    try:
+                        return measurements.parse_iperf(decode(out))
+                    except ValueError:
+                        # Server not listening yet
+                        time.sleep(0.1)
+                raise RuntimeError(f"iperf failed: {decode(err).strip()}")
+            finally:
+                listener.terminate()
+                listener.wait()
+        
+        logger.info(f"Running {len(tests)} throughput tests in {len(rounds)} round(s)...")
+        return {
+            "mode": mode,
+            "duration": duration,
+            "rounds": len(rounds),
+            "results": measurements.run_rounds(rounds, measure, on_result=on_result,
+                                               parallelism=config.IPERF_MAX_PARALLEL)
+        }
+    
     def ping(self, src: str, dst: str) -> Dict:
         """
         Ping between two hosts
@@ -374,7 +1017,7 @@ class MininetManager:
         Args:
             src: Source host name (e.g., 'h1')
             dst: Destination host name (e.g., 'h2')
-            
+        
         Returns:
             Ping result dictionary
         """
@@ -417,7 +1060,7 @@ class MininetManager:
             "active": True,
             "topology_type": self.topology_type,
             "size": self.topology_size,
-            "switches": [s.name for s in self.net.switches],
+            "switches": [f"s{dpid}" for dpid in self.get_dpids()],
             "hosts": [h.name for h in self.net.hosts],
             "controllers": [c.name for c in self.net.controllers]
         }
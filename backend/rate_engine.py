@@ -0,0 +1,153 @@
+"""
+Port Rate Engine
+Vectorized per-port packet/byte rate computation from cumulative counters
+"""
+
+import logging
+from typing import Dict, Hashable, List, Tuple
+import numpy as np
+import config
+
+logger = logging.getLogger(__name__)
+
+# Cumulative counters read from Ryu port stats (column order matters)
+COUNTERS = ('rx_packets', 'tx_packets', 'rx_bytes', 'tx_bytes')
+
+# Rates derived from COUNTERS, column for column
+RATES = ('rx_pps', 'tx_pps', 'rx_bps', 'tx_bps')
+
+# Bytes are reported as bits per second
+_RATE_SCALE = np.array([1.0, 1.0, 8.0, 8.0])
+
+_MAX_U32 = 2 ** 32
+_MAX_U64 = 2 ** 64
+
+
+class PortRateEngine:
+    """
+    Computes pps/bps per port and direction from consecutive samples
+    
+    The previous sample is kept in NumPy arrays indexed by a row per
+    (dpid, port_no), so each update is a handful of array operations no
+    matter how many ports the network has.
+    
+    A counter that goes backwards is treated as a wrap when the previous
+    value was in the top half of the 32- or 64-bit counter range, and as a
+    reset (switch reconnect, port re-created) otherwise. A port whose
+    duration goes backwards is always a reset. Reset and first-seen ports
+    get a new baseline and no rate for that sample.
+    """
+    
+    def __init__(self, stale_after: float = None):
+        """
+        Initialize rate engine
+        
+        Args:
+            stale_after: Seconds after which a port's previous sample is
+                too old to compute a rate from (default from config)
+        """
+        self.stale_after = stale_after or config.RATE_STALE_AFTER
+        self._rows: Dict[Tuple[str, Hashable], int] = {}
+        self._counters = np.zeros((0, len(COUNTERS)), dtype=np.uint64)
+        self._durations = np.zeros(0, dtype=np.float64)
+        self._times = np.zeros(0, dtype=np.float64)
+    
+    def _grow(self, size: int):
+        """Grow the state arrays to hold at least size rows"""
+        capacity = len(self._times)
+        if size <= capacity:
+            return
+        
+        new_capacity = max(size, capacity * 2, 64)
+        extra = new_capacity - capacity
+        self._counters = np.vstack([self._counters,
+                                    np.zeros((extra, len(COUNTERS)), dtype=np.uint64)])
+        self._durations = np.concatenate([self._durations, np.zeros(extra)])
+        self._times = np.concatenate([self._times, np.full(extra, np.nan)])
+    
+    def _row_for(self, key: Tuple[str, Hashable]) -> int:
+        """Get (or allocate) the state row for a (dpid, port_no) key"""
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self._rows)
+            self._rows[key] = row
+            self._grow(row + 1)
+        return row
+    
+    def update(self, port_stats: Dict[str, List[Dict]],
+               timestamp: float) -> Dict:
+        """
+        Feed a new port stats sample and compute rates
+        
+        Args:
+            port_stats: Ryu port stats, mapping DPID to list of port dicts
+            timestamp: Sample time in seconds
+        
+        Returns:
+            Dictionary with per-port rates and network totals
+            Example: {
+                "ports": {"1": {"2": {"rx_pps": 10.0, "tx_pps": 9.5,
+                                      "rx_bps": 8000.0, "tx_bps": 7600.0}}},
+                "totals": {"rx_pps": 10.0, ...}
+            }
+        """
+        keys = []
+        rows = []
+        samples = []
+        durations = []
+        
+        for dpid, ports in port_stats.items():
+            for port in ports:
+                key = (str(dpid), port.get('port_no'))
+                keys.append(key)
+                rows.append(self._row_for(key))
+                samples.append([port.get(name, 0) for name in COUNTERS])
+                durations.append(port.get('duration_sec', 0) +
+                                 port.get('duration_nsec', 0) / 1e9)
+        
+        if not rows:
+            return {"ports": {}, "totals": dict.fromkeys(RATES, 0.0)}
+        
+        rows = np.array(rows, dtype=np.intp)
+        current = np.array(samples, dtype=np.uint64)
+        durations = np.array(durations, dtype=np.float64)
+        
+        previous = self._counters[rows]
+        elapsed = timestamp - self._times[rows]
+        
+        # uint64 subtraction is modular, which is exactly a 64-bit wrap
+        deltas = (current - previous).astype(np.float64)
+        backwards = current < previous
+        
+        wrap64 = backwards & (previous >= _MAX_U64 // 2)
+        wrap32 = backwards & (previous < _MAX_U32) & (previous >= _MAX_U32 // 2)
+        deltas = np.where(wrap32,
+                          current.astype(np.float64) + _MAX_U32 - previous.astype(np.float64),
+                          deltas)
+        
+        reset = (backwards & ~wrap64 & ~wrap32).any(axis=1)
+        reset |= durations < self._durations[rows]
+        
+        valid = ~reset & (elapsed > 0) & (elapsed <= self.stale_after)
+        rates = deltas * _RATE_SCALE / np.where(valid, elapsed, 1.0)[:, None]
+        
+        if reset.any():
+            logger.debug(f"Counter reset on {int(reset.sum())} port(s)")
+        
+        # Current sample becomes the new baseline
+        self._counters[rows] = current
+        self._durations[rows] = durations
+        self._times[rows] = timestamp
+        
+        result = {}
+        for i in np.flatnonzero(valid):
+            dpid, port_no = keys[i]
+            result.setdefault(dpid, {})[port_no] = dict(zip(RATES, rates[i].tolist()))
+        
+        totals = rates[valid].sum(axis=0) if valid.any() else np.zeros(len(RATES))
+        
+        return {
+            "ports": result,
+            "totals": dict(zip(RATES, totals.tolist()))
+        }
+
@@ -5,8 +5,15 @@ Wrapper for interacting with Ryu controller's REST APIs
 
 import requests
 import logging
-from typing import Dict, List, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, Iterable, List, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import config
+from scheduler import spread_offsets
+from subscriptions import normalize_dpid
 
 logger = logging.getLogger(__name__)
 
@@ -23,23 +30,83 @@ class RyuClient:
         """
         self.base_url = base_url or config.RYU_BASE_URL
         self.timeout = config.CONNECTION_TIMEOUT
+        self.session = self._create_session()
+        # Topology reads are not retried, so each one is bounded by its timeout
+        self.topology_session = self._create_session(retries=0)
+        # Last good switches/links/hosts, served when a later read fails
+        self._last_topology: Dict[str, List] = {}
+        self.executor = ThreadPoolExecutor(
+            max_workers=config.STATS_FANOUT_WORKERS,
+            thread_name_prefix='ryu-client'
+        )
+        # Topology reads never queue behind a stats sweep
+        self.topology_executor = ThreadPoolExecutor(
+            max_workers=3,
+            thread_name_prefix='ryu-topology'
+        )
+    
+    def _create_session(self, retries: Optional[int] = None) -> requests.Session:
+        """
+        Create a pooled keep-alive session for the Ryu REST API
+        
+        Args:
+            retries: Retries per request (default from config)
         
-    def _get(self, endpoint: str) -> Any:
+        Returns:
+            Session with a bounded connection pool and retry/backoff
+        """
+        retries = retries if retries is not None else config.RYU_MAX_RETRIES
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            backoff_factor=config.RYU_RETRY_BACKOFF,
+            status_forcelist=(502, 503, 504),
+            # Connect errors are retried for every method, but read errors
+            # and 5xx only for GET: a retried POST could add a flow twice
+            allowed_methods=frozenset(['GET']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            # One connection per stats worker and topology reader
+            pool_maxsize=max(config.RYU_POOL_SIZE, config.STATS_FANOUT_WORKERS + 3),
+            max_retries=retry,
+            pool_block=True
+        )
+        
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'Connection': 'keep-alive'})
+        return session
+    
+    def close(self):
+        """Close all pooled connections to Ryu"""
+        self.executor.shutdown(wait=False)
+        self.topology_executor.shutdown(wait=False)
+        self.session.close()
+        self.topology_session.close()
+    
+    def _get(self, endpoint: str, timeout: Optional[float] = None,
+             session: Optional[requests.Session] = None) -> Any:
         """
         Make GET request to Ryu API
         
         Args:
             endpoint: API endpoint path
-            
+            timeout: Request timeout in seconds (default from config)
+            session: Session to send it on (default: the retrying session)
+        
         Returns:
             JSON response data
-            
+        
         Raises:
             requests.RequestException: If request fails
         """
         url = f"{self.base_url}{endpoint}"
         try:
-            response = requests.get(url, timeout=self.timeout)
+            response = (session or self.session).get(url, timeout=timeout or self.timeout)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -53,13 +120,13 @@ class RyuClient:
         Args:
             endpoint: API endpoint path
             data: JSON data to send
-            
+        
         Returns:
             JSON response data
         """
         url = f"{self.base_url}{endpoint}"
         try:
-            response = requests.post(url, json=data, timeout=self.timeout)
+            response = self.session.post(url, json=data, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
@@ -84,6 +151,40 @@ class RyuClient:
             logger.error(f"Failed to get switches: {e}")
             return []
     
+    def wait_for_switches(self, dpids: Iterable, timeout: float = None) -> List[int]:
+        """
+        Wait until Ryu knows every expected switch
+        
+        Polls the switch list and returns as soon as all DPIDs are present,
+        or when the deadline passes.
+        
+        Args:
+            dpids: Expected switch DPIDs (hex strings or ints)
+            timeout: Seconds to wait at most (default from config)
+        
+        Returns:
+            DPIDs still missing at the deadline (empty when all connected)
+        """
+        timeout = timeout if timeout is not None else config.SWITCH_READY_TIMEOUT
+        deadline = time.monotonic() + timeout
+        
+        pending = set()
+        for dpid in dpids:
+            pending.add(int(normalize_dpid(dpid)))
+        
+        while pending:
+            try:
+                switches = self._get("/v1.0/topology/switches")
+                pending -= {int(switch['dpid'], 16) for switch in switches}
+            except Exception as e:
+                logger.debug(f"Switch list not available yet: {e}")
+            
+            if not pending or time.monotonic() >= deadline:
+                break
+            time.sleep(config.SWITCH_READY_POLL_INTERVAL)
+        
+        return sorted(pending)
+    
     def get_links(self) -> List[Dict]:
         """
         Get all links between switches
@@ -121,20 +222,76 @@ class RyuClient:
             logger.error(f"Failed to get hosts: {e}")
             return []
     
+    def get_topology(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Fetch switches, links and hosts concurrently
+        
+        The three reads are issued at the same time and each one gets its
+        own deadline, which is also its HTTP timeout, so a hung read frees
+        its worker by then. A read that fails or times out is reported in
+        "errors" and contributes the last list read successfully (or an
+        empty list if there is none) instead of failing the whole call.
+        
+        Args:
+            timeout: Seconds allowed for each read (default from config)
+        
+        Returns:
+            Dictionary with "switches", "links", "hosts" lists, an "errors"
+            dict mapping the failed part to its error message and a "stale"
+            list naming the failed parts that were carried over
+        """
+        timeout = timeout if timeout is not None else config.TOPOLOGY_FETCH_TIMEOUT
+        endpoints = {
+            "switches": "/v1.0/topology/switches",
+            "links": "/v1.0/topology/links",
+            "hosts": "/v1.0/topology/hosts"
+        }
+        
+        started = time.monotonic()
+        futures = {
+            part: self.topology_executor.submit(self._get, endpoint, timeout,
+                                                self.topology_session)
+            for part, endpoint in endpoints.items()
+        }
+        
+        result = {"errors": {}, "stale": []}
+        for part, future in futures.items():
+            remaining = max(0.0, started + timeout - time.monotonic())
+            try:
+                result[part] = future.result(timeout=remaining) or []
+                self._last_topology[part] = result[part]
+                continue
+            except FutureTimeoutError:
+                # The request itself gives up after the same timeout
+                logger.error(f"Timed out fetching {part} after {timeout}s")
+                result["errors"][part] = f"timed out after {timeout}s"
+            except Exception as e:
+                logger.error(f"Failed to get {part}: {e}")
+                result["errors"][part] = str(e)
+            
+            if part in self._last_topology:
+                result[part] = self._last_topology[part]
+                result["stale"].append(part)
+            else:
+                result[part] = []
+        
+        for switch in result["switches"]:
+            switch['dpid_int'] = int(switch['dpid'], 16)
+        
+        return result
+    
     def get_flow_stats(self, dpid: str) -> List[Dict]:
         """
         Get flow table entries for a switch
         
         Args:
             dpid: Switch DPID (as hex string or int)
-            
+        
         Returns:
             List of flow entries
         """
         try:
-            # Convert dpid to int if needed
-            if isinstance(dpid, str) and not dpid.isdigit():
-                dpid = int(dpid, 16)
+            dpid = int(normalize_dpid(dpid))
             
             data = self._get(f"/stats/flow/{dpid}")
             return data.get(str(dpid), [])
@@ -142,13 +299,18 @@ class RyuClient:
             logger.error(f"Failed to get flow stats for {dpid}: {e}")
             return []
     
-    def get_port_stats(self, dpid: Optional[str] = None) -> Dict[str, List[Dict]]:
+    def get_port_stats(self, dpid: Optional[str] = None,
+                       dpids: Optional[Iterable] = None,
+                       spread: float = 0.0) -> Dict[str, List[Dict]]:
         """
         Get port statistics for switch(es)
         
         Args:
             dpid: Specific switch DPID, or None for all switches
-            
+            dpids: Optional subset of switch DPIDs to fan out to when
+                dpid is None (default: every connected switch)
+            spread: Seconds to spread the fan-out requests over
+        
         Returns:
             Dictionary mapping DPID to list of port stats
             Example: {
@@ -163,39 +325,98 @@ class RyuClient:
         """
         try:
             if dpid:
-                # Convert dpid to int if needed
-                if isinstance(dpid, str) and not dpid.isdigit():
-                    dpid = int(dpid, 16)
-                endpoint = f"/stats/port/{dpid}"
-            else:
+                dpid = int(normalize_dpid(dpid))
+                return self._get(f"/stats/port/{dpid}")
+            
+            if dpids is None:
                 # Get all switches
                 switches = self.get_switches()
-                if not switches:
-                    return {}
-                
-                # Get port stats for first switch (for simplicity)
-                dpid = switches[0]['dpid_int']
-                endpoint = f"/stats/port/{dpid}"
+                dpids = [switch['dpid_int'] for switch in switches]
             
-            data = self._get(endpoint)
-            return data
+            return self.get_port_stats_fanout(dpids, spread)
         except Exception as e:
             logger.error(f"Failed to get port stats: {e}")
             return {}
     
+    def _fanout(self, endpoint: str, dpids: Iterable, spread: float,
+                what: str) -> Dict[str, Any]:
+        """
+        Issue one request per switch on the worker pool and merge the results
+        
+        With a spread, the calling thread waits for each switch's offset
+        before submitting its request, so pool workers only ever run
+        requests and never sit sleeping while other reads queue.
+        
+        Args:
+            endpoint: Endpoint path with a {dpid} placeholder
+            dpids: Switch DPIDs (hex strings or ints)
+            spread: Seconds to spread the requests over (0 = all at once)
+            what: Description used in error messages
+        
+        Returns:
+            Merged response dictionaries of all switches that answered
+        """
+        dpid_ints = set()
+        for dpid in dpids:
+            dpid_ints.add(int(normalize_dpid(dpid)))
+        
+        if not dpid_ints:
+            return {}
+        
+        # Stable per-switch offsets, submitted in start order
+        offsets = spread_offsets(dpid_ints, spread, config.STATS_SPREAD_JITTER)
+        started = time.monotonic()
+        futures = {}
+        for dpid, offset in sorted(offsets.items(), key=lambda item: item[1]):
+            delay = started + offset - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            futures[self.executor.submit(self._get, endpoint.format(dpid=dpid))] = dpid
+        
+        merged = {}
+        for future in as_completed(futures):
+            dpid = futures[future]
+            try:
+                merged.update(future.result())
+            except Exception as e:
+                logger.error(f"Failed to get {what} for {dpid}: {e}")
+        
+        return merged
+    
+    def get_port_stats_fanout(self, dpids: Iterable,
+                              spread: float = 0.0) -> Dict[str, List[Dict]]:
+        """
+        Fetch port statistics for many switches concurrently
+        
+        Each switch is queried on the client's bounded worker pool, so a
+        full sweep costs roughly as much as the slowest single switch.
+        With a spread, each switch gets a fixed offset within that window
+        instead, so samples of a switch stay evenly spaced and the
+        controller does not see a burst at the start of every poll.
+        Switches that fail to answer are logged and left out of the result.
+        
+        Args:
+            dpids: Switch DPIDs (hex strings or ints)
+            spread: Seconds to spread the requests over (0 = all at once)
+        
+        Returns:
+            Dictionary mapping DPID to list of port stats, merged across
+            all switches that answered
+        """
+        return self._fanout("/stats/port/{dpid}", dpids, spread, "port stats")
+    
     def get_aggregate_flow_stats(self, dpid: str) -> Dict:
         """
         Get aggregate flow statistics for a switch
         
         Args:
             dpid: Switch DPID
-            
+        
         Returns:
             Aggregate statistics (packet count, byte count, flow count)
         """
         try:
-            if isinstance(dpid, str) and not dpid.isdigit():
-                dpid = int(dpid, 16)
+            dpid = int(normalize_dpid(dpid))
             
             data = self._get(f"/stats/aggregateflow/{dpid}")
             return data.get(str(dpid), [{}])[0]
@@ -203,6 +424,22 @@ class RyuClient:
             logger.error(f"Failed to get aggregate stats for {dpid}: {e}")
             return {}
     
+    def get_aggregate_flow_stats_fanout(self, dpids: Iterable,
+                                        spread: float = 0.0) -> Dict[str, Dict]:
+        """
+        Fetch aggregate flow statistics for many switches concurrently
+        
+        Args:
+            dpids: Switch DPIDs (hex strings or ints)
+            spread: Seconds to spread the requests over (0 = all at once)
+        
+        Returns:
+            Dictionary mapping DPID to its aggregate statistics
+        """
+        data = self._fanout("/stats/aggregateflow/{dpid}", dpids, spread,
+                            "aggregate stats")
+        return {dpid: (stats or [{}])[0] for dpid, stats in data.items()}
+    
     def add_flow(self, dpid: str, flow: Dict) -> bool:
         """
         Add a flow entry to a switch
@@ -210,13 +447,12 @@ class RyuClient:
         Args:
             dpid: Switch DPID
             flow: Flow entry dictionary
-            
+        
         Returns:
             True if successful
         """
         try:
-            if isinstance(dpid, str) and not dpid.isdigit():
-                dpid = int(dpid, 16)
+            dpid = int(normalize_dpid(dpid))
             
             endpoint = f"/stats/flowentry/add"
             data = {"dpid": dpid, **flow}
@@ -234,13 +470,12 @@ class RyuClient:
         Args:
             dpid: Switch DPID
             flow: Flow match criteria
-            
+        
         Returns:
             True if successful
         """
         try:
-            if isinstance(dpid, str) and not dpid.isdigit():
-                dpid = int(dpid, 16)
+            dpid = int(normalize_dpid(dpid))
             
             endpoint = f"/stats/flowentry/delete"
             data = {"dpid": dpid, **flow}
@@ -272,17 +507,20 @@ class RyuClient:
             Dictionary with controller stats
         """
         try:
-            switches = self.get_switches()
-            links = self.get_links()
-            hosts = self.get_hosts()
+            topology = self.get_topology()
+            if len(topology["errors"]) == 3:
+                raise RuntimeError("; ".join(topology["errors"].values()))
             
-            return {
+            info = {
                 "connected": True,
-                "switch_count": len(switches),
-                "link_count": len(links),
-                "host_count": len(hosts),
+                "switch_count": len(topology["switches"]),
+                "link_count": len(topology["links"]),
+                "host_count": len(topology["hosts"]),
                 "base_url": self.base_url
             }
+            if topology["errors"]:
+                info["errors"] = topology["errors"]
+            return info
         except Exception as e:
             logger.error(f"Failed to get controller info: {e}")
             return {
@@ -0,0 +1,223 @@
+"""
+Tiered Task Scheduler
+Fixed-rate periodic tasks with drift compensation and overrun accounting
+"""
+
+import hashlib
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def spread_offsets(keys: Iterable, window: float, jitter: float = 0.0) -> Dict:
+    """
+    Spread per-item start offsets evenly across a window
+    
+    Items are placed in a stable order (by hash) and their jitter is
+    derived from the same hash, so each item keeps exactly the same
+    offset from tick to tick and its samples stay evenly spaced, while
+    items still avoid lock-step with other pollers.
+    
+    Args:
+        keys: Items to schedule (e.g. switch DPIDs)
+        window: Seconds to spread the items over
+        jitter: Fraction of one slot each item may be shifted by
+    
+    Returns:
+        Dictionary mapping each key to its offset in seconds
+    """
+    digests = {key: hashlib.md5(str(key).encode()).hexdigest() for key in set(keys)}
+    keys = sorted(digests, key=digests.get)
+    if not keys or window <= 0:
+        return {key: 0.0 for key in keys}
+    
+    slot = window / len(keys)
+    offsets = {}
+    for i, key in enumerate(keys):
+        shift = random.Random(digests[key]).uniform(-jitter, jitter) * slot / 2
+        offsets[key] = min(max(0.0, i * slot + shift), window)
+    return offsets
+
+
+class ScheduledTask:
+    """A periodic task and its timing statistics"""
+    
+    def __init__(self, name: str, interval: float, func: Callable[[], None],
+                 phase: float = 0.0):
+        """
+        Initialize task
+        
+        Args:
+            name: Task name (unique per scheduler)
+            interval: Seconds between ticks
+            func: Function run on every tick
+            phase: Seconds after scheduler start of the first tick
+        """
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self.phase = phase
+        
+        self.next_run = 0.0
+        self.running = False
+        self.runs = 0
+        self.overruns = 0
+        self.failures = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.max_lateness = 0.0
+    
+    def to_dict(self) -> Dict:
+        """Timing statistics of the task"""
+        return {
+            "interval": self.interval,
+            "runs": self.runs,
+            "overruns": self.overruns,
+            "failures": self.failures,
+            "last_duration": self.last_duration,
+            "max_duration": self.max_duration,
+            "max_lateness": self.max_lateness
+        }
+
+
+class TieredScheduler:
+    """
+    Runs periodic tasks at fixed rates on a small worker pool
+    
+    Ticks are computed from the start time (start + k * interval), not
+    from when the previous run finished, so slow runs do not make the
+    period drift. A tick that finds the previous run of the same task
+    still going, or that is already more than one interval late, is
+    skipped and counted as an overrun instead of piling up.
+    """
+    
+    def __init__(self, max_workers: int = None):
+        """
+        Initialize scheduler
+        
+        Args:
+            max_workers: Tasks that may run at the same time
+        """
+        self._tasks: Dict[str, ScheduledTask] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or config.SCHEDULER_WORKERS,
+            thread_name_prefix='scheduler'
+        )
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+    
+    def add_task(self, name: str, interval: float, func: Callable[[], None],
+                 phase: float = 0.0) -> ScheduledTask:
+        """
+        Register a periodic task
+        
+        Args:
+            name: Task name
+            interval: Seconds between ticks
+            func: Function run on every tick
+            phase: Seconds after start of the first tick
+        
+        Returns:
+            The scheduled task
+        """
+        task = ScheduledTask(name, interval, func, phase)
+        with self._lock:
+            self._tasks[name] = task
+            if self._running:
+                task.next_run = time.monotonic() + phase
+        self._wakeup.set()
+        return task
+    
+    def start(self):
+        """Start ticking"""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            now = time.monotonic()
+            for task in self._tasks.values():
+                task.next_run = now + task.phase
+        
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        logger.info(f"Started scheduler with tasks: {', '.join(self._tasks)}")
+    
+    def stop(self):
+        """Stop ticking (runs in progress are allowed to finish)"""
+        self._running = False
+        self._wakeup.set()
+    
+    @property
+    def running(self) -> bool:
+        """Whether the scheduler is ticking"""
+        return self._running
+    
+    def stats(self) -> Dict[str, Dict]:
+        """Timing statistics of every task"""
+        with self._lock:
+            return {name: task.to_dict() for name, task in self._tasks.items()}
+    
+    def _loop(self):
+        """Scheduler thread: sleep until the next tick and dispatch it"""
+        while self._running:
+            self._wakeup.clear()
+            with self._lock:
+                due: List[ScheduledTask] = []
+                now = time.monotonic()
+                next_wake = now + 1.0
+                
+                for task in self._tasks.values():
+                    if task.next_run <= now:
+                        due.append(task)
+                        self._advance(task, now)
+                    next_wake = min(next_wake, task.next_run)
+            
+            for task in due:
+                self._dispatch(task)
+            
+            self._wakeup.wait(timeout=max(0.0, next_wake - time.monotonic()))
+    
+    def _advance(self, task: ScheduledTask, now: float):
+        """Move a task to its next tick on the fixed-rate grid"""
+        lateness = now - task.next_run
+        task.max_lateness = max(task.max_lateness, lateness)
+        task.next_run += task.interval
+        
+        if task.next_run <= now:
+            # Whole ticks were missed: count them and stay on the grid
+            missed = int((now - task.next_run) // task.interval) + 1
+            task.overruns += missed
+            task.next_run += missed * task.interval
+            logger.warning(f"Task {task.name} missed {missed} tick(s)")
+    
+    def _dispatch(self, task: ScheduledTask):
+        """Run a due task on the pool unless its previous run is still going"""
+        if task.running:
+            task.overruns += 1
+            logger.warning(f"Task {task.name} overran its {task.interval}s interval")
+            return
+        
+        task.running = True
+        self._executor.submit(self._run, task)
+    
+    def _run(self, task: ScheduledTask):
+        """Run a task and record its duration"""
+        started = time.monotonic()
+        try:
+            task.func()
+        except Exception as e:
+            task.failures += 1
+            logger.error(f"Task {task.name} failed: {e}")
+        finally:
+            task.last_duration = time.monotonic() - started
+            task.max_duration = max(task.max_duration, task.last_duration)
+            task.runs += 1
+            task.running = False
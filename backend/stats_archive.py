@@ -0,0 +1,367 @@
+"""
+Port Statistics Archive
+Columnar, memory-mapped on-disk archive of port counter samples
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+from typing import Dict, List, Optional
+import numpy as np
+import config
+from rate_engine import COUNTERS, RATES
+
+logger = logging.getLogger(__name__)
+
+# Fixed-width columns, one file per column in every segment
+COLUMN_TYPES = {
+    'timestamp': np.float64,
+    'dpid': np.uint64,
+    'port': np.uint32,
+    **{name: np.uint64 for name in COUNTERS},
+    **{name: np.float32 for name in RATES},
+}
+
+# Ryu reports the switch-local port by name
+_PORT_NUMBERS = {'LOCAL': 0xfffffffe}
+
+INDEX_FILE = 'index.json'
+
+
+class Segment:
+    """A fixed-capacity block of records stored as one memmap per column"""
+    
+    def __init__(self, path: str, capacity: int, count: int = 0, create: bool = False):
+        """
+        Open (or create) a segment
+        
+        Args:
+            path: Segment directory
+            capacity: Records the segment can hold
+            count: Records already written
+            create: Create the column files instead of opening them
+        """
+        self.path = path
+        self.capacity = capacity
+        self.count = count
+        
+        if create:
+            os.makedirs(path, exist_ok=True)
+        
+        mode = 'w+' if create else 'r+'
+        self.columns = {
+            name: np.memmap(os.path.join(path, f"{name}.bin"), dtype=dtype,
+                            mode=mode, shape=(capacity,))
+            for name, dtype in COLUMN_TYPES.items()
+        }
+    
+    @property
+    def full(self) -> bool:
+        """Whether the segment has no room left"""
+        return self.count >= self.capacity
+    
+    def append(self, records: Dict[str, np.ndarray]) -> int:
+        """
+        Append as many records as fit
+        
+        Args:
+            records: Column arrays of equal length
+        
+        Returns:
+            Number of records written
+        """
+        size = len(records['timestamp'])
+        written = min(size, self.capacity - self.count)
+        end = self.count + written
+        
+        for name, column in self.columns.items():
+            column[self.count:end] = records[name][:written]
+        
+        self.count = end
+        return written
+    
+    def flush(self):
+        """Flush dirty pages of every column to disk"""
+        for column in self.columns.values():
+            column.flush()
+    
+    def slice(self, start: float, end: float) -> Dict[str, np.ndarray]:
+        """
+        Get the records with start <= timestamp <= end
+        
+        The timestamp column is sorted, so this is two binary searches and
+        a zero-copy slice of every mapped column.
+        
+        Returns:
+            Column arrays (views into the mapped files)
+        """
+        times = self.columns['timestamp'][:self.count]
+        lo = np.searchsorted(times, start, side='left')
+        hi = np.searchsorted(times, end, side='right')
+        return {name: column[lo:hi] for name, column in self.columns.items()}
+    
+    def close(self):
+        """Release the column mappings (unmapped once no views remain)"""
+        self.columns = {}
+
+
+class StatsArchive:
+    """
+    Append-only archive of port stats samples in memory-mapped segments
+    
+    Every segment holds a fixed number of fixed-width records, stored
+    column by column. index.json keeps the time range of each segment, so
+    a range query only touches the segments it overlaps and slices their
+    mapped columns without parsing or loading the rest of the archive.
+    The oldest segments are deleted beyond max_segments.
+    
+    The index is only rewritten when a segment is started and on close;
+    after a crash the record count of the last segment is recovered from
+    its timestamp column.
+    """
+    
+    def __init__(self, path: str = None, segment_records: int = None,
+                 max_segments: int = None):
+        """
+        Open (or create) the archive
+        
+        Args:
+            path: Archive directory (default from config)
+            segment_records: Records per segment (default from config)
+            max_segments: Segments kept before the oldest is deleted
+        """
+        self.path = path or config.STATS_ARCHIVE_DIR
+        self.segment_records = segment_records or config.STATS_ARCHIVE_SEGMENT_RECORDS
+        self.max_segments = max_segments or config.STATS_ARCHIVE_MAX_SEGMENTS
+        
+        self._lock = threading.Lock()
+        self._segments: Dict[int, Segment] = {}
+        self._index: List[Dict] = []
+        self._last_timestamp = float('-inf')
+        
+        os.makedirs(self.path, exist_ok=True)
+        self._load_index()
+    
+    def _segment_path(self, segment_id: int) -> str:
+        """Directory of a segment"""
+        return os.path.join(self.path, f"segment_{segment_id:06d}")
+    
+    def _load_index(self):
+        """Read the segment index written by a previous run"""
+        index_path = os.path.join(self.path, INDEX_FILE)
+        if not os.path.exists(index_path):
+            return
+        
+        with open(index_path) as f:
+            data = json.load(f)
+        
+        if data.get('segment_records') != self.segment_records:
+            raise ValueError(
+                f"Archive at {self.path} uses {data.get('segment_records')} "
+                f"records per segment, not {self.segment_records}"
+            )
+        
+        self._index = data['segments']
+        if self._index:
+            self._recover_tail()
+    
+    def _recover_tail(self):
+        """Count records appended to the last segment after the index was saved"""
+        entry = self._index[-1]
+        timestamps = self._open_segment(entry).columns['timestamp']
+        
+        # Unwritten records are still zero-filled; sample times never are
+        count = entry['count'] + int(np.count_nonzero(timestamps[entry['count']:]))
+        if count > entry['count']:
+            logger.info(f"Recovered {count - entry['count']} stats archive records "
+                        f"in segment {entry['id']}")
+            entry['count'] = count
+            if entry['t_min'] is None:
+                entry['t_min'] = float(timestamps[0])
+            entry['t_max'] = float(timestamps[count - 1])
+        
+        if entry['t_max'] is not None:
+            self._last_timestamp = entry['t_max']
+    
+    def _save_index(self):
+        """Atomically rewrite the segment index"""
+        index_path = os.path.join(self.path, INDEX_FILE)
+        tmp_path = index_path + '.tmp'
+        
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'segment_records': self.segment_records,
+                'segments': self._index
+            }, f)
+        os.replace(tmp_path, index_path)
+    
+    def _open_segment(self, entry: Dict) -> Segment:
+        """Get the mapped segment for an index entry"""
+        segment = self._segments.get(entry['id'])
+        if segment is None:
+            segment = Segment(self._segment_path(entry['id']),
+                              self.segment_records, entry['count'])
+            self._segments[entry['id']] = segment
+        segment.count = entry['count']
+        return segment
+    
+    def _active_segment(self) -> Segment:
+        """Get the segment to append to, starting a new one if needed"""
+        if self._index and self._index[-1]['count'] < self.segment_records:
+            return self._open_segment(self._index[-1])
+        
+        segment_id = self._index[-1]['id'] + 1 if self._index else 0
+        entry = {'id': segment_id, 'count': 0, 't_min': None, 't_max': None}
+        segment = Segment(self._segment_path(segment_id), self.segment_records,
+                          create=True)
+        self._segments[segment_id] = segment
+        self._index.append(entry)
+        self._enforce_retention()
+        self._save_index()
+        return segment
+    
+    def _enforce_retention(self):
+        """Delete the oldest segments beyond max_segments"""
+        while len(self._index) > self.max_segments:
+            entry = self._index.pop(0)
+            segment = self._segments.pop(entry['id'], None)
+            if segment is not None:
+                segment.close()
+            shutil.rmtree(self._segment_path(entry['id']), ignore_errors=True)
+            logger.info(f"Deleted stats archive segment {entry['id']}")
+    
+    @staticmethod
+    def _port_number(port_no) -> int:
+        """Map a Ryu port number (int or reserved name) to an integer"""
+        if isinstance(port_no, str) and not port_no.isdigit():
+            return _PORT_NUMBERS.get(port_no, 0)
+        return int(port_no)
+    
+    def append(self, port_stats: Dict[str, List[Dict]], rates: Dict,
+               timestamp: float) -> int:
+        """
+        Append one polling sample
+        
+        Args:
+            port_stats: Ryu port stats, mapping DPID to list of port dicts
+            rates: Output of PortRateEngine.update() for the same sample
+            timestamp: Sample time in seconds
+        
+        Returns:
+            Number of records written
+        """
+        port_rates = rates.get('ports', {})
+        rows = []
+        for dpid, ports in port_stats.items():
+            for port in ports:
+                rate = port_rates.get(str(dpid), {}).get(port.get('port_no'), {})
+                rows.append(
+                    [int(dpid), self._port_number(port.get('port_no', 0))] +
+                    [port.get(name, 0) for name in COUNTERS] +
+                    [rate.get(name, np.nan) for name in RATES]
+                )
+        
+        if not rows:
+            return 0
+        
+        with self._lock:
+            # Keep the time column sorted even if the wall clock steps back
+            timestamp = max(timestamp, self._last_timestamp)
+            self._last_timestamp = timestamp
+            
+            records = {'timestamp': np.full(len(rows), timestamp)}
+            for i, name in enumerate(list(COLUMN_TYPES)[1:]):
+                records[name] = np.array([row[i] for row in rows],
+                                         dtype=COLUMN_TYPES[name])
+            
+            written = 0
+            while written < len(rows):
+                segment = self._active_segment()
+                count = segment.append(
+                    {name: column[written:] for name, column in records.items()}
+                )
+                written += count
+                
+                entry = self._index[-1]
+                entry['count'] = segment.count
+                if entry['t_min'] is None:
+                    entry['t_min'] = timestamp
+                entry['t_max'] = timestamp
+                
+                if segment.full:
+                    segment.flush()
+        
+        return written
+    
+    def query(self, start: float, end: float, dpid: Optional[int] = None,
+              port: Optional[int] = None, columns: Optional[List[str]] = None,
+              limit: Optional[int] = None) -> Dict:
+        """
+        Query archived records in a time range
+        
+        Args:
+            start: Range start timestamp
+            end: Range end timestamp
+            dpid: Only records of this switch
+            port: Only records of this port
+            columns: Subset of counter/rate columns (default all)
+            limit: Maximum number of records returned (default from config)
+        
+        Returns:
+            Dictionary with one list per column and a "truncated" flag
+        """
+        columns = columns or list(COUNTERS + RATES)
+        unknown = set(columns) - set(COLUMN_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown counters: {', '.join(sorted(unknown))}")
+        
+        limit = limit or config.STATS_ARCHIVE_MAX_QUERY_RECORDS
+        wanted = ['timestamp', 'dpid', 'port'] + [c for c in columns
+                                                  if c not in ('timestamp', 'dpid', 'port')]
+        
+        parts = {name: [] for name in wanted}
+        total = 0
+        
+        with self._lock:
+            for entry in self._index:
+                if entry['t_min'] is None or entry['t_max'] < start or entry['t_min'] > end:
+                    continue
+                
+                chunk = self._open_segment(entry).slice(start, end)
+                mask = np.ones(len(chunk['timestamp']), dtype=bool)
+                if dpid is not None:
+                    mask &= chunk['dpid'] == dpid
+                if port is not None:
+                    mask &= chunk['port'] == port
+                
+                # One record past the limit tells whether anything was cut off
+                selected = np.flatnonzero(mask)[:limit + 1 - total]
+                for name in wanted:
+                    parts[name].append(np.asarray(chunk[name][selected]))
+                
+                total += len(selected)
+                if total > limit:
+                    break
+        
+        result = {}
+        for name in wanted:
+            values = np.concatenate(parts[name])[:limit] if parts[name] else np.array([])
+            if COLUMN_TYPES[name] == np.float32:
+                result[name] = [None if np.isnan(v) else v for v in values.tolist()]
+            else:
+                result[name] = values.tolist()
+        
+        result['truncated'] = total > limit
+        return result
+    
+    def close(self):
+        """Flush and unmap all segments and save the index"""
+        with self._lock:
+            for segment in self._segments.values():
+                segment.flush()
+                segment.close()
+            self._segments = {}
+            if self._index:
+                self._save_index()
@@ -0,0 +1,310 @@
+"""
+Port Statistics History
+Bounded in-memory time-series store with automatic downsampling tiers
+"""
+
+import logging
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+import numpy as np
+import config
+from rate_engine import COUNTERS, RATES
+
+logger = logging.getLogger(__name__)
+
+# Columns stored per (dpid, port): cumulative counters, then rates
+COLUMNS = COUNTERS + RATES
+
+# Rollup rule per column: rates are averaged, counters keep the last value
+_MEAN_COLUMNS = np.array([name in RATES for name in COLUMNS])
+
+
+class RingBuffer:
+    """Fixed-capacity ring of (timestamp, row of COLUMNS) samples"""
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize ring buffer
+        
+        Args:
+            capacity: Maximum number of samples kept
+        """
+        self.capacity = capacity
+        self.times = np.full(capacity, np.nan)
+        self.values = np.full((capacity, len(COLUMNS)), np.nan)
+        self.head = 0
+        self.count = 0
+    
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the sample arrays"""
+        return self.times.nbytes + self.values.nbytes
+    
+    def append(self, timestamp: float, row: np.ndarray):
+        """Append a sample, overwriting the oldest one when full"""
+        self.times[self.head] = timestamp
+        self.values[self.head] = row
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+    
+    def oldest(self) -> Optional[float]:
+        """Timestamp of the oldest sample, or None if empty"""
+        if self.count == 0:
+            return None
+        return float(self.times[(self.head - self.count) % self.capacity])
+    
+    def range(self, start: float, end: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get samples with start <= timestamp <= end, oldest first
+        
+        Returns:
+            Tuple of (timestamps, values) arrays
+        """
+        order = (np.arange(self.count) + self.head - self.count) % self.capacity
+        times = self.times[order]
+        mask = (times >= start) & (times <= end)
+        return times[mask], self.values[order][mask]
+
+
+class Rollup:
+    """Accumulates raw samples into fixed-resolution buckets"""
+    
+    def __init__(self, resolution: float, capacity: int):
+        """
+        Initialize rollup tier
+        
+        Args:
+            resolution: Bucket width in seconds
+            capacity: Number of buckets kept
+        """
+        self.resolution = resolution
+        self.buffer = RingBuffer(capacity)
+        self._bucket: Optional[float] = None
+        self._sum = np.zeros(len(COLUMNS))
+        self._count = np.zeros(len(COLUMNS))
+        self._last = np.full(len(COLUMNS), np.nan)
+    
+    def add(self, timestamp: float, row: np.ndarray):
+        """Add a raw sample, flushing the previous bucket if it is complete"""
+        bucket = math.floor(timestamp / self.resolution) * self.resolution
+        
+        if self._bucket is not None and bucket != self._bucket:
+            self._flush()
+        
+        self._bucket = bucket
+        present = ~np.isnan(row)
+        self._sum[present] += row[present]
+        self._count[present] += 1
+        self._last[present] = row[present]
+    
+    def _flush(self):
+        """Write the current bucket to the ring buffer"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = self._sum / self._count
+        row = np.where(_MEAN_COLUMNS, mean, self._last)
+        self.buffer.append(self._bucket, row)
+        
+        self._sum[:] = 0
+        self._count[:] = 0
+        self._last[:] = np.nan
+
+
+class PortHistory:
+    """Raw samples plus rollup tiers for a single (dpid, port)"""
+    
+    def __init__(self, raw_capacity: int, tiers: List[Tuple[str, float, int]]):
+        """
+        Initialize port history
+        
+        Args:
+            raw_capacity: Raw samples kept
+            tiers: Rollup tiers as (name, resolution seconds, samples)
+        """
+        self.raw = RingBuffer(raw_capacity)
+        self.rollups = OrderedDict(
+            (name, Rollup(resolution, capacity)) for name, resolution, capacity in tiers
+        )
+    
+    @property
+    def nbytes(self) -> int:
+        """Memory used by all tiers"""
+        return self.raw.nbytes + sum(r.buffer.nbytes for r in self.rollups.values())
+    
+    def add(self, timestamp: float, row: np.ndarray):
+        """Append a raw sample and feed it to every rollup tier"""
+        self.raw.append(timestamp, row)
+        for rollup in self.rollups.values():
+            rollup.add(timestamp, row)
+    
+    def tiers(self) -> List[Tuple[str, float, RingBuffer]]:
+        """All tiers, finest first, as (name, resolution, buffer)"""
+        return ([('raw', 0.0, self.raw)] +
+                [(name, r.resolution, r.buffer) for name, r in self.rollups.items()])
+
+
+def downsample(times: np.ndarray, values: np.ndarray,
+               step: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Re-bucket samples to a coarser step
+    
+    Rates are averaged and counters keep their last value per bucket.
+    
+    Args:
+        times: Sample timestamps, oldest first
+        values: Sample rows of COLUMNS
+        step: Bucket width in seconds
+    
+    Returns:
+        Tuple of (bucket start timestamps, values)
+    """
+    if len(times) == 0 or step <= 0:
+        return times, values
+    
+    buckets = np.floor(times / step) * step
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(times)] - 1
+    
+    present = ~np.isnan(values)
+    sums = np.add.reduceat(np.where(present, values, 0.0), starts)
+    counts = np.add.reduceat(present, starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+    
+    return buckets[starts], np.where(_MEAN_COLUMNS, means, values[ends])
+
+
+class StatsHistory:
+    """
+    Bounded history of port counters and rates
+    
+    Each (dpid, port) gets a raw ring buffer plus one ring per rollup tier,
+    all preallocated, so memory is capped at max_ports times a fixed
+    per-port size regardless of uptime. When the cap is reached the least
+    recently updated port is evicted.
+    """
+    
+    def __init__(self, max_ports: int = None, raw_samples: int = None,
+                 tiers: List[Tuple[str, float, int]] = None):
+        """
+        Initialize stats history
+        
+        Args:
+            max_ports: Maximum number of (dpid, port) series kept
+            raw_samples: Raw samples kept per port
+            tiers: Rollup tiers as (name, resolution seconds, samples)
+        """
+        self.max_ports = max_ports or config.STATS_HISTORY_MAX_PORTS
+        self.raw_samples = raw_samples or config.STATS_HISTORY_RAW_SAMPLES
+        self.tier_config = tiers or config.STATS_HISTORY_TIERS
+        
+        self._ports: 'OrderedDict[Tuple[str, Hashable], PortHistory]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @property
+    def nbytes(self) -> int:
+        """Memory currently used by sample arrays"""
+        with self._lock:
+            return sum(history.nbytes for history in self._ports.values())
+    
+    def _history_for(self, key: Tuple[str, Hashable]) -> PortHistory:
+        """Get (or allocate) the history of a port, evicting if full"""
+        history = self._ports.get(key)
+        if history is None:
+            if len(self._ports) >= self.max_ports:
+                evicted, _ = self._ports.popitem(last=False)
+                logger.warning(f"Stats history full, evicting {evicted}")
+            history = PortHistory(self.raw_samples, self.tier_config)
+            self._ports[key] = history
+        else:
+            self._ports.move_to_end(key)
+        return history
+    
+    def record(self, port_stats: Dict[str, List[Dict]], rates: Dict,
+               timestamp: float):
+        """
+        Record one polling sample
+        
+        Args:
+            port_stats: Ryu port stats, mapping DPID to list of port dicts
+            rates: Output of PortRateEngine.update() for the same sample
+            timestamp: Sample time in seconds
+        """
+        port_rates = rates.get('ports', {})
+        
+        with self._lock:
+            for dpid, ports in port_stats.items():
+                for port in ports:
+                    port_no = port.get('port_no')
+                    rate = port_rates.get(str(dpid), {}).get(port_no, {})
+                    
+                    row = np.array(
+                        [port.get(name, np.nan) for name in COUNTERS] +
+                        [rate.get(name, np.nan) for name in RATES],
+                        dtype=np.float64
+                    )
+                    self._history_for((str(dpid), port_no)).add(timestamp, row)
+    
+    def query(self, dpid: str, port_no: Hashable, start: float, end: float,
+              step: float = 0.0, columns: Optional[List[str]] = None) -> Optional[Dict]:
+        """
+        Query the history of a port
+        
+        Picks the coarsest tier whose resolution does not exceed step and
+        falls back to coarser tiers when the finer ones no longer reach
+        back to start. Results are re-bucketed to step if it is coarser
+        than the tier.
+        
+        Args:
+            dpid: Switch DPID as used in the port stats keys
+            port_no: Port number
+            start: Range start timestamp
+            end: Range end timestamp
+            step: Desired sample spacing in seconds (0 for raw)
+            columns: Subset of COLUMNS to return (default all)
+        
+        Returns:
+            Dictionary with timestamps and one list per column, or None if
+            the port has no history
+        """
+        columns = columns or list(COLUMNS)
+        unknown = set(columns) - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown counters: {', '.join(sorted(unknown))}")
+        
+        with self._lock:
+            history = self._ports.get((str(dpid), port_no))
+            if history is None:
+                return None
+            
+            tiers = history.tiers()
+            finest = len([t for t in tiers if t[1] <= step]) - 1
+            usable = [t for t in tiers[max(finest, 0):] if t[2].count > 0]
+            covering = [t for t in usable if t[2].oldest() <= start]
+            
+            if covering:
+                name, resolution, buffer = covering[0]
+            elif usable:
+                # Nothing reaches back far enough: use the longest history
+                name, resolution, buffer = min(usable, key=lambda t: t[2].oldest())
+            else:
+                name, resolution, buffer = tiers[max(finest, 0)]
+            
+            times, values = buffer.range(start, end)
+        
+        if step > resolution:
+            times, values = downsample(times, values, step)
+        
+        indexes = [COLUMNS.index(column) for column in columns]
+        return {
+            "dpid": str(dpid),
+            "port": port_no,
+            "tier": name,
+            "step": max(step, resolution),
+            "timestamps": times.tolist(),
+            "series": {
+                column: [None if np.isnan(v) else v for v in values[:, i].tolist()]
+                for column, i in zip(columns, indexes)
+            }
+        }
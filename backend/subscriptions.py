@@ -0,0 +1,251 @@
+"""
+Client Subscriptions
+Tracks which switches, ports and event kinds each Socket.IO client wants
+"""
+
+import hashlib
+import json
+import threading
+from typing import Dict, FrozenSet, Iterable, Optional, Set
+
+# Event kinds a client can subscribe to
+EVENT_KINDS = ('stats', 'flows', 'topology')
+
+
+def normalize_dpid(dpid) -> str:
+    """
+    Convert a DPID to the decimal string used as key in Ryu port stats
+    
+    Args:
+        dpid: DPID as int, decimal string or 16-digit hex string
+    
+    Returns:
+        Decimal DPID string
+    """
+    if isinstance(dpid, int):
+        return str(dpid)
+    dpid = str(dpid)
+    if len(dpid) == 16 or not dpid.isdigit():
+        return str(int(dpid, 16))
+    return dpid
+
+
+def normalize_port(port):
+    """Convert a port number to the form used in Ryu port stats"""
+    if isinstance(port, str) and port.isdigit():
+        return int(port)
+    return port
+
+
+class Subscription:
+    """
+    What a client wants to receive
+    
+    None for dpids, ports or events means "everything".
+    """
+    
+    def __init__(self, dpids: Optional[Iterable] = None,
+                 ports: Optional[Iterable] = None,
+                 events: Optional[Iterable[str]] = None):
+        """
+        Initialize subscription
+        
+        Args:
+            dpids: Switch DPIDs to receive stats for
+            ports: Port numbers to receive stats for (on every switch)
+            events: Event kinds to receive (see EVENT_KINDS)
+        
+        Raises:
+            TypeError: If dpids, ports or events is not a list
+            ValueError: If an unknown event kind is given
+        """
+        for name, values in (('dpids', dpids), ('ports', ports), ('events', events)):
+            # A string would otherwise be read one character at a time
+            if values is not None and not isinstance(values, (list, tuple, set, frozenset)):
+                raise TypeError(f"{name} must be a list")
+        
+        self.dpids: Optional[FrozenSet[str]] = (
+            frozenset(normalize_dpid(d) for d in dpids) if dpids is not None else None
+        )
+        self.ports: Optional[FrozenSet] = (
+            frozenset(normalize_port(p) for p in ports) if ports is not None else None
+        )
+        self.events: FrozenSet[str] = (
+            frozenset(events) if events is not None else frozenset(EVENT_KINDS)
+        )
+        
+        unknown = self.events - set(EVENT_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown event kinds: {', '.join(sorted(unknown))}")
+    
+    @property
+    def is_everything(self) -> bool:
+        """Whether this is the default, unfiltered subscription"""
+        return (self.dpids is None and self.ports is None and
+                self.events == frozenset(EVENT_KINDS))
+    
+    @property
+    def room(self) -> str:
+        """
+        Socket.IO room shared by every client with this subscription
+        
+        Returns:
+            Room name derived from the subscription content
+        """
+        if self.is_everything:
+            return 'sub:all'
+        digest = hashlib.sha1(json.dumps(self.to_dict(), sort_keys=True).encode())
+        return f"sub:{digest.hexdigest()[:16]}"
+    
+    def wants(self, kind: str) -> bool:
+        """Whether events of this kind should be sent"""
+        return kind in self.events
+    
+    def wants_port(self, dpid: str, port_no) -> bool:
+        """Whether stats of this switch port should be sent"""
+        return ((self.dpids is None or str(dpid) in self.dpids) and
+                (self.ports is None or port_no in self.ports))
+    
+    def to_dict(self) -> Dict:
+        """Serializable form (lists sorted for stable room names)"""
+        return {
+            "dpids": sorted(self.dpids) if self.dpids is not None else None,
+            "ports": sorted(self.ports, key=str) if self.ports is not None else None,
+            "events": sorted(self.events)
+        }
+    
+    def slice_stats(self, stats_data: Dict) -> Dict:
+        """
+        Cut a stats_update payload down to this subscription
+        
+        Totals are recomputed over the ports that remain.
+        
+        Args:
+            stats_data: Full stats_update payload
+        
+        Returns:
+            Payload with only the subscribed switches and ports
+        """
+        if self.dpids is None and self.ports is None:
+            return stats_data
+        
+        port_stats = {}
+        for dpid, ports in stats_data.get('port_stats', {}).items():
+            kept = [p for p in ports if self.wants_port(dpid, p.get('port_no'))]
+            if kept:
+                port_stats[dpid] = kept
+        
+        port_rates = {}
+        for dpid, ports in stats_data.get('port_rates', {}).items():
+            kept = {p: r for p, r in ports.items() if self.wants_port(dpid, p)}
+            if kept:
+                port_rates[dpid] = kept
+        
+        total_rates = {}
+        for ports in port_rates.values():
+            for rates in ports.values():
+                for name, value in rates.items():
+                    total_rates[name] = total_rates.get(name, 0.0) + value
+        
+        ports = [p for ps in port_stats.values() for p in ps]
+        return dict(
+            stats_data,
+            port_stats=port_stats,
+            port_rates=port_rates,
+            total_rates=total_rates,
+            total_packets=sum(p.get('rx_packets', 0) + p.get('tx_packets', 0) for p in ports),
+            total_bytes=sum(p.get('rx_bytes', 0) + p.get('tx_bytes', 0) for p in ports)
+        )
+    
+    def slice_flows(self, flow_data: Dict) -> Dict:
+        """
+        Cut a flow_stats_update payload down to the subscribed switches
+        
+        Args:
+            flow_data: Full flow_stats_update payload
+        
+        Returns:
+            Payload with only the subscribed switches
+        """
+        if self.dpids is None:
+            return flow_data
+        
+        flows = {dpid: stats for dpid, stats in flow_data.get('flows', {}).items()
+                 if str(dpid) in self.dpids}
+        return dict(flow_data, flows=flows)
+
+
+class SubscriptionRegistry:
+    """Subscriptions of all connected clients, keyed by Socket.IO sid"""
+    
+    def __init__(self):
+        """Initialize an empty registry"""
+        self._subscriptions: Dict[str, Subscription] = {}
+        self._lock = threading.Lock()
+    
+    def set(self, sid: str, subscription: Subscription) -> Optional[str]:
+        """
+        Set a client's subscription
+        
+        Args:
+            sid: Socket.IO session id
+            subscription: New subscription
+        
+        Returns:
+            The client's previous room, or None if it had none
+        """
+        with self._lock:
+            previous = self._subscriptions.get(sid)
+            self._subscriptions[sid] = subscription
+        return previous.room if previous is not None else None
+    
+    def get(self, sid: str) -> Optional[Subscription]:
+        """Get a client's subscription"""
+        with self._lock:
+            return self._subscriptions.get(sid)
+    
+    def remove(self, sid: str):
+        """Forget a disconnected client"""
+        with self._lock:
+            self._subscriptions.pop(sid, None)
+    
+    def rooms(self) -> Dict[str, Subscription]:
+        """
+        Rooms with at least one member
+        
+        Returns:
+            Dictionary mapping room name to its subscription
+        """
+        with self._lock:
+            return {s.room: s for s in self._subscriptions.values()}
+    
+    def wants_stats(self, kind: str = 'stats') -> bool:
+        """Whether any connected client wants stats ('stats' or 'flows') updates"""
+        with self._lock:
+            return any(s.wants(kind) for s in self._subscriptions.values())
+    
+    def wanted_dpids(self, kind: str = 'stats') -> Optional[Set[str]]:
+        """
+        Switches that subscribers of an event kind care about
+        
+        Args:
+            kind: Event kind ('stats' for port stats, 'flows' for flow stats)
+        
+        Returns:
+            None if some subscriber wants every switch, otherwise the
+            union of subscribed DPIDs (empty if nobody wants stats)
+        """
+        with self._lock:
+            wanted = set()
+            for subscription in self._subscriptions.values():
+                if not subscription.wants(kind):
+                    continue
+                if subscription.dpids is None:
+                    return None
+                wanted |= subscription.dpids
+            return wanted
+    
+    def __len__(self) -> int:
+        """Number of connected clients"""
+        with self._lock:
+            return len(self._subscriptions)
@@ -0,0 +1,257 @@
+"""
+Topology Snapshot Cache
+Versioned, content-hashed cache of the D3.js topology snapshot
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def _edge_key(edge: Dict) -> str:
+    """Identify an edge by its endpoints (matches the frontend's key)"""
+    return f"{edge['source']}-{edge['target']}"
+
+
+def _diff_items(old: List[Dict], new: List[Dict], key: Callable[[Dict], str]) -> Dict:
+    """
+    Diff two lists of dicts identified by key
+    
+    Returns:
+        Dictionary with "added", "removed" (keys only) and "changed" lists
+    """
+    old_by_key = {key(item): item for item in old}
+    new_by_key = {key(item): item for item in new}
+    
+    return {
+        "added": [item for k, item in new_by_key.items() if k not in old_by_key],
+        "removed": [k for k in old_by_key if k not in new_by_key],
+        "changed": [item for k, item in new_by_key.items()
+                    if k in old_by_key and old_by_key[k] != item]
+    }
+
+
+def diff_snapshots(old: Dict, new: Dict) -> Dict:
+    """
+    Compute the delta between two topology snapshots
+    
+    Args:
+        old: Previous snapshot (with "version")
+        new: New snapshot (with "version")
+    
+    Returns:
+        Delta with node/edge changes keyed by id, plus the new values of
+        the remaining top-level fields (counts, topology_type, ...)
+    """
+    return {
+        "from_version": old.get('version', 0),
+        "version": new.get('version', 0),
+        "nodes": _diff_items(old.get('nodes', []), new.get('nodes', []),
+                             lambda node: node['id']),
+        "edges": _diff_items(old.get('edges', []), new.get('edges', []), _edge_key),
+        "meta": {k: v for k, v in new.items()
+                 if k not in ('nodes', 'edges', 'version')}
+    }
+
+
+def delta_size(delta: Dict) -> int:
+    """Count the node and edge changes carried by a delta"""
+    return sum(len(delta[part][kind])
+               for part in ('nodes', 'edges')
+               for kind in ('added', 'removed', 'changed'))
+
+
+class TopologyCache:
+    """
+    Cache for the formatted topology snapshot
+    
+    Every distinct snapshot gets a monotonically increasing version and a
+    content hash (used as the HTTP ETag). The version only moves when the
+    content actually changes, so unchanged topologies keep their ETag and
+    can be answered with 304 Not Modified.
+    """
+    
+    def __init__(self, builder: Callable[[], Dict],
+                 refresh_interval: float = None, max_age: float = None,
+                 retry_backoff: float = None):
+        """
+        Initialize topology cache
+        
+        Args:
+            builder: Function that builds a fresh snapshot from Ryu
+            refresh_interval: Seconds between scheduled refresh() calls
+            max_age: Seconds after which get() rebuilds a stale snapshot
+            retry_backoff: Seconds get() serves a stale snapshot after a
+                failed rebuild (doubles per consecutive failure)
+        """
+        self._builder = builder
+        self.refresh_interval = refresh_interval or config.TOPOLOGY_REFRESH_INTERVAL
+        self.max_age = max_age or config.TOPOLOGY_CACHE_MAX_AGE
+        self.retry_backoff = retry_backoff or config.TOPOLOGY_RETRY_BACKOFF
+        
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._snapshot: Optional[Dict] = None
+        self._etag: Optional[str] = None
+        self._updated_at = 0.0
+        self._retry_at = 0.0  # stale reads do not rebuild before this time
+        self._failures = 0  # consecutive failed rebuilds
+        self.version = 0
+        
+        self._listeners: List[Callable[[Dict, Optional[Dict]], None]] = []
+    
+    @staticmethod
+    def content_hash(snapshot: Dict) -> str:
+        """
+        Compute a stable hash of a snapshot's content
+        
+        Args:
+            snapshot: Topology snapshot (the "version" key is ignored)
+        
+        Returns:
+            Hex SHA-1 digest of the canonical JSON encoding
+        """
+        content = {k: v for k, v in snapshot.items() if k != 'version'}
+        encoded = json.dumps(content, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+    
+    def add_listener(self, callback: Callable[[Dict, Optional[Dict]], None]):
+        """
+        Register a callback invoked on every change
+        
+        Args:
+            callback: Function taking the new snapshot and the delta from
+                the previous one (None for the first snapshot)
+        """
+        self._listeners.append(callback)
+    
+    def _store(self, snapshot: Dict) -> bool:
+        """
+        Store a snapshot, bumping the version if its content changed
+        
+        Args:
+            snapshot: Freshly built topology snapshot
+        
+        Returns:
+            True if the content changed
+        """
+        etag = self.content_hash(snapshot)
+        
+        with self._lock:
+            self._updated_at = time.monotonic()
+            if etag == self._etag:
+                return False
+            
+            previous = self._snapshot
+            self.version += 1
+            self._etag = etag
+            self._snapshot = dict(snapshot, version=self.version)
+            current = self._snapshot
+        
+        delta = diff_snapshots(previous, current) if previous is not None else None
+        
+        for callback in self._listeners:
+            try:
+                callback(current, delta)
+            except Exception as e:
+                logger.error(f"Topology listener failed: {e}")
+        
+        return True
+    
+    def refresh(self) -> bool:
+        """
+        Rebuild the snapshot from Ryu
+        
+        A snapshot that failed outright (has an "error" key) does not
+        replace a good one, and neither does a "partial" snapshot replace
+        a complete one.
+        
+        Returns:
+            True if the content changed
+        """
+        with self._refresh_lock:
+            return self._rebuild()
+    
+    def _rebuild(self) -> bool:
+        """Build and store a snapshot (caller holds the refresh lock)"""
+        snapshot = self._builder()
+        
+        reason = self._rejection(snapshot)
+        if reason:
+            # Back off, so readers get the cached snapshot during an outage
+            # instead of queueing behind one slow rebuild after another
+            self._failures += 1
+            backoff = min(max(self.max_age, self.retry_backoff),
+                          self.retry_backoff * 2 ** (self._failures - 1))
+            with self._lock:
+                self._retry_at = time.monotonic() + backoff
+            logger.warning(f"Keeping cached topology: {reason} "
+                           f"(next rebuild on read in {backoff:.1f}s)")
+            return False
+        
+        self._failures = 0
+        return self._store(snapshot)
+    
+    def _rejection(self, snapshot: Dict[str, Any]) -> Optional[str]:
+        """
+        Check whether a new snapshot must not replace the cached one
+        
+        Args:
+            snapshot: Freshly built snapshot
+        
+        Returns:
+            Reason for keeping the cached snapshot, or None to store it
+        """
+        current = self._snapshot
+        if current is None:
+            return None
+        if 'error' in snapshot:
+            return snapshot['error']
+        if snapshot.get('partial') and not current.get('partial'):
+            return f"partial snapshot ({', '.join(sorted(snapshot.get('errors', {})))} failed)"
+        return None
+    
+    def _is_fresh(self) -> bool:
+        """Check whether the cached snapshot is present and recent (or backing off)"""
+        with self._lock:
+            now = time.monotonic()
+            return (self._snapshot is not None and
+                    (now - self._updated_at < self.max_age or now < self._retry_at))
+    
+    def reset(self, snapshot: Dict) -> bool:
+        """
+        Replace the cached snapshot without asking Ryu
+        
+        Args:
+            snapshot: Snapshot to publish (e.g. an empty topology)
+        
+        Returns:
+            True if the content changed
+        """
+        with self._refresh_lock:
+            return self._store(snapshot)
+    
+    def get(self) -> Tuple[Dict, str]:
+        """
+        Get the current snapshot, rebuilding it if missing or stale
+        
+        Concurrent readers of a stale snapshot share a single rebuild
+        instead of each hitting Ryu.
+        
+        Returns:
+            Tuple of (snapshot, etag)
+        """
+        if not self._is_fresh():
+            with self._refresh_lock:
+                # Another reader may have rebuilt it while we waited
+                if not self._is_fresh():
+                    self._rebuild()
+        
+        with self._lock:
+            return self._snapshot, self._etag
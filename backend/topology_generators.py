@@ -0,0 +1,335 @@
+"""
+Topology Generators
+Declarative specs for large topologies and host address allocation
+"""
+
+import ipaddress
+import math
+import random
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import config
+
+
+class TopologySpec:
+    """
+    Switch graph with attached hosts, independent of Mininet
+    
+    Switches are numbered 1..N (the number is also the DPID) and hosts are
+    numbered in list order, host i+1 being attached to switch hosts[i].
+    """
+    
+    def __init__(self, switches: int, links: List[Tuple[int, int]], hosts: List[int]):
+        """
+        Initialize spec
+        
+        Args:
+            switches: Number of switches
+            links: Switch-to-switch links as (switch, switch) numbers
+            hosts: Switch number each host is attached to
+        """
+        self.switches = switches
+        self.links = links
+        self.hosts = hosts
+    
+    def validate(self):
+        """
+        Check the spec describes a buildable network
+        
+        Raises:
+            ValueError: For unknown switches, self loops or duplicate links
+        """
+        if self.switches < 1:
+            raise ValueError("A topology needs at least one switch")
+        
+        seen: Set[frozenset] = set()
+        for a, b in self.links:
+            for n in (a, b):
+                if not 1 <= n <= self.switches:
+                    raise ValueError(f"Link to unknown switch s{n}")
+            if a == b:
+                raise ValueError(f"Self loop on s{a}")
+            if frozenset((a, b)) in seen:
+                raise ValueError(f"Duplicate link s{a}-s{b}")
+            seen.add(frozenset((a, b)))
+        
+        for n in self.hosts:
+            if not 1 <= n <= self.switches:
+                raise ValueError(f"Host attached to unknown switch s{n}")
+    
+    def to_dict(self) -> Dict:
+        """Summary counts in MininetManager.create result format"""
+        return {
+            "switches": self.switches,
+            "hosts": len(self.hosts),
+            "links": len(self.links) + len(self.hosts)
+        }
+
+
+def fat_tree(k: int) -> TopologySpec:
+    """
+    k-ary fat-tree: (k/2)² core switches and k pods of k/2 aggregation and
+    k/2 edge switches, each edge switch serving k/2 hosts
+    
+    Args:
+        k: Switch port count (even)
+    """
+    if k < 2 or k % 2:
+        raise ValueError("Fat-tree k must be an even number")
+    
+    half = k // 2
+    n = half * half  # core switches are 1..(k/2)²
+    links = []
+    hosts = []
+    
+    for pod in range(k):
+        aggregation = list(range(n + 1, n + half + 1))
+        edge = list(range(n + half + 1, n + k + 1))
+        n += k
+        
+        for i, agg in enumerate(aggregation):
+            # Aggregation switch i uplinks to core group i
+            links += [(agg, i * half + j + 1) for j in range(half)]
+            links += [(agg, e) for e in edge]
+        for e in edge:
+            hosts += [e] * half
+    
+    return TopologySpec(n, links, hosts)
+
+
+def leaf_spine(leaves: int, spines: Optional[int] = None,
+               hosts_per_leaf: Optional[int] = None) -> TopologySpec:
+    """
+    Two-tier Clos: every leaf links to every spine, hosts hang off leaves
+    
+    Args:
+        leaves: Number of leaf switches
+        spines: Number of spine switches (default: one per four leaves, at least 2)
+        hosts_per_leaf: Hosts on each leaf
+    """
+    spines = spines or max(2, math.ceil(leaves / 4))
+    hosts_per_leaf = hosts_per_leaf or config.LEAF_SPINE_HOSTS_PER_LEAF
+    
+    # Spines are 1..S, leaves S+1..S+L
+    leaf_numbers = range(spines + 1, spines + leaves + 1)
+    links = [(leaf, spine) for leaf in leaf_numbers for spine in range(1, spines + 1)]
+    hosts = [leaf for leaf in leaf_numbers for _ in range(hosts_per_leaf)]
+    
+    return TopologySpec(spines + leaves, links, hosts)
+
+
+def torus(n: int) -> TopologySpec:
+    """
+    n×n 2D torus: a grid whose rows and columns wrap around, one host per switch
+    
+    Args:
+        n: Switches per row and column (at least 3)
+    """
+    if n < 3:
+        raise ValueError("A torus needs at least 3 switches per side")
+    
+    def number(row: int, col: int) -> int:
+        return (row % n) * n + (col % n) + 1
+    
+    links = []
+    for row in range(n):
+        for col in range(n):
+            links.append((number(row, col), number(row, col + 1)))
+            links.append((number(row, col), number(row + 1, col)))
+    
+    return TopologySpec(n * n, links, list(range(1, n * n + 1)))
+
+
+def random_regular(n: int, degree: Optional[int] = None,
+                   seed: Optional[int] = None) -> TopologySpec:
+    """
+    Connected random graph where every switch has the same degree, one host
+    per switch (a Jellyfish-style fabric)
+    
+    Args:
+        n: Number of switches
+        degree: Links per switch
+        seed: Random seed for a reproducible graph
+    """
+    degree = degree or config.RANDOM_REGULAR_DEGREE
+    if degree >= n or (n * degree) % 2:
+        raise ValueError(f"No {degree}-regular graph on {n} switches")
+    
+    rng = random.Random(seed)
+    for _ in range(100):
+        links = _pair_stubs(n, degree, rng)
+        if links is not None and _connected(n, links):
+            return TopologySpec(n, links, list(range(1, n + 1)))
+    
+    raise ValueError(f"Could not generate a connected {degree}-regular graph on {n} switches")
+
+
+def _pair_stubs(n: int, degree: int, rng: random.Random) -> Optional[List[Tuple[int, int]]]:
+    """
+    Randomly pair link stubs, skipping loops and repeats
+    
+    Returns:
+        Links, or None if the pairing got stuck and must be restarted
+    """
+    stubs = [s for s in range(1, n + 1) for _ in range(degree)]
+    edges: Set[frozenset] = set()
+    links = []
+    failures = 0
+    
+    while stubs:
+        i, j = rng.randrange(len(stubs)), rng.randrange(len(stubs))
+        a, b = stubs[i], stubs[j]
+        if a == b or frozenset((a, b)) in edges:
+            failures += 1
+            if failures > 10 * len(stubs):
+                return None
+            continue
+        
+        edges.add(frozenset((a, b)))
+        links.append((a, b))
+        for index in sorted((i, j), reverse=True):
+            stubs[index] = stubs[-1]
+            stubs.pop()
+        failures = 0
+    
+    return links
+
+
+def _connected(n: int, links: Iterable[Tuple[int, int]]) -> bool:
+    """Whether switches 1..n form a single component"""
+    adjacency: Dict[int, List[int]] = {s: [] for s in range(1, n + 1)}
+    for a, b in links:
+        adjacency[a].append(b)
+        adjacency[b].append(a)
+    
+    seen = {1}
+    stack = [1]
+    while stack:
+        for neighbor in adjacency[stack.pop()]:
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return len(seen) == n
+
+
+def _switch_number(ref) -> int:
+    """Switch number from 3 or 's3'"""
+    if isinstance(ref, str) and ref[:1] == 's':
+        ref = ref[1:]
+    try:
+        return int(ref)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid switch reference: {ref}")
+
+
+def _host_count(value, what: str) -> int:
+    """Non-negative host count, or ValueError naming what it is for"""
+    try:
+        count = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid host count for {what}: {value}")
+    if count < 0:
+        raise ValueError(f"Invalid host count for {what}: {value}")
+    return count
+
+
+def from_spec(data: Dict) -> TopologySpec:
+    """
+    Build a spec from its declarative form
+    
+    Example:
+        {
+            "switches": 3,
+            "links": [["s1", "s2"], ["s2", "s3"]],
+            "hosts_per_switch": 1,
+            "hosts": {"s3": 4}
+        }
+    
+    "hosts" overrides the per-switch host count for individual switches.
+    
+    Args:
+        data: Parsed JSON spec (the request body)
+    
+    Returns:
+        Validated topology spec
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Topology spec must be an object")
+    
+    try:
+        switches = int(data['switches'])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("Topology spec needs a 'switches' count")
+    if switches > config.CUSTOM_TOPOLOGY_MAX_SWITCHES:
+        raise ValueError(f"Custom topologies are limited to "
+                         f"{config.CUSTOM_TOPOLOGY_MAX_SWITCHES} switches")
+    
+    if not isinstance(data.get('links', []), list):
+        raise ValueError("'links' must be a list of [switch, switch] pairs")
+    links = []
+    for link in data.get('links', []):
+        if not isinstance(link, (list, tuple)) or len(link) != 2:
+            raise ValueError(f"Invalid link: {link}")
+        links.append((_switch_number(link[0]), _switch_number(link[1])))
+    
+    if not isinstance(data.get('hosts', {}), dict):
+        raise ValueError("'hosts' must map switches to host counts")
+    default = _host_count(data.get('hosts_per_switch', 1), 'hosts_per_switch')
+    per_switch = {s: default for s in range(1, switches + 1)}
+    for ref, count in data.get('hosts', {}).items():
+        per_switch[_switch_number(ref)] = _host_count(count, ref)
+    
+    total = sum(per_switch.values())
+    if total > config.CUSTOM_TOPOLOGY_MAX_HOSTS:
+        raise ValueError(f"Custom topologies are limited to "
+                         f"{config.CUSTOM_TOPOLOGY_MAX_HOSTS} hosts (spec has {total})")
+    hosts = [s for s, count in sorted(per_switch.items()) for _ in range(count)]
+    
+    spec = TopologySpec(switches, links, hosts)
+    spec.validate()
+    return spec
+
+
+# Generated topology types, by name, taking the requested size
+GENERATORS = {
+    'fat_tree': fat_tree,
+    'leaf_spine': leaf_spine,
+    'torus': torus,
+    'random_regular': random_regular,
+}
+
+
+def size_limits(topology_type: str) -> Tuple[int, int]:
+    """Allowed (min, max) size of a topology type"""
+    return config.TOPOLOGY_SIZE_LIMITS.get(topology_type, (config.MIN_SIZE, config.MAX_SIZE))
+
+
+class AddressAllocator:
+    """Sequential host addresses from config.HOST_NETWORK"""
+    
+    def __init__(self, network: str = None):
+        """
+        Initialize allocator
+        
+        Args:
+            network: Host network in CIDR form (default from config)
+        """
+        self.network = ipaddress.ip_network(network or config.HOST_NETWORK)
+    
+    def address(self, index: int) -> str:
+        """
+        Address of the index-th host (1-based) with prefix length
+        
+        Raises:
+            ValueError: If the network has no index-th host address
+        """
+        if not 1 <= index < self.network.num_addresses - 1:
+            raise ValueError(f"No host address {index} in {self.network}")
+        return f"{self.network.network_address + index}/{self.network.prefixlen}"
+    
+    def next_free(self, used: Iterable[str]) -> str:
+        """Lowest address (with prefix length) not in used (bare addresses)"""
+        taken = set(used)
+        index = 1
+        while str(self.network.network_address + index) in taken:
+            index += 1
+        return self.address(index)
@@ -44,6 +44,9 @@ let nodeGroup = svg.append('g').attr('class', 'nodes');
 
 // State
 let currentTopology = { nodes: [], edges: [] };
+let currentVersion = null;
+let pendingJobId = null;
+let sizeLimits = {};  // topology type -> { min, max }, from /api/topology/types
 
 // ============== LOGGING ==============
 
@@ -65,9 +68,10 @@ function log(message, type = 'info') {
 async function createTopology() {
     const type = topoType.value;
     const size = parseInt(topoSize.value);
+    const limits = sizeLimits[type] || { min: 2, max: 20 };
     
-    if (size < 2 || size > 20) {
-        log('❌ Size must be between 2 and 20', 'error');
+    if (!(size >= limits.min && size <= limits.max)) {
+        log(`❌ Size must be between ${limits.min} and ${limits.max}`, 'error');
         return;
     }
     
@@ -84,17 +88,61 @@ async function createTopology() {
         const data = await response.json();
         
         if (data.success) {
-            log(`✅ ${data.message}`, 'success');
+            // Creation continues in the background; see topology_progress
+            pendingJobId = data.job_id;
+            log(`⏳ ${data.message}...`, 'info');
         } else {
             log(`❌ ${data.error}`, 'error');
+            loading.classList.remove('active');
         }
     } catch (error) {
         log(`❌ Error: ${error.message}`, 'error');
-    } finally {
         loading.classList.remove('active');
     }
 }
 
+function handleTopologyProgress(event) {
+    if (event.kind !== 'create') {
+        return;
+    }
+    
+    if (event.status === 'succeeded') {
+        const result = event.result || {};
+        log(`✅ Created ${result.topology_type} topology with ${result.size} nodes`, 'success');
+    } else if (event.status === 'failed') {
+        log(`❌ ${event.error}`, 'error');
+    } else if (event.message) {
+        log(event.message, 'info');
+    }
+    
+    if (event.job_id === pendingJobId && (event.status === 'succeeded' || event.status === 'failed')) {
+        pendingJobId = null;
+        loading.classList.remove('active');
+    }
+}
+
+async function loadTopologyTypes() {
+    try {
+        const response = await fetch(`${API_URL}/api/topology/types`);
+        const data = await response.json();
+        
+        data.types.forEach(t => {
+            sizeLimits[t.type] = { min: t.min_size, max: t.max_size };
+        });
+        updateSizeLimits();
+    } catch (error) {
+        log(`❌ Error loading topology types: ${error.message}`, 'error');
+    }
+}
+
+function updateSizeLimits() {
+    const limits = sizeLimits[topoType.value];
+    if (limits) {
+        topoSize.min = limits.min;
+        topoSize.max = limits.max;
+    }
+}
+
 async function stopTopology() {
     loading.classList.add('active');
     log('Stopping topology...', 'info');
@@ -257,8 +305,39 @@ function generateSyntheticLinks(nodes, topology_type) {
     return edges;
 }
 
-function renderTopology(data) {
+function edgeKey(edge) {
+    return `${edge.source.id || edge.source}-${edge.target.id || edge.target}`;
+}
+
+function applyTopologyDelta(delta) {
+    // A missed delta means our copy is stale: ask for a full snapshot
+    if (currentVersion === null || delta.from_version !== currentVersion) {
+        log(`⚠️ Topology version gap (have ${currentVersion}, delta from ${delta.from_version}), resyncing`, 'info');
+        socket.emit('request_topology');
+        return;
+    }
+    
+    const removedNodes = new Set(delta.nodes.removed);
+    const changedNodes = new Map(delta.nodes.changed.map(n => [n.id, n]));
+    const nodes = currentTopology.nodes
+        .filter(n => !removedNodes.has(n.id))
+        .map(n => changedNodes.has(n.id) ? Object.assign(n, changedNodes.get(n.id)) : n)
+        .concat(delta.nodes.added);
+    
+    const removedEdges = new Set(delta.edges.removed);
+    const changedEdges = new Map(delta.edges.changed.map(e => [edgeKey(e), e]));
+    const edges = currentTopology.edges
+        .filter(e => !e.synthetic && !removedEdges.has(edgeKey(e)))
+        .map(e => changedEdges.get(edgeKey(e)) || { ...e, source: e.source.id || e.source, target: e.target.id || e.target })
+        .concat(delta.edges.added);
+    
+    currentVersion = delta.version;
+    renderTopology({ ...delta.meta, nodes, edges, version: delta.version }, 0.3);
+}
+
+function renderTopology(data, alpha = 1) {
     currentTopology = data;
+    if (data.version !== undefined) currentVersion = data.version;
     let { nodes, edges, topology_type } = data;
     
     // Generate synthetic links if topology type is known but links are missing
@@ -284,7 +363,7 @@ function renderTopology(data) {
     
     // Update links
     const link = linkGroup.selectAll('line')
-        .data(edges, d => `${d.source.id || d.source}-${d.target.id || d.target}`);
+        .data(edges, edgeKey);
     
     link.exit().remove();
     
@@ -330,7 +409,7 @@ function renderTopology(data) {
             .force('link', d3.forceLink().id(d => d.id).distance(150));
     }
     
-    simulation.alpha(1).restart();
+    simulation.alpha(alpha).restart();
     
     simulation.on('tick', () => {
         linkGroup.selectAll('line')
@@ -467,6 +546,14 @@ socket.on('topology_update', (data) => {
     renderTopology(data);
 });
 
+socket.on('topology_delta', (delta) => {
+    applyTopologyDelta(delta);
+});
+
+socket.on('topology_progress', (event) => {
+    handleTopologyProgress(event);
+});
+
 socket.on('stats_update', (stats) => {
     const totalPackets = stats.total_packets || 0;
     updateStats(null, null, null, totalPackets);
@@ -481,6 +568,7 @@ socket.on('error', (data) => {
 createBtn.addEventListener('click', createTopology);
 stopBtn.addEventListener('click', stopTopology);
 pingallBtn.addEventListener('click', runPingAll);
+topoType.addEventListener('change', updateSizeLimits);
 
 // Allow Enter key in size input
 topoSize.addEventListener('keypress', (e) => {
@@ -494,6 +582,8 @@ topoSize.addEventListener('keypress', (e) => {
 window.addEventListener('load', () => {
     log('Frontend initialized', 'success');
     
+    loadTopologyTypes();
+    
     // Request current topology if any
     socket.emit('request_topology');
 });
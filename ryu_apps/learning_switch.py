@@ -3,27 +3,78 @@ Simple Learning Switch Implementation for Ryu
 Implements basic Layer 2 learning switch functionality with OpenFlow 1.3
 """
 
+import os
+
 from ryu.base import app_manager
 from ryu.controller import ofp_event
 from ryu.controller.handler import CONFIG_DISPATCHER, MAIN_DISPATCHER
 from ryu.controller.handler import set_ev_cls
+from ryu.lib import hub
 from ryu.ofproto import ofproto_v1_3
-from ryu.lib.packet import packet
-from ryu.lib.packet import ethernet
 from ryu.lib.packet import ether_types
+from ryu.topology import event as topo_event
+
+from packet_utils import ARP_REQUEST, arp_packet, arp_reply, eth_header
+from spanning_tree import flood_ports, spanning_tree
 
 
 class SimpleLearningSwitch(app_manager.RyuApp):
     """
     Simple learning switch implementation
     Learns MAC addresses and forwards packets accordingly
+    
+    By default each switch gets one flow per (in_port, eth_src, eth_dst),
+    i.e. per communicating host pair. With LEARNING_SWITCH_MULTI_TABLE=1
+    a two-table pipeline is used instead:
+        
+        table 0 (source): (in_port, eth_src) known -> goto table 1,
+                          miss -> controller (learn)
+        table 1 (forward): eth_dst -> output port, miss -> flood
+    
+    so each switch holds two flows per host, and packets to unknown
+    destinations are flooded without a packet-in.
+    
+    ARP requests for an IP the controller has already seen (as the sender
+    of an earlier ARP packet) are answered with a packet-out at the
+    ingress switch instead of being flooded.
+    
+    Floods only use host ports and the links of a spanning tree computed
+    from the links ryu.topology discovers (run with --observe-links), so
+    broadcasts cannot loop in meshes and other looped fabrics. The tree is
+    recomputed whenever links change, and only switches whose flood ports
+    changed are reset. Until the first tree is computed floods only use
+    ports not known to lead to another switch, never OFPP_FLOOD.
     """
     OFP_VERSIONS = [ofproto_v1_3.OFP_VERSION]
     
+    MULTI_TABLE = os.environ.get('LEARNING_SWITCH_MULTI_TABLE') == '1'
+    SOURCE_TABLE = 0
+    FORWARD_TABLE = 1
+    
+    # Seconds topology events are collected before the tree is recomputed,
+    # so link discovery of a large fabric causes one reset, not one per link
+    TREE_UPDATE_DELAY = 0.5
+    
     def __init__(self, *args, **kwargs):
         super(SimpleLearningSwitch, self).__init__(*args, **kwargs)
         # MAC address table: {dpid: {mac_address: port}}
         self.mac_to_port = {}
+        
+        # Discovered topology: {dpid: datapath}, {dpid: {port_no}},
+        # {(src_dpid, src_port, dst_dpid, dst_port)}
+        self.datapaths = {}
+        self.switch_ports = {}
+        self.links = set()
+        
+        # Spanning tree ports {(dpid, port_no)}, inter-switch ports off the
+        # tree, and loop-free flood ports {dpid: {port_no}}
+        self.tree = set()
+        self.blocked = set()
+        self.flood = {}
+        self._tree_update_pending = False
+        
+        # ARP table: {ip: (mac, dpid the sender was seen on)}
+        self.ip_to_mac = {}
     
     @set_ev_cls(ofp_event.EventOFPSwitchFeatures, CONFIG_DISPATCHER)
     def switch_features_handler(self, ev):
@@ -35,19 +86,172 @@ class SimpleLearningSwitch(app_manager.RyuApp):
             ev: Switch features event
         """
         datapath = ev.msg.datapath
+        
+        # A reconnecting DPID may belong to a different (warm) network
+        self.datapaths[datapath.id] = datapath
+        self._forget_arp(datapath.id)
+        self._reset_switch(datapath)
+        
+        self.logger.info("Switch connected: %016x", datapath.id)
+    
+    def _reset_switch(self, datapath):
+        """
+        Forget what was learned on a switch and install its base flows
+        
+        All flows are deleted first, so no learned entry (or entry of the
+        other pipeline) survives a restart or a spanning tree change.
+        
+        Args:
+            datapath: OpenFlow switch datapath
+        """
         ofproto = datapath.ofproto
         parser = datapath.ofproto_parser
         
+        self.mac_to_port.pop(datapath.id, None)
+        datapath.send_msg(parser.OFPFlowMod(datapath=datapath,
+                                            table_id=ofproto.OFPTT_ALL,
+                                            command=ofproto.OFPFC_DELETE,
+                                            out_port=ofproto.OFPP_ANY,
+                                            out_group=ofproto.OFPG_ANY))
+        
         # Install table-miss flow entry
         # This sends packets with no match to the controller
         match = parser.OFPMatch()
         actions = [parser.OFPActionOutput(ofproto.OFPP_CONTROLLER,
                                          ofproto.OFPCML_NO_BUFFER)]
-        self.add_flow(datapath, 0, match, actions)
         
-        self.logger.info("Switch connected: %016x", datapath.id)
+        if not self.MULTI_TABLE:
+            self.add_flow(datapath, 0, match, actions)
+            return
+        
+        self.add_flow(datapath, 0, match, actions, table_id=self.SOURCE_TABLE)
+        
+        # Known sources skip the controller, but their ARP requests may be
+        # answered there
+        arp_request = parser.OFPMatch(eth_type=ether_types.ETH_TYPE_ARP,
+                                      arp_op=ARP_REQUEST)
+        self.add_flow(datapath, 2, arp_request, actions, table_id=self.SOURCE_TABLE)
+        
+        # Unknown destinations are flooded by the switch itself, on the
+        # loop-free ports (one entry per in_port, which is excluded)
+        for in_port in self.switch_ports.get(datapath.id, ()):
+            self.add_flow(datapath, 0, parser.OFPMatch(in_port=in_port),
+                          self._flood_actions(datapath, in_port),
+                          table_id=self.FORWARD_TABLE)
+    
+    def _flood_actions(self, datapath, in_port):
+        """
+        Output actions flooding a packet from in_port without loops
+        
+        Args:
+            datapath: OpenFlow switch datapath
+            in_port: Port the packet arrived on
+        
+        Returns:
+            One output per flood port (only host ports before the first
+            spanning tree is computed)
+        """
+        parser = datapath.ofproto_parser
+        ports = self.flood.get(datapath.id)
+        if ports is None:
+            ports = self._host_ports(datapath.id)
+        return [parser.OFPActionOutput(port) for port in sorted(ports) if port != in_port]
+    
+    def _host_ports(self, dpid):
+        """
+        Ports of a switch not known to lead to another switch
+        
+        Args:
+            dpid: Switch DPID
+        
+        Returns:
+            Set of port numbers (empty before the switch's ports are known)
+        """
+        switch_facing = {link[1] for link in self.links if link[0] == dpid}
+        switch_facing |= {link[3] for link in self.links if link[2] == dpid}
+        return self.switch_ports.get(dpid, set()) - switch_facing
+    
+    # ---------- Topology tracking ----------
+    
+    @set_ev_cls(topo_event.EventSwitchEnter)
+    def _switch_enter_handler(self, ev):
+        """Record a discovered switch and its ports"""
+        self.switch_ports[ev.switch.dp.id] = {port.port_no for port in ev.switch.ports}
+        self._topology_changed()
+    
+    @set_ev_cls(topo_event.EventSwitchLeave)
+    def _switch_leave_handler(self, ev):
+        """Drop a switch and its links"""
+        dpid = ev.switch.dp.id
+        self.switch_ports.pop(dpid, None)
+        self.datapaths.pop(dpid, None)
+        self.mac_to_port.pop(dpid, None)
+        self._forget_arp(dpid)
+        self.links = {link for link in self.links if dpid not in (link[0], link[2])}
+        self._topology_changed()
+    
+    @set_ev_cls(topo_event.EventPortAdd)
+    def _port_add_handler(self, ev):
+        """Allow flooding on a new port"""
+        self.switch_ports.setdefault(ev.port.dpid, set()).add(ev.port.port_no)
+        self._topology_changed()
+    
+    @set_ev_cls(topo_event.EventPortDelete)
+    def _port_delete_handler(self, ev):
+        """Stop flooding on a removed port"""
+        self.switch_ports.get(ev.port.dpid, set()).discard(ev.port.port_no)
+        self._topology_changed()
+    
+    @set_ev_cls(topo_event.EventLinkAdd)
+    def _link_add_handler(self, ev):
+        """Add a discovered link to the spanning tree input"""
+        link = ev.link
+        self.links.add((link.src.dpid, link.src.port_no, link.dst.dpid, link.dst.port_no))
+        self._topology_changed()
+    
+    @set_ev_cls(topo_event.EventLinkDelete)
+    def _link_delete_handler(self, ev):
+        """Remove a link from the spanning tree input"""
+        link = ev.link
+        self.links.discard((link.src.dpid, link.src.port_no, link.dst.dpid, link.dst.port_no))
+        self._topology_changed()
     
-    def add_flow(self, datapath, priority, match, actions, buffer_id=None):
+    def _topology_changed(self):
+        """Schedule a spanning tree update, coalescing bursts of events"""
+        if not self._tree_update_pending:
+            self._tree_update_pending = True
+            hub.spawn_after(self.TREE_UPDATE_DELAY, self._update_flooding)
+    
+    def _update_flooding(self):
+        """
+        Recompute the spanning tree and flood ports
+        
+        Only switches whose flood ports changed are reset: on every other
+        switch the tree and host ports are the same as before, so no learned
+        port points along a link the new tree blocks.
+        """
+        self._tree_update_pending = False
+        tree = spanning_tree(self.links)
+        flood = flood_ports(self.switch_ports, self.links)
+        switch_facing = {(link[0], link[1]) for link in self.links}
+        switch_facing |= {(link[2], link[3]) for link in self.links}
+        
+        if tree != self.tree:
+            self.logger.info("Spanning tree updated: %d tree ports over %d links",
+                             len(tree), len(self.links) // 2)
+        changed = {dpid for dpid in set(flood) | set(self.flood)
+                   if flood.get(dpid) != self.flood.get(dpid)}
+        
+        self.tree = tree
+        self.blocked = switch_facing - tree
+        self.flood = flood
+        
+        for dpid in changed:
+            if dpid in self.datapaths:
+                self._reset_switch(self.datapaths[dpid])
+    
+    def add_flow(self, datapath, priority, match, actions, buffer_id=None,
+                 table_id=0, goto_table=None):
         """
         Add a flow entry to the switch
         
@@ -57,20 +261,27 @@ class SimpleLearningSwitch(app_manager.RyuApp):
             match: Match conditions
             actions: Actions to perform
             buffer_id: Optional buffer ID for packet
+            table_id: Flow table to add the entry to
+            goto_table: Optional table to continue processing in
         """
         ofproto = datapath.ofproto
         parser = datapath.ofproto_parser
         
-        inst = [parser.OFPInstructionActions(ofproto.OFPIT_APPLY_ACTIONS,
-                                            actions)]
+        inst = []
+        if actions:
+            inst.append(parser.OFPInstructionActions(ofproto.OFPIT_APPLY_ACTIONS,
+                                                     actions))
+        if goto_table is not None:
+            inst.append(parser.OFPInstructionGotoTable(goto_table))
         
         if buffer_id:
             mod = parser.OFPFlowMod(datapath=datapath, buffer_id=buffer_id,
+                                   table_id=table_id, priority=priority,
+                                   match=match, instructions=inst)
+        else:
+            mod = parser.OFPFlowMod(datapath=datapath, table_id=table_id,
                                    priority=priority, match=match,
                                    instructions=inst)
-        else:
-            mod = parser.OFPFlowMod(datapath=datapath, priority=priority,
-                                   match=match, instructions=inst)
         
         datapath.send_msg(mod)
     
@@ -94,28 +305,40 @@ class SimpleLearningSwitch(app_manager.RyuApp):
         parser = datapath.ofproto_parser
         in_port = msg.match['in_port']
         
-        pkt = packet.Packet(msg.data)
-        eth = pkt.get_protocols(ethernet.ethernet)[0]
+        # Only the Ethernet header is needed: decode it straight from the
+        # buffer instead of parsing every layer with packet.Packet
+        header = eth_header(msg.data)
+        if header is None:
+            return
+        dst, src, ethertype = header
         
-        if eth.ethertype == ether_types.ETH_TYPE_LLDP:
+        if ethertype == ether_types.ETH_TYPE_LLDP:
             # Ignore LLDP packets
             return
         
-        dst = eth.dst
-        src = eth.src
-        
         dpid = datapath.id
+        if (dpid, in_port) in self.blocked:
+            # Off the spanning tree: only loops arrive here
+            return
+        
         self.mac_to_port.setdefault(dpid, {})
         
         # Learn MAC address to avoid flood next time
         self.mac_to_port[dpid][src] = in_port
         
+        if ethertype == ether_types.ETH_TYPE_ARP and self._answer_arp(msg, in_port):
+            return
+        
+        if self.MULTI_TABLE:
+            self._learn_multi_table(msg, in_port, src, dst)
+            return
+        
         if dst in self.mac_to_port[dpid]:
             out_port = self.mac_to_port[dpid][dst]
+            actions = [parser.OFPActionOutput(out_port)]
         else:
             out_port = ofproto.OFPP_FLOOD
-        
-        actions = [parser.OFPActionOutput(out_port)]
+            actions = self._flood_actions(datapath, in_port)
         
         # Install a flow to avoid packet_in next time
         if out_port != ofproto.OFPP_FLOOD:
@@ -136,3 +359,73 @@ class SimpleLearningSwitch(app_manager.RyuApp):
         out = parser.OFPPacketOut(datapath=datapath, buffer_id=msg.buffer_id,
                                  in_port=in_port, actions=actions, data=data)
         datapath.send_msg(out)
+    
+    def _learn_multi_table(self, msg, in_port, src, dst):
+        """
+        Install the two flows for a newly seen source and forward the packet
+        
+        Args:
+            msg: Packet-in message
+            in_port: Port the packet arrived on
+            src: Source MAC
+            dst: Destination MAC
+        """
+        datapath = msg.datapath
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        
+        # Forwarding to src (replaces the entry if the host moved)
+        self.add_flow(datapath, 1, parser.OFPMatch(eth_dst=src),
+                      [parser.OFPActionOutput(in_port)], table_id=self.FORWARD_TABLE)
+        
+        # src is known on this port: stop sending its packets here
+        self.add_flow(datapath, 1, parser.OFPMatch(in_port=in_port, eth_src=src), [],
+                      table_id=self.SOURCE_TABLE, goto_table=self.FORWARD_TABLE)
+        
+        # Send this packet on, via the port learned for dst or by flooding
+        if dst in self.mac_to_port[datapath.id]:
+            actions = [parser.OFPActionOutput(self.mac_to_port[datapath.id][dst])]
+        else:
+            actions = self._flood_actions(datapath, in_port)
+        data = msg.data if msg.buffer_id == ofproto.OFP_NO_BUFFER else None
+        out = parser.OFPPacketOut(datapath=datapath, buffer_id=msg.buffer_id,
+                                  in_port=in_port, actions=actions, data=data)
+        datapath.send_msg(out)
+    
+    def _answer_arp(self, msg, in_port):
+        """
+        Learn the sender of an ARP packet and answer it if it is a request
+        for a known IP
+        
+        Args:
+            msg: Packet-in message carrying ARP
+            in_port: Port the packet arrived on
+        
+        Returns:
+            True if a reply was sent (the request must not be flooded)
+        """
+        arp = arp_packet(msg.data)
+        if arp is None:
+            return False
+        opcode, sender_mac, sender_ip, target_ip = arp
+        
+        datapath = msg.datapath
+        if sender_ip != '0.0.0.0':
+            self.ip_to_mac[sender_ip] = (sender_mac, datapath.id)
+        
+        if opcode != ARP_REQUEST or target_ip == sender_ip or target_ip not in self.ip_to_mac:
+            return False
+        
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        data = arp_reply(sender_mac, sender_ip, self.ip_to_mac[target_ip][0], target_ip)
+        out = parser.OFPPacketOut(datapath=datapath, buffer_id=ofproto.OFP_NO_BUFFER,
+                                  in_port=ofproto.OFPP_CONTROLLER,
+                                  actions=[parser.OFPActionOutput(in_port)], data=data)
+        datapath.send_msg(out)
+        return True
+    
+    def _forget_arp(self, dpid):
+        """Drop ARP entries learned on a switch that restarted or left"""
+        self.ip_to_mac = {ip: entry for ip, entry in self.ip_to_mac.items()
+                          if entry[1] != dpid}
@@ -0,0 +1,86 @@
+"""
+Packet Helpers for Ryu Apps
+Fast decoding of the Ethernet header straight from packet-in buffers
+"""
+
+import socket
+import struct
+
+ETH_HEADER = struct.Struct('!6s6sH')  # dst, src, ethertype
+ARP_BODY = struct.Struct('!HHBBH6s4s6s4s')  # Ethernet/IPv4 ARP after the header
+
+ETH_TYPE_ARP = 0x0806
+ARP_REQUEST = 1
+ARP_REPLY = 2
+
+
+def mac_text(raw: bytes) -> str:
+    """6 raw bytes as 'aa:bb:cc:dd:ee:ff' (Ryu's MAC string format)"""
+    return raw.hex(':')
+
+
+def eth_header(data: bytes):
+    """
+    Decode the Ethernet header of a raw frame without building a Packet
+    
+    Reads only the first 14 bytes, which is all the learning switch needs,
+    instead of parsing every protocol layer.
+    
+    Args:
+        data: Raw frame from a packet-in
+    
+    Returns:
+        (dst, src, ethertype) with MACs as text (as ethernet.ethernet
+        reports them), or None if the frame is too short
+    """
+    if len(data) < ETH_HEADER.size:
+        return None
+    
+    dst, src, ethertype = ETH_HEADER.unpack_from(data)
+    
+    return mac_text(dst), mac_text(src), ethertype
+
+
+def arp_packet(data: bytes):
+    """
+    Decode an Ethernet/IPv4 ARP packet from a raw frame
+    
+    Args:
+        data: Raw frame whose ethertype is ARP
+    
+    Returns:
+        (opcode, sender_mac, sender_ip, target_ip) as text, or None if the
+        frame is too short or not Ethernet/IPv4 ARP
+    """
+    if len(data) < ETH_HEADER.size + ARP_BODY.size:
+        return None
+    
+    (hw_type, proto_type, hw_len, proto_len, opcode,
+     sender_mac, sender_ip, _, target_ip) = ARP_BODY.unpack_from(data, ETH_HEADER.size)
+    if (hw_type, proto_type, hw_len, proto_len) != (1, 0x0800, 6, 4):
+        return None
+    
+    return (opcode, mac_text(sender_mac), socket.inet_ntoa(sender_ip),
+            socket.inet_ntoa(target_ip))
+
+
+def arp_reply(requester_mac: str, requester_ip: str, mac: str, ip: str) -> bytes:
+    """
+    Build the ARP reply a host would send for its own address
+    
+    Args:
+        requester_mac: MAC that asked
+        requester_ip: IP that asked
+        mac: MAC that ip resolves to
+        ip: IP that was asked for
+    
+    Returns:
+        Raw Ethernet frame, ready for a packet-out
+    """
+    requester = bytes.fromhex(requester_mac.replace(':', ''))
+    answer = bytes.fromhex(mac.replace(':', ''))
+    
+    return (ETH_HEADER.pack(requester, answer, ETH_TYPE_ARP) +
+            ARP_BODY.pack(1, 0x0800, 6, 4, ARP_REPLY,
+                          answer, socket.inet_aton(ip),
+                          requester, socket.inet_aton(requester_ip)))
@@ -0,0 +1,104 @@
+"""
+Path Computation for Ryu Apps
+Destination-based shortest path (ECMP) next hops over the discovered switch graph
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Set, Tuple
+
+from spanning_tree import Link
+
+
+def distances(links: Iterable[Link], root: int) -> Dict[int, int]:
+    """
+    Hop count from every reachable switch to root
+    
+    Args:
+        links: Discovered links (each direction may be listed)
+        root: DPID to measure distances to
+    
+    Returns:
+        Dictionary mapping DPID to hops (root is 0)
+    """
+    adjacency: Dict[int, Set[int]] = {}
+    for src, _, dst, _ in links:
+        adjacency.setdefault(src, set()).add(dst)
+        adjacency.setdefault(dst, set()).add(src)
+    
+    dist = {root: 0}
+    queue = deque([root])
+    while queue:
+        dpid = queue.popleft()
+        for neighbor in adjacency.get(dpid, ()):
+            if neighbor not in dist:
+                dist[neighbor] = dist[dpid] + 1
+                queue.append(neighbor)
+    return dist
+
+
+def next_hops(links: Iterable[Link], root: int) -> Dict[int, Tuple[int, ...]]:
+    """
+    Ports leading toward root on every other switch that can reach it
+    
+    Each switch keeps all ports whose link leads one hop closer to root,
+    so equal-cost paths are all kept (ECMP) and following any of them can
+    never loop.
+    
+    Args:
+        links: Discovered links
+        root: Destination DPID
+    
+    Returns:
+        Dictionary mapping DPID to its sorted next-hop ports (root excluded)
+    """
+    links = list(links)
+    dist = distances(links, root)
+    
+    hops: Dict[int, Set[int]] = {}
+    for src, src_port, dst, dst_port in links:
+        for here, port, there in ((src, src_port, dst), (dst, dst_port, src)):
+            if here in dist and there in dist and dist[there] == dist[here] - 1:
+                hops.setdefault(here, set()).add(port)
+    
+    return {dpid: tuple(sorted(ports)) for dpid, ports in hops.items()}
+
+
+def host_routes(links: Iterable[Link], host_dpid: int,
+                host_port: int) -> Dict[int, Tuple[int, ...]]:
+    """
+    Output ports toward a host on every switch that can reach it
+    
+    Args:
+        links: Discovered links
+        host_dpid: Switch the host is attached to
+        host_port: Port of the host on that switch
+    
+    Returns:
+        Dictionary mapping DPID to its sorted output ports
+    """
+    routes = next_hops(links, host_dpid)
+    routes[host_dpid] = (host_port,)
+    return routes
+
+
+def edge_ports(switch_ports: Dict[int, Iterable[int]],
+               links: Iterable[Link]) -> Dict[int, Set[int]]:
+    """
+    Ports of every switch that do not lead to another switch
+    
+    Args:
+        switch_ports: Port numbers of every switch
+        links: Discovered links
+    
+    Returns:
+        Dictionary mapping DPID to its host-facing ports
+    """
+    switch_facing = set()
+    for src, src_port, dst, dst_port in links:
+        switch_facing.add((src, src_port))
+        switch_facing.add((dst, dst_port))
+    
+    return {
+        dpid: {port for port in ports if (dpid, port) not in switch_facing}
+        for dpid, ports in switch_ports.items()
+    }
@@ -0,0 +1,407 @@
+"""
+Proactive Shortest Path Routing for Ryu
+Installs end-to-end ECMP flows toward every learned host over the discovered topology
+"""
+
+from ryu.base import app_manager
+from ryu.controller import ofp_event
+from ryu.controller.handler import CONFIG_DISPATCHER, MAIN_DISPATCHER
+from ryu.controller.handler import set_ev_cls
+from ryu.lib import hub
+from ryu.ofproto import ofproto_v1_3
+from ryu.lib.packet import ether_types
+from ryu.topology import event as topo_event
+
+from packet_utils import ARP_REQUEST, arp_packet, arp_reply, eth_header
+from paths import edge_ports, host_routes, next_hops
+
+
+class ShortestPathRouting(app_manager.RyuApp):
+    """
+    Proactive shortest path routing
+    
+    Keeps a graph of the switches and links ryu.topology discovers (run
+    with --observe-links) and the attachment point (dpid, port) of every
+    host seen in a packet-in. When a host is learned, every switch that
+    can reach it gets one flow matching its MAC:
+        
+        eth_dst=host -> output next-hop port
+                        (select group over all ports when paths tie)
+    
+    so traffic to a known host never reaches the controller again. Routes
+    are recomputed after topology changes, and only the flows whose next
+    hops changed are rewritten. A host seen on another edge port has moved
+    and is re-learned there.
+    
+    Broadcasts and packets to unknown hosts are delivered by the
+    controller straight to the host ports of every switch, so nothing is
+    flooded between switches and looped fabrics are safe. ARP requests for
+    the IP of a known host are answered by the controller at the ingress
+    switch and not delivered at all.
+    """
+    OFP_VERSIONS = [ofproto_v1_3.OFP_VERSION]
+    
+    ROUTE_PRIORITY = 1
+    
+    # Seconds topology events are collected before routes are recomputed,
+    # so link discovery of a large fabric causes one update, not one per link
+    ROUTE_UPDATE_DELAY = 0.5
+    
+    def __init__(self, *args, **kwargs):
+        super(ShortestPathRouting, self).__init__(*args, **kwargs)
+        # Discovered topology: {dpid: datapath}, {dpid: {port_no}},
+        # {(src_dpid, src_port, dst_dpid, dst_port)}
+        self.datapaths = {}
+        self.switch_ports = {}
+        self.links = set()
+        
+        # Host-facing ports {dpid: {port_no}} and inter-switch ports {(dpid, port_no)}
+        self.edge = {}
+        self.switch_facing = set()
+        
+        # Host attachment points {mac: (dpid, port_no)} and the output
+        # ports installed toward each host {mac: {dpid: (port_no, ...)}}
+        self.hosts = {}
+        self.installed = {}
+        
+        # ARP table {ip: mac}, only answered while the MAC is a known host
+        self.ip_to_mac = {}
+        
+        # ECMP select groups {dpid: {(port_no, ...): group_id}}
+        self.groups = {}
+        self._route_update_pending = False
+    
+    @set_ev_cls(ofp_event.EventOFPSwitchFeatures, CONFIG_DISPATCHER)
+    def switch_features_handler(self, ev):
+        """
+        Handle switch features reply (initial handshake)
+        Clear the switch and install its table-miss and host flows
+        
+        Args:
+            ev: Switch features event
+        """
+        datapath = ev.msg.datapath
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        
+        # A reconnecting DPID may belong to a different (warm) network
+        self.datapaths[datapath.id] = datapath
+        datapath.send_msg(parser.OFPFlowMod(datapath=datapath,
+                                            table_id=ofproto.OFPTT_ALL,
+                                            command=ofproto.OFPFC_DELETE,
+                                            out_port=ofproto.OFPP_ANY,
+                                            out_group=ofproto.OFPG_ANY))
+        datapath.send_msg(parser.OFPGroupMod(datapath, command=ofproto.OFPGC_DELETE,
+                                             group_id=ofproto.OFPG_ALL))
+        self.groups.pop(datapath.id, None)
+        for routes in self.installed.values():
+            routes.pop(datapath.id, None)
+        
+        # Install table-miss flow entry
+        # This sends packets with no match to the controller
+        match = parser.OFPMatch()
+        actions = [parser.OFPActionOutput(ofproto.OFPP_CONTROLLER,
+                                         ofproto.OFPCML_NO_BUFFER)]
+        self.add_flow(datapath, 0, match, actions)
+        
+        self.logger.info("Switch connected: %016x", datapath.id)
+        self._topology_changed()
+    
+    # ---------- Topology tracking ----------
+    
+    @set_ev_cls(topo_event.EventSwitchEnter)
+    def _switch_enter_handler(self, ev):
+        """Record a discovered switch and its ports"""
+        self.switch_ports[ev.switch.dp.id] = {port.port_no for port in ev.switch.ports}
+        self._topology_changed()
+    
+    @set_ev_cls(topo_event.EventSwitchLeave)
+    def _switch_leave_handler(self, ev):
+        """Drop a switch, its links and the hosts attached to it"""
+        dpid = ev.switch.dp.id
+        self.switch_ports.pop(dpid, None)
+        self.datapaths.pop(dpid, None)
+        self.groups.pop(dpid, None)
+        self.links = {link for link in self.links if dpid not in (link[0], link[2])}
+        for routes in self.installed.values():
+            routes.pop(dpid, None)
+        self._forget_hosts(lambda point: point[0] == dpid)
+        self._topology_changed()
+    
+    @set_ev_cls(topo_event.EventPortAdd)
+    def _port_add_handler(self, ev):
+        """Deliver broadcasts on a new port"""
+        self.switch_ports.setdefault(ev.port.dpid, set()).add(ev.port.port_no)
+        self._topology_changed()
+    
+    @set_ev_cls(topo_event.EventPortDelete)
+    def _port_delete_handler(self, ev):
+        """Forget the host on a removed port (it may reappear elsewhere)"""
+        point = (ev.port.dpid, ev.port.port_no)
+        self.switch_ports.get(ev.port.dpid, set()).discard(ev.port.port_no)
+        self._forget_hosts(lambda attached: attached == point)
+        self._topology_changed()
+    
+    @set_ev_cls(topo_event.EventLinkAdd)
+    def _link_add_handler(self, ev):
+        """Add a discovered link to the graph"""
+        link = ev.link
+        self.links.add((link.src.dpid, link.src.port_no, link.dst.dpid, link.dst.port_no))
+        self._topology_changed()
+    
+    @set_ev_cls(topo_event.EventLinkDelete)
+    def _link_delete_handler(self, ev):
+        """Remove a link from the graph"""
+        link = ev.link
+        self.links.discard((link.src.dpid, link.src.port_no, link.dst.dpid, link.dst.port_no))
+        self._topology_changed()
+    
+    def _topology_changed(self):
+        """Schedule a route update, coalescing bursts of events"""
+        if not self._route_update_pending:
+            self._route_update_pending = True
+            hub.spawn_after(self.ROUTE_UPDATE_DELAY, self._update_routes)
+    
+    def _update_routes(self):
+        """
+        Recompute the routes toward every known host
+        
+        Next hops are computed once per switch that has hosts attached, and
+        only flows that differ from what is installed are sent.
+        """
+        self._route_update_pending = False
+        self.edge = edge_ports(self.switch_ports, self.links)
+        self.switch_facing = {(link[0], link[1]) for link in self.links}
+        self.switch_facing |= {(link[2], link[3]) for link in self.links}
+        
+        # Hosts learned before discovery may really be neighbouring switches
+        self._forget_hosts(lambda point: point in self.switch_facing)
+        
+        hops = {}
+        for mac, (dpid, port) in self.hosts.items():
+            if dpid not in hops:
+                hops[dpid] = next_hops(self.links, dpid)
+            self._install_routes(mac, {**hops[dpid], dpid: (port,)})
+    
+    def _forget_hosts(self, attached):
+        """
+        Remove hosts and their flows
+        
+        Args:
+            attached: Predicate on a host's (dpid, port_no)
+        """
+        for mac in [mac for mac, point in self.hosts.items() if attached(point)]:
+            del self.hosts[mac]
+            self._install_routes(mac, {})
+            self.installed.pop(mac, None)
+    
+    # ---------- Route installation ----------
+    
+    def _install_routes(self, mac, routes):
+        """
+        Bring the flows toward a host in line with its routes
+        
+        Args:
+            mac: Host MAC
+            routes: Output ports toward the host {dpid: (port_no, ...)}
+        """
+        installed = self.installed.setdefault(mac, {})
+        replaced = []
+        
+        for dpid in set(routes) | set(installed):
+            ports = routes.get(dpid)
+            if installed.get(dpid) == ports or dpid not in self.datapaths:
+                continue
+            if dpid in installed:
+                replaced.append((dpid, installed[dpid]))
+            
+            datapath = self.datapaths[dpid]
+            parser = datapath.ofproto_parser
+            match = parser.OFPMatch(eth_dst=mac)
+            if ports is None:
+                ofproto = datapath.ofproto
+                datapath.send_msg(parser.OFPFlowMod(datapath=datapath,
+                                                    command=ofproto.OFPFC_DELETE_STRICT,
+                                                    priority=self.ROUTE_PRIORITY,
+                                                    out_port=ofproto.OFPP_ANY,
+                                                    out_group=ofproto.OFPG_ANY,
+                                                    match=match))
+                del installed[dpid]
+            else:
+                # Replaces the entry for this MAC if there is one
+                self.add_flow(datapath, self.ROUTE_PRIORITY, match,
+                              self._output_actions(datapath, ports))
+                installed[dpid] = ports
+        
+        # Only after the flows that used them were rewritten or deleted
+        for dpid, ports in replaced:
+            self._release_group(dpid, ports)
+    
+    def _output_actions(self, datapath, ports):
+        """
+        Actions sending a packet out of one of the given ports
+        
+        Args:
+            datapath: OpenFlow switch datapath
+            ports: Equal-cost output ports
+        
+        Returns:
+            A single output, or a select group hashing flows over all ports
+            (the lowest unused group ID is allocated for a new port set)
+        """
+        parser = datapath.ofproto_parser
+        if len(ports) == 1:
+            return [parser.OFPActionOutput(ports[0])]
+        
+        groups = self.groups.setdefault(datapath.id, {})
+        if ports not in groups:
+            ofproto = datapath.ofproto
+            used = set(groups.values())
+            group_id = next(gid for gid in range(1, len(used) + 2) if gid not in used)
+            buckets = [parser.OFPBucket(weight=1, actions=[parser.OFPActionOutput(port)])
+                       for port in ports]
+            datapath.send_msg(parser.OFPGroupMod(datapath, ofproto.OFPGC_ADD,
+                                                 ofproto.OFPGT_SELECT, group_id,
+                                                 buckets))
+            groups[ports] = group_id
+        return [parser.OFPActionGroup(groups[ports])]
+    
+    def _release_group(self, dpid, ports):
+        """
+        Delete the select group of a port set once no route uses it
+        
+        Args:
+            dpid: Switch the group is on
+            ports: Port set of a route that was replaced or removed
+        """
+        group_id = self.groups.get(dpid, {}).get(ports)
+        if group_id is None:
+            return
+        if any(routes.get(dpid) == ports for routes in self.installed.values()):
+            return
+        
+        del self.groups[dpid][ports]
+        datapath = self.datapaths.get(dpid)
+        if datapath is not None:
+            ofproto = datapath.ofproto
+            datapath.send_msg(datapath.ofproto_parser.OFPGroupMod(
+                datapath, command=ofproto.OFPGC_DELETE, group_id=group_id))
+    
+    def add_flow(self, datapath, priority, match, actions):
+        """
+        Add a flow entry to the switch
+        
+        Args:
+            datapath: OpenFlow switch datapath
+            priority: Flow priority
+            match: Match conditions
+            actions: Actions to perform
+        """
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        
+        inst = [parser.OFPInstructionActions(ofproto.OFPIT_APPLY_ACTIONS, actions)]
+        mod = parser.OFPFlowMod(datapath=datapath, priority=priority,
+                                match=match, instructions=inst)
+        datapath.send_msg(mod)
+    
+    # ---------- Packet handling ----------
+    
+    @set_ev_cls(ofp_event.EventOFPPacketIn, MAIN_DISPATCHER)
+    def _packet_in_handler(self, ev):
+        """
+        Learn the sender's attachment point and deliver the packet
+        
+        Args:
+            ev: Packet-in event
+        """
+        msg = ev.msg
+        datapath = msg.datapath
+        in_port = msg.match['in_port']
+        
+        header = eth_header(msg.data)
+        if header is None:
+            return
+        dst, src, ethertype = header
+        
+        if ethertype == ether_types.ETH_TYPE_LLDP:
+            # Ignore LLDP packets
+            return
+        
+        point = (datapath.id, in_port)
+        if point in self.switch_facing:
+            # Hosts are only learned (and packets only accepted) at the edge
+            return
+        
+        known = self.hosts.get(src)
+        if known != point:
+            if known is not None and known[1] not in self.edge.get(known[0], ()):
+                # Until the old port is known to be a host port this may be
+                # a copy the controller delivered to an undiscovered link
+                return
+            
+            # New host, or a host that moved away from its edge port
+            self.hosts[src] = point
+            self.logger.info("Host %s %s %016x port %d", src,
+                             "at" if known is None else "moved to", datapath.id, in_port)
+            self._install_routes(src, host_routes(self.links, datapath.id, in_port))
+        
+        if ethertype == ether_types.ETH_TYPE_ARP and self._answer_arp(point, msg.data):
+            return
+        
+        if dst in self.hosts:
+            dst_dpid, dst_port = self.hosts[dst]
+            self._packet_out(dst_dpid, [dst_port], msg.data)
+        else:
+            # Broadcast or unknown destination: every host port but in_port
+            for dpid, ports in self.edge.items():
+                self._packet_out(dpid, sorted(port for port in ports
+                                              if (dpid, port) != point), msg.data)
+    
+    def _packet_out(self, dpid, ports, data):
+        """
+        Send a packet from the controller out of ports of a switch
+        
+        Args:
+            dpid: Switch to send from
+            ports: Output port numbers
+            data: Raw frame
+        """
+        datapath = self.datapaths.get(dpid)
+        if datapath is None or not ports:
+            return
+        
+        ofproto = datapath.ofproto
+        parser = datapath.ofproto_parser
+        actions = [parser.OFPActionOutput(port) for port in ports]
+        out = parser.OFPPacketOut(datapath=datapath, buffer_id=ofproto.OFP_NO_BUFFER,
+                                  in_port=ofproto.OFPP_CONTROLLER, actions=actions,
+                                  data=data)
+        datapath.send_msg(out)
+    
+    def _answer_arp(self, point, data):
+        """
+        Learn the sender of an ARP packet and answer it if it is a request
+        for a known host
+        
+        Args:
+            point: (dpid, port_no) the packet arrived on
+            data: Raw frame carrying ARP
+        
+        Returns:
+            True if a reply was sent (the request must not be delivered)
+        """
+        arp = arp_packet(data)
+        if arp is None:
+            return False
+        opcode, sender_mac, sender_ip, target_ip = arp
+        
+        if sender_ip != '0.0.0.0':
+            self.ip_to_mac[sender_ip] = sender_mac
+        
+        mac = self.ip_to_mac.get(target_ip)
+        if opcode != ARP_REQUEST or target_ip == sender_ip or mac not in self.hosts:
+            return False
+        
+        self._packet_out(point[0], [point[1]], arp_reply(sender_mac, sender_ip, mac, target_ip))
+        return True
@@ -0,0 +1,76 @@
+"""
+Spanning Tree Computation for Ryu Apps
+Loop-free flood port sets computed from the discovered switch links
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Set, Tuple
+
+# A discovered link: (src_dpid, src_port, dst_dpid, dst_port)
+Link = Tuple[int, int, int, int]
+
+
+def spanning_tree(links: Iterable[Link]) -> Set[Tuple[int, int]]:
+    """
+    Breadth-first spanning tree of every connected group of switches
+    
+    The tree of each group is rooted at its lowest DPID and neighbors are
+    visited in DPID and port order, so the same links always give the
+    same tree.
+    
+    Args:
+        links: Discovered links (each direction may be listed)
+    
+    Returns:
+        (dpid, port) of every port that is part of a tree link
+    """
+    adjacency: Dict[int, list] = {}
+    for src, src_port, dst, dst_port in links:
+        adjacency.setdefault(src, []).append((dst, src_port, dst_port))
+        adjacency.setdefault(dst, []).append((src, dst_port, src_port))
+    
+    tree_ports: Set[Tuple[int, int]] = set()
+    visited: Set[int] = set()
+    
+    for root in sorted(adjacency):
+        if root in visited:
+            continue
+        visited.add(root)
+        queue = deque([root])
+        while queue:
+            dpid = queue.popleft()
+            for neighbor, port, neighbor_port in sorted(adjacency[dpid]):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    tree_ports.add((dpid, port))
+                    tree_ports.add((neighbor, neighbor_port))
+                    queue.append(neighbor)
+    
+    return tree_ports
+
+
+def flood_ports(switch_ports: Dict[int, Iterable[int]],
+                links: Iterable[Link]) -> Dict[int, Set[int]]:
+    """
+    Ports each switch may flood on without creating a loop
+    
+    Host-facing ports and tree links are kept; inter-switch ports that are
+    not on the spanning tree are left out.
+    
+    Args:
+        switch_ports: Port numbers of every switch
+        links: Discovered links
+    
+    Returns:
+        Dictionary mapping DPID to its flood ports
+    """
+    links = list(links)
+    tree = spanning_tree(links)
+    switch_facing = {(src, port) for src, port, _, _ in links}
+    switch_facing |= {(dst, port) for _, _, dst, port in links}
+    
+    return {
+        dpid: {port for port in ports
+               if (dpid, port) not in switch_facing or (dpid, port) in tree}
+        for dpid, ports in switch_ports.items()
+    }
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Packet-in Parsing Benchmark
+Compares full Ryu packet parsing with the Ethernet fast path of the learning switch
+
+Usage: python3 scripts/bench_packet_in.py [iterations]
+"""
+
+import os
+import struct
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'ryu_apps'))
+
+from packet_utils import eth_header
+
+try:
+    from ryu.lib.packet import ethernet, packet
+except ImportError:
+    packet = None
+
+BROADCAST = b'\xff' * 6
+HOST1 = bytes.fromhex('000000000001')
+HOST2 = bytes.fromhex('000000000002')
+
+# ARP request h1 -> who has 10.0.0.2 (the typical flood / table-miss packet)
+ARP_REQUEST = (
+    BROADCAST + HOST1 + struct.pack('!H', 0x0806) +
+    struct.pack('!HHBBH', 1, 0x0800, 6, 4, 1) +
+    HOST1 + bytes([10, 0, 0, 1]) + b'\x00' * 6 + bytes([10, 0, 0, 2])
+)
+
+# TCP SYN h1 -> h2 (first packet of a new flow)
+TCP_SYN = (
+    HOST2 + HOST1 + struct.pack('!H', 0x0800) +
+    struct.pack('!BBHHHBBH4s4s', 0x45, 0, 40, 1, 0, 64, 6, 0,
+                bytes([10, 0, 0, 1]), bytes([10, 0, 0, 2])) +
+    struct.pack('!HHIIBBHHH', 40000, 5001, 0, 0, 0x50, 0x02, 65535, 0, 0)
+)
+
+
+def full_parse(data):
+    """What the handler did before: parse every layer, keep the Ethernet one"""
+    eth = packet.Packet(data).get_protocols(ethernet.ethernet)[0]
+    return eth.dst, eth.src, eth.ethertype
+
+
+def rate(func, data, iterations):
+    """Calls per second of func(data)"""
+    seconds = timeit.timeit(lambda: func(data), number=iterations)
+    return iterations / seconds
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    
+    have_ryu = packet is not None
+    if not have_ryu:
+        print("Ryu is not installed: only the fast path is measured\n")
+    
+    print(f"{'frame':<12}{'full parse /s':>16}{'fast path /s':>16}{'speedup':>10}")
+    for name, frame in (('ARP request', ARP_REQUEST), ('TCP SYN', TCP_SYN)):
+        if have_ryu:
+            assert full_parse(frame) == eth_header(frame)
+        fast = rate(eth_header, frame, iterations)
+        if have_ryu:
+            full = rate(full_parse, frame, iterations // 10)
+            print(f"{name:<12}{full:>16,.0f}{fast:>16,.0f}{fast / full:>9.1f}x")
+        else:
+            print(f"{name:<12}{'-':>16}{fast:>16,.0f}{'-':>10}")
+
+
+if __name__ == '__main__':
+    main()
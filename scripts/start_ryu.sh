@@ -37,12 +37,16 @@ if pgrep -f "ryu-manager" > /dev/null; then
     fi
 fi
 
+# Forwarding app: learning_switch (default) or shortest_path
+FORWARDING_APP="${RYU_FORWARDING_APP:-learning_switch}"
+
 echo ""
 echo "Configuration:"
 echo "  OpenFlow Port: 6633"
 echo "  REST API Port: 8080"
 echo "  Protocol: OpenFlow 1.3"
 echo "  Link Discovery: Enabled (LLDP)"
+echo "  Forwarding App: ${FORWARDING_APP}"
 echo ""
 
 # Get the project root directory
@@ -61,7 +65,7 @@ while true; do
         --ofp-tcp-listen-port 6633 \
         --wsapi-port 8080 \
         --observe-links \
-        ryu.app.simple_switch_13 \
+        "$PROJECT_ROOT/ryu_apps/$FORWARDING_APP.py" \
         ryu.app.ofctl_rest \
         ryu.app.rest_topology \
         ryu.topology.switches \
@@ -18,6 +18,26 @@ BASE_URL = "http://localhost:5000"
 RYU_URL = "http://localhost:8080"
 
 
+def wait_for_job(job_id, timeout=60):
+    """Poll a background job until it finishes and return its status"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = requests.get(f"{BASE_URL}/api/jobs/{job_id}").json()
+        if job['status'] in ('succeeded', 'failed'):
+            return job
+        time.sleep(0.2)
+    raise TimeoutError(f"Job {job_id} did not finish")
+
+
+def create_and_wait(topology_type="star", size=3):
+    """Create a topology and wait for its job to finish"""
+    response = requests.post(
+        f"{BASE_URL}/api/topology/create",
+        json={"type": topology_type, "size": size}
+    )
+    return wait_for_job(response.json()['job_id'])
+
+
 class TestFlaskAPI:
     """Test suite for Flask REST API"""
     
@@ -60,10 +80,21 @@ class TestFlaskAPI:
             json=payload
         )
         
-        assert response.status_code == 200
+        assert response.status_code == 202
         data = response.json()
         assert data['success'] is True
-        assert 'Created star topology' in data['message']
+        assert 'job_id' in data
+        
+        job = wait_for_job(data['job_id'])
+        assert job['status'] == 'succeeded'
+        assert job['phase'] == 'discovery'
+        assert job['result']['topology_type'] == 'star'
+    
+    def test_get_unknown_job(self):
+        """Test looking up a job that does not exist"""
+        response = requests.get(f"{BASE_URL}/api/jobs/doesnotexist")
+        
+        assert response.status_code == 404
     
     def test_create_topology_invalid_type(self):
         """Test creating topology with invalid type"""
@@ -80,7 +111,7 @@ class TestFlaskAPI:
     
     def test_create_topology_invalid_size(self):
         """Test creating topology with invalid size"""
-        payload = {"type": "star", "size": 100}
+        payload = {"type": "star", "size": 1000}
         response = requests.post(
             f"{BASE_URL}/api/topology/create",
             json=payload
@@ -91,14 +122,20 @@ class TestFlaskAPI:
         assert data['success'] is False
         assert 'Size must be between' in data['error']
     
+    def test_create_topology_impossible_generated_size(self):
+        """Test a size the generator cannot build is rejected before queueing"""
+        response = requests.post(
+            f"{BASE_URL}/api/topology/create",
+            json={"type": "fat_tree", "size": 3}
+        )
+        
+        assert response.status_code == 400
+        assert 'job_id' not in response.json()
+    
     def test_get_topology_data(self):
         """Test getting topology data"""
         # Create topology first
-        requests.post(
-            f"{BASE_URL}/api/topology/create",
-            json={"type": "star", "size": 3}
-        )
-        time.sleep(4)  # Wait for switches to connect
+        create_and_wait()
         
         # Get topology data
         response = requests.get(f"{BASE_URL}/api/topology/data")
@@ -109,14 +146,28 @@ class TestFlaskAPI:
         assert 'edges' in data
         assert len(data['nodes']) > 0  # Should have at least switch and hosts
     
+    def test_get_topology_data_etag(self):
+        """Test unchanged topology returns 304 for a matching ETag"""
+        response = requests.get(f"{BASE_URL}/api/topology/data")
+        
+        assert response.status_code == 200
+        etag = response.headers.get('ETag')
+        assert etag
+        assert 'version' in response.json()
+        
+        response = requests.get(
+            f"{BASE_URL}/api/topology/data",
+            headers={'If-None-Match': etag}
+        )
+        assert response.status_code == 304
+    
     def test_stop_topology(self):
         """Test stopping topology"""
-        # Create topology first
+        # Create topology first (stop is queued behind it)
         requests.post(
             f"{BASE_URL}/api/topology/create",
             json={"type": "star", "size": 3}
         )
-        time.sleep(2)
         
         # Stop topology
         response = requests.post(f"{BASE_URL}/api/topology/stop")
@@ -128,11 +179,7 @@ class TestFlaskAPI:
     def test_pingall(self):
         """Test pingall functionality"""
         # Create topology
-        requests.post(
-            f"{BASE_URL}/api/topology/create",
-            json={"type": "star", "size": 3}
-        )
-        time.sleep(4)  # Wait for switches to connect
+        create_and_wait()
         
         # Run pingall
         response = requests.post(f"{BASE_URL}/api/topology/pingall")
@@ -142,6 +189,52 @@ class TestFlaskAPI:
         assert data['success'] is True
         assert 'packet_loss' in data
     
+    def test_ping_matrix(self):
+        """Test the ping matrix covers every host pair"""
+        create_and_wait(size=3)
+        
+        response = requests.post(f"{BASE_URL}/api/topology/pingmatrix", json={"count": 1})
+        
+        assert response.status_code == 202
+        job = wait_for_job(response.json()['job_id'])
+        assert job['status'] == 'succeeded'
+        matrix = job['result']
+        assert len(matrix['hosts']) == 3
+        assert matrix['loss'][0][0] is None
+        assert matrix['loss'][0][1] == 0.0
+    
+    def test_iperf(self):
+        """Test a throughput run is measured and recorded"""
+        create_and_wait(size=2)
+        
+        response = requests.post(f"{BASE_URL}/api/topology/iperf",
+                                 json={"pairs": [["h1", "h2"]], "duration": 1})
+        
+        assert response.status_code == 202
+        job = wait_for_job(response.json()['job_id'])
+        assert job['status'] == 'succeeded'
+        assert job['result']['results'][0]['bps'] > 0
+        
+        runs = requests.get(f"{BASE_URL}/api/topology/iperf").json()['runs']
+        assert runs[0]['job_id'] == job['job_id']
+    
+    def test_iperf_empty_pairs(self):
+        """Test an empty pair list is rejected up front"""
+        create_and_wait(size=2)
+        
+        response = requests.post(f"{BASE_URL}/api/topology/iperf", json={"pairs": []})
+        
+        assert response.status_code == 400
+    
+    def test_topology_types(self):
+        """Test topology types are listed with their size limits"""
+        response = requests.get(f"{BASE_URL}/api/topology/types")
+        
+        assert response.status_code == 200
+        types = {t['type']: t for t in response.json()['types']}
+        assert 'fat_tree' in types
+        assert types['star']['min_size'] == 2
+    
     def test_controller_info(self):
         """Test getting controller info"""
         response = requests.get(f"{BASE_URL}/api/controller/info")
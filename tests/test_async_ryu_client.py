@@ -0,0 +1,184 @@
+"""
+Unit tests for the asyncio Ryu REST API client
+Run with: python3 -m pytest tests/test_async_ryu_client.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import config
+from async_ryu_client import AsyncRyuClient
+from ryu_client import RyuClient
+
+
+SWITCHES = [{"dpid": "0000000000000001", "ports": []},
+            {"dpid": "0000000000000002", "ports": []}]
+LINKS = [{"src": {"dpid": "0000000000000001", "port_no": "00000002"},
+          "dst": {"dpid": "0000000000000002", "port_no": "00000002"}}]
+HOSTS = [{"mac": "00:00:00:00:00:01", "ipv4": ["10.0.0.1"],
+          "port": {"dpid": "0000000000000001", "port_no": "00000001"}}]
+
+
+class FakeRyu(BaseHTTPRequestHandler):
+    """Canned Ryu REST answers; /flaky/<n> fails with 503 n times first"""
+    
+    hits = {}
+    
+    def log_message(self, *args):
+        pass
+    
+    def _answer(self):
+        path = self.path
+        FakeRyu.hits[path] = FakeRyu.hits.get(path, 0) + 1
+        
+        if path.startswith('/flaky/'):
+            if FakeRyu.hits[path] <= int(path.rsplit('/', 1)[1]):
+                return 503, {}
+            return 200, {"ok": True}
+        
+        dpid = path.rsplit('/', 1)[1]
+        routes = {
+            '/v1.0/topology/switches': SWITCHES,
+            '/v1.0/topology/links': LINKS,
+            '/v1.0/topology/hosts': HOSTS,
+            '/stats/flowentry/add': {},
+            f'/stats/port/{dpid}': {dpid: [{"port_no": 1, "rx_packets": 7}]},
+            f'/stats/flow/{dpid}': {dpid: [{"priority": 0, "packet_count": 3}]},
+            f'/stats/aggregateflow/{dpid}': {dpid: [{"flow_count": 2}]},
+        }
+        if path not in routes or dpid == '9':
+            return 404, {}
+        return 200, routes[path]
+    
+    def _reply(self):
+        status, body = self._answer()
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def do_GET(self):
+        self._reply()
+    
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._reply()
+
+
+@pytest.fixture(scope="module")
+def ryu_url():
+    """Fake Ryu REST API on a free local port"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeRyu)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    """Keep retry backoff short and reset hit counters"""
+    monkeypatch.setattr(config, 'RYU_RETRY_BACKOFF', 0.01)
+    FakeRyu.hits = {}
+
+
+def run(ryu_url, call):
+    """Run call(client) on a fresh AsyncRyuClient and return its result"""
+    async def main():
+        async with AsyncRyuClient(ryu_url) as client:
+            return await call(client)
+    return asyncio.run(main())
+
+
+class TestAsyncRyuClient:
+    """Test suite for AsyncRyuClient"""
+    
+    def test_same_results_as_sync_client(self, ryu_url):
+        """Test every read returns exactly what RyuClient returns"""
+        sync = RyuClient(ryu_url)
+        try:
+            calls = [
+                ('get_switches', ()),
+                ('get_links', ()),
+                ('get_hosts', ()),
+                ('get_flow_stats', ("0000000000000001",)),
+                ('get_port_stats', ("0000000000000002",)),
+                ('get_port_stats', ()),
+                ('get_aggregate_flow_stats', (1,)),
+                ('add_flow', (1, {"priority": 1})),
+                ('is_connected', ()),
+            ]
+            for name, args in calls:
+                expected = getattr(sync, name)(*args)
+                assert expected, name
+                actual = run(ryu_url, lambda client: getattr(client, name)(*args))
+                assert actual == expected, name
+        finally:
+            sync.close()
+    
+    def test_fanout_merges_and_skips_failures(self, ryu_url):
+        """Test per-switch results are merged and failing switches left out"""
+        stats = run(ryu_url, lambda client: client.get_port_stats_fanout(
+            ["0000000000000001", 2, "9"]))
+        
+        assert stats == {"1": [{"port_no": 1, "rx_packets": 7}],
+                         "2": [{"port_no": 1, "rx_packets": 7}]}
+    
+    def test_all_digit_hex_dpid(self, ryu_url):
+        """Test a 16-digit hex DPID made of digits only is read as hex"""
+        stats = run(ryu_url, lambda client: client.get_port_stats_fanout(["0000000000000010"]))
+        
+        assert sorted(stats) == ["16"]
+        assert FakeRyu.hits["/stats/port/16"] == 1
+    
+    def test_fanout_defaults_to_all_switches(self, ryu_url):
+        """Test port stats without dpids fan out to every connected switch"""
+        stats = run(ryu_url, lambda client: client.get_port_stats())
+        
+        assert sorted(stats) == ["1", "2"]
+    
+    def test_retries_server_errors(self, ryu_url):
+        """Test 5xx answers are retried with backoff until they succeed"""
+        result = run(ryu_url, lambda client: client._get(f"/flaky/{config.RYU_MAX_RETRIES}"))
+        
+        assert result == {"ok": True}
+        assert FakeRyu.hits[f"/flaky/{config.RYU_MAX_RETRIES}"] == config.RYU_MAX_RETRIES + 1
+    
+    def test_gives_up_after_max_retries(self, ryu_url):
+        """Test a persistent 5xx fails after RYU_MAX_RETRIES retries"""
+        path = f"/flaky/{config.RYU_MAX_RETRIES + 1}"
+        
+        with pytest.raises(Exception):
+            run(ryu_url, lambda client: client._get(path))
+        assert FakeRyu.hits[path] == config.RYU_MAX_RETRIES + 1
+    
+    def test_posts_are_not_retried(self, ryu_url):
+        """Test a 5xx answer to a POST fails at once in both clients"""
+        with pytest.raises(Exception):
+            run(ryu_url, lambda client: client._post("/flaky/1", {}))
+        assert FakeRyu.hits["/flaky/1"] == 1
+        
+        sync = RyuClient(ryu_url)
+        try:
+            with pytest.raises(Exception):
+                sync._post("/flaky/2", {})
+        finally:
+            sync.close()
+        assert FakeRyu.hits["/flaky/2"] == 1
+    
+    def test_client_errors_are_not_retried(self, ryu_url):
+        """Test a 404 fails at once and read helpers fall back to empty"""
+        assert run(ryu_url, lambda client: client.get_flow_stats(9)) == []
+        assert FakeRyu.hits["/stats/flow/9"] == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
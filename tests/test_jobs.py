@@ -0,0 +1,137 @@
+"""
+Unit tests for the background job runner
+Run with: python3 -m pytest tests/test_jobs.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import threading
+import time
+import pytest
+from jobs import JobRunner, SUCCEEDED, FAILED
+
+
+class TestJobRunner:
+    """Test suite for JobRunner"""
+    
+    def setup_method(self):
+        """Create a fresh runner for each test"""
+        self.runner = JobRunner(history=3)
+    
+    def test_submit_returns_immediately(self):
+        """Test a slow job does not block the submitter"""
+        release = threading.Event()
+        
+        started = time.monotonic()
+        job = self.runner.submit('create', lambda job: release.wait(5))
+        
+        assert time.monotonic() - started < 0.5
+        assert not job.done
+        
+        release.set()
+        assert job.wait(5)
+        assert job.status == SUCCEEDED
+    
+    def test_jobs_run_one_at_a_time_in_order(self):
+        """Test jobs never overlap and run in submission order"""
+        order = []
+        active = []
+        
+        def work(name):
+            def run(job):
+                active.append(name)
+                assert len(active) == 1
+                time.sleep(0.02)
+                order.append(name)
+                active.remove(name)
+            return run
+        
+        jobs = [self.runner.submit('op', work(i)) for i in range(5)]
+        for job in jobs:
+            job.wait(5)
+        
+        assert order == list(range(5))
+        assert all(job.status == SUCCEEDED for job in jobs)
+    
+    def test_run_returns_result(self):
+        """Test run() waits for the job and returns its result"""
+        assert self.runner.run('ping', lambda job: 42, timeout=5) == 42
+    
+    def test_run_raises_on_failure(self):
+        """Test a failed job is reported to the waiting caller"""
+        def fail(job):
+            raise ValueError("no network")
+        
+        with pytest.raises(RuntimeError, match="no network"):
+            self.runner.run('ping', fail, timeout=5)
+    
+    def test_run_timeout_cancels_queued_job(self):
+        """Test a job that times out in the queue is cancelled, not run later"""
+        release = threading.Event()
+        ran = []
+        self.runner.submit('iperf', lambda job: release.wait(5))
+        
+        with pytest.raises(TimeoutError, match="cancelled"):
+            self.runner.run('stop', lambda job: ran.append(True), timeout=0.1)
+        
+        release.set()
+        assert self.runner.run('ping', lambda job: 1, timeout=5) == 1
+        assert ran == []
+    
+    def test_cancel_running_job_fails(self):
+        """Test a job that already started cannot be cancelled"""
+        release = threading.Event()
+        job = self.runner.submit('create', lambda job: release.wait(5))
+        while job.status != 'running':
+            time.sleep(0.01)
+        
+        assert job.cancel() is False
+        release.set()
+        job.wait(5)
+        assert job.status == SUCCEEDED
+    
+    def test_failed_job_records_error(self):
+        """Test a failing job ends in the failed state"""
+        def fail(job):
+            raise ValueError("boom")
+        
+        job = self.runner.submit('create', fail)
+        job.wait(5)
+        
+        assert job.status == FAILED
+        assert job.error == "boom"
+        assert self.runner.get(job.id) is job
+    
+    def test_progress_events(self):
+        """Test listeners see start, every phase and the end of a job"""
+        events = []
+        self.runner.add_listener(lambda job, event: events.append(event))
+        
+        def work(job):
+            job.progress('build', "Building")
+            job.progress('start', "Starting")
+        
+        job = self.runner.submit('create', work)
+        job.wait(5)
+        
+        assert [e['status'] for e in events] == ['running', 'running', 'running', 'succeeded']
+        assert [e['phase'] for e in events] == [None, 'build', 'start', 'start']
+        assert events[1]['message'] == "Building"
+    
+    def test_history_is_bounded(self):
+        """Test only the most recent finished jobs are kept"""
+        jobs = [self.runner.submit('op', lambda job: None) for _ in range(3)]
+        for job in jobs:
+            job.wait(5)
+        
+        latest = self.runner.submit('op', lambda job: None)
+        latest.wait(5)
+        
+        assert self.runner.get(jobs[0].id) is None
+        assert self.runner.get(latest.id) is latest
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
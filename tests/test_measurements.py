@@ -0,0 +1,222 @@
+"""
+Unit tests for host measurements
+Run with: python3 -m pytest tests/test_measurements.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import threading
+import time
+import pytest
+from measurements import (parse_ping, ping_matrix, parse_iperf, shortest_path,
+                          path_links, schedule_rounds, run_rounds)
+
+
+PING_OK = """PING 10.0.0.2 (10.0.0.2) 56(84) bytes of data.
+64 bytes from 10.0.0.2: icmp_seq=1 ttl=64 time=0.512 ms
+64 bytes from 10.0.0.2: icmp_seq=2 ttl=64 time=0.081 ms
+
+--- 10.0.0.2 ping statistics ---
+3 packets transmitted, 2 received, 33.3333% packet loss, time 401ms
+rtt min/avg/max/mdev = 0.081/0.296/0.512/0.215 ms
+"""
+
+PING_LOST = """PING 10.0.0.3 (10.0.0.3) 56(84) bytes of data.
+
+--- 10.0.0.3 ping statistics ---
+3 packets transmitted, 0 received, 100% packet loss, time 2030ms
+"""
+
+
+class TestParsePing:
+    """Test suite for ping output parsing"""
+    
+    def test_parse_replies(self):
+        """Test loss and RTT are read from the summary"""
+        result = parse_ping(PING_OK)
+        
+        assert result['sent'] == 3
+        assert result['received'] == 2
+        assert result['loss'] == 33.3
+        assert result['rtt'] == {"min": 0.081, "avg": 0.296, "max": 0.512}
+    
+    def test_parse_total_loss(self):
+        """Test a dead path has full loss and no RTT"""
+        result = parse_ping(PING_LOST)
+        
+        assert result['loss'] == 100.0
+        assert result['rtt'] is None
+    
+    def test_parse_garbage(self):
+        """Test output without a summary counts as full loss"""
+        assert parse_ping("connect: Network is unreachable")['loss'] == 100.0
+
+
+class TestPingMatrix:
+    """Test suite for the concurrent ping matrix"""
+    
+    def test_matrix_shape(self):
+        """Test every ordered pair is measured and the diagonal is empty"""
+        def ping(src, dst):
+            return PING_LOST if dst == 'h3' else PING_OK
+        
+        matrix = ping_matrix(['h1', 'h2', 'h3'], ping, parallelism=4)
+        
+        assert matrix['hosts'] == ['h1', 'h2', 'h3']
+        assert matrix['loss'][0] == [None, 33.3, 100.0]
+        assert matrix['loss'][2] == [33.3, 33.3, None]
+        assert matrix['rtt'][1][0]['avg'] == 0.296
+        assert matrix['rtt'][0][2] is None
+        assert matrix['packet_loss'] == round(100 * (18 - 8) / 18, 1)
+    
+    def test_parallelism_limit(self):
+        """Test no more pings than the limit run at once"""
+        active = []
+        peak = []
+        lock = threading.Lock()
+        
+        def ping(src, dst):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.pop()
+            return PING_OK
+        
+        ping_matrix([f'h{i}' for i in range(6)], ping, parallelism=3)
+        
+        assert len(peak) == 30
+        assert max(peak) <= 3
+        assert max(peak) > 1
+    
+    def test_rows_are_streamed(self):
+        """Test each source's row is reported once it is complete"""
+        rows = {}
+        
+        ping_matrix(['h1', 'h2', 'h3'], lambda src, dst: PING_OK, parallelism=2,
+                    on_row=lambda src, row: rows.setdefault(src, row))
+        
+        assert set(rows) == {'h1', 'h2', 'h3'}
+        assert set(rows['h2']) == {'h1', 'h3'}
+    
+    def test_failed_ping_counts_as_loss(self):
+        """Test an exception while pinging marks the pair unreachable"""
+        def ping(src, dst):
+            raise OSError("no such host")
+        
+        matrix = ping_matrix(['h1', 'h2'], ping, parallelism=2)
+        
+        assert matrix['loss'][0][1] == 100.0
+        assert matrix['packet_loss'] == 0.0
+
+
+
+IPERF_OK = "20231114103000,10.0.0.1,40512,10.0.0.2,5201,3,0.0-5.0,589299712,942879539\n"
+
+# Star: h1..h4 on s1; h5 behind s2
+STAR = {
+    'h1': ['s1'], 'h2': ['s1'], 'h3': ['s1'], 'h4': ['s1'], 'h5': ['s2'],
+    's1': ['h1', 'h2', 'h3', 'h4', 's2'], 's2': ['s1', 'h5']
+}
+
+
+def links_for(pairs):
+    """Path links of pairs in the STAR graph"""
+    return {pair: path_links(shortest_path(STAR, *pair)) for pair in pairs}
+
+
+class TestThroughputScheduling:
+    """Test suite for iperf parsing and link-disjoint scheduling"""
+    
+    def test_parse_iperf(self):
+        """Test the CSV client report is parsed"""
+        assert parse_iperf(IPERF_OK) == {"bytes": 589299712, "bps": 942879539}
+    
+    def test_parse_iperf_without_report(self):
+        """Test a failed client run is rejected"""
+        with pytest.raises(ValueError):
+            parse_iperf("connect failed: Connection refused")
+    
+    def test_shortest_path(self):
+        """Test BFS finds the path through both switches"""
+        assert shortest_path(STAR, 'h1', 'h5') == ['h1', 's1', 's2', 'h5']
+        assert shortest_path(STAR, 'h1', 'h9') == []
+    
+    def test_disjoint_pairs_share_a_round(self):
+        """Test tests over different links run together"""
+        pairs = [('h1', 'h2'), ('h3', 'h4')]
+        
+        assert schedule_rounds(pairs, links_for(pairs)) == [pairs]
+    
+    def test_shared_links_are_serialized(self):
+        """Test tests sharing a link never land in the same round"""
+        pairs = [('h1', 'h2'), ('h1', 'h3'), ('h3', 'h4'), ('h2', 'h5'), ('h4', 'h5')]
+        links = links_for(pairs)
+        
+        rounds = schedule_rounds(pairs, links)
+        
+        assert sorted(p for r in rounds for p in r) == sorted(pairs)
+        for r in rounds:
+            used = [link for pair in r for link in links[pair]]
+            assert len(used) == len(set(used))
+        assert rounds[0] == [('h1', 'h2'), ('h3', 'h4')]
+    
+    def test_run_rounds_in_order(self):
+        """Test rounds run one after another and every result is reported"""
+        finished = []
+        reported = []
+        
+        def measure(src, dst):
+            finished.append(src)
+            return {"bps": 100}
+        
+        results = run_rounds([[('h1', 'h2'), ('h3', 'h4')], [('h1', 'h3')]], measure,
+                             on_result=lambda src, dst, r: reported.append((src, dst)))
+        
+        assert finished[-1] == 'h1' and len(finished) == 3
+        assert [r['round'] for r in results] == [0, 0, 1]
+        assert all(r['success'] and r['bps'] == 100 for r in results)
+        assert len(reported) == 3
+    
+    def test_run_rounds_failure(self):
+        """Test a failing test is reported without stopping the others"""
+        def measure(src, dst):
+            if src == 'h1':
+                raise RuntimeError("iperf failed")
+            return {"bps": 1}
+        
+        results = run_rounds([[('h1', 'h2'), ('h3', 'h4')]], measure)
+        
+        assert results[0] == {"success": False, "error": "iperf failed",
+                              "src": 'h1', "dst": 'h2', "round": 0}
+        assert results[1]['success'] is True
+    
+    def test_run_rounds_parallelism_limit(self):
+        """Test no more than 'parallelism' tests run at once"""
+        lock = threading.Lock()
+        running = [0, 0]  # current, peak
+        
+        def measure(src, dst):
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return {"bps": 1}
+        
+        pairs = [(f'h{i}', f'h{i + 1}') for i in range(1, 20)]
+        results = run_rounds([pairs], measure, parallelism=4)
+        
+        assert len(results) == 19
+        assert running[1] <= 4
+    
+    def test_run_rounds_empty(self):
+        """Test empty rounds produce no results instead of failing"""
+        assert run_rounds([[]], lambda src, dst: {}) == []
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -23,6 +23,7 @@ class TestMininetManager:
         """Cleanup after each test"""
         if self.manager.net is not None:
             self.manager.stop()
+        self.manager.clear_pool()
     
     def test_initialization(self):
         """Test manager initializes correctly"""
@@ -115,6 +116,91 @@ class TestMininetManager:
         assert info['size'] == 3
         assert len(info['switches']) == 1
         assert len(info['hosts']) == 3
+    
+    @pytest.mark.skipif(os.getenv('CI') == 'true', reason="Requires Mininet and sudo")
+    def test_modify_grows_linear_chain(self):
+        """Test adding a switch and host without rebuilding the network"""
+        self.manager.create("linear", 3)
+        s1 = self.manager.net.get('s1')
+        
+        result = self.manager.modify([
+            {"op": "add_switch", "links": ["s3"]},
+            {"op": "add_host", "switch": "s4"}
+        ])
+        
+        assert result['success'] is True
+        assert result['applied'][0]['name'] == 's4'
+        assert result['applied'][1]['name'] == 'h4'
+        assert result['switches'] == 4
+        assert result['hosts'] == 4
+        assert self.manager.net.get('s1') is s1  # untouched
+    
+    @pytest.mark.skipif(os.getenv('CI') == 'true', reason="Requires Mininet and sudo")
+    def test_modify_removes_switch_and_links(self):
+        """Test removing a switch also removes its links"""
+        self.manager.create("linear", 3)
+        
+        result = self.manager.modify([{"op": "remove_switch", "name": "s3"}])
+        
+        assert result['switches'] == 2
+        assert result['links'] == 3  # h1-s1, h2-s2, s1-s2
+    
+    @pytest.mark.skipif(os.getenv('CI') == 'true', reason="Requires Mininet and sudo")
+    def test_modify_invalid_operation(self):
+        """Test an invalid operation is rejected"""
+        self.manager.create("star", 2)
+        
+        with pytest.raises(ValueError):
+            self.manager.modify([{"op": "remove_host", "name": "h9"}])
+    
+    @pytest.mark.skipif(os.getenv('CI') == 'true', reason="Requires Mininet and sudo")
+    def test_create_fat_tree_topology(self):
+        """Test generated topologies are built from their spec"""
+        result = self.manager.create("fat_tree", 4)
+        
+        assert result['switches'] == 20
+        assert result['hosts'] == 16
+        assert len(self.manager.net.switches) == 20
+        assert self.manager.net.get('h16').IP() == '10.0.0.16'
+    
+    @pytest.mark.skipif(os.getenv('CI') == 'true', reason="Requires Mininet and sudo")
+    def test_warm_pool_reuses_network(self, monkeypatch):
+        """Test re-creating a pooled topology activates the parked network"""
+        monkeypatch.setattr(config, 'WARM_POOL_ENABLED', True)
+        self.manager.create("linear", 3)
+        first = self.manager.net
+        
+        self.manager.create("star", 2)
+        assert ("linear", 3) in self.manager.pool
+        
+        result = self.manager.create("linear", 3)
+        
+        assert result['warm'] is True
+        assert self.manager.net is first
+        assert ("star", 2) in self.manager.pool
+        assert self.manager.get_network_info()['switches'] == ['s1', 's2', 's3']
+    
+    @pytest.mark.skipif(os.getenv('CI') == 'true', reason="Requires Mininet and sudo")
+    def test_warm_pool_evicts_least_recent(self, monkeypatch):
+        """Test the pool stays within its size budget"""
+        monkeypatch.setattr(config, 'WARM_POOL_ENABLED', True)
+        monkeypatch.setattr(config, 'WARM_POOL_SIZE', 1)
+        
+        self.manager.prewarm([("star", 2), ("linear", 2)])
+        
+        assert list(self.manager.pool) == [("linear", 2)]
+        assert self.manager.net is None
+    
+    @pytest.mark.skipif(os.getenv('CI') == 'true', reason="Requires Mininet and sudo")
+    def test_warm_pool_skips_modified_network(self, monkeypatch):
+        """Test a network changed live is not parked under its original shape"""
+        monkeypatch.setattr(config, 'WARM_POOL_ENABLED', True)
+        self.manager.create("linear", 3)
+        self.manager.modify([{"op": "add_host", "switch": "s1"}])
+        
+        self.manager.create("star", 2)
+        
+        assert ("linear", 3) not in self.manager.pool
 
 
 if __name__ == '__main__':
@@ -0,0 +1,77 @@
+"""
+Unit tests for the Open vSwitch helpers
+Run with: python3 -m pytest tests/test_ovs.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import json
+import subprocess
+import pytest
+import ovs
+from ovs import bridge_status_from, parse_tables
+
+
+def vsctl_output(bridges, controllers):
+    """Build ovs-vsctl --format=json output for the status query"""
+    return (
+        json.dumps({"headings": ["name", "controller", "protocols"], "data": bridges}) + "\n" +
+        json.dumps({"headings": ["_uuid", "target", "is_connected"], "data": controllers}) + "\n"
+    )
+
+
+class TestOVSHelpers:
+    """Test suite for batched ovs-vsctl helpers"""
+    
+    def test_parse_tables_splits_commands(self):
+        """Test each command's table is parsed separately"""
+        output = vsctl_output([["s1", ["set", []], ["set", []]]], [])
+        
+        tables = parse_tables(output)
+        
+        assert len(tables) == 2
+        assert tables[0]['headings'] == ["name", "controller", "protocols"]
+        assert tables[1]['data'] == []
+    
+    def test_bridge_status(self):
+        """Test bridges are matched to their controllers' state"""
+        output = vsctl_output(
+            [["s1", ["uuid", "c1"], "OpenFlow13"],
+             ["s2", ["uuid", "c2"], ["set", ["OpenFlow10", "OpenFlow13"]]],
+             ["s3", ["set", [["uuid", "c3"], ["uuid", "c4"]]], ["set", []]],
+             ["s4", ["set", []], ["set", []]]],
+            [[["uuid", "c1"], "tcp:127.0.0.1:6633", True],
+             [["uuid", "c2"], "tcp:127.0.0.1:6633", False],
+             [["uuid", "c3"], "tcp:127.0.0.1:6633", False],
+             [["uuid", "c4"], "tcp:127.0.0.1:6653", True]]
+        )
+        
+        status = bridge_status_from(output)
+        
+        assert {name for name, st in status.items() if st['connected']} == {"s1", "s3"}
+        assert status["s1"]["protocols"] == ["OpenFlow13"]
+        assert status["s2"]["protocols"] == ["OpenFlow10", "OpenFlow13"]
+        assert status["s3"]["targets"] == ["tcp:127.0.0.1:6633", "tcp:127.0.0.1:6653"]
+        assert status["s4"] == {"protocols": [], "targets": [], "connected": False}
+    
+    def test_no_bridges(self):
+        """Test an empty OVS reports no bridges"""
+        assert bridge_status_from(vsctl_output([], [])) == {}
+    
+    def test_configure_bridges_is_one_call(self, monkeypatch):
+        """Test all bridges are configured by a single ovs-vsctl run"""
+        calls = []
+        monkeypatch.setattr(ovs.subprocess, 'run', lambda args, **kw: calls.append(args) or
+                            subprocess.CompletedProcess(args, 0, '', ''))
+        
+        ovs.configure_bridges(['s1', 's2', 's3'], 'OpenFlow13', 'tcp:127.0.0.1:6633')
+        
+        assert len(calls) == 1
+        assert calls[0].count('--') == 6
+        assert ['set', 'Bridge', 's3', 'protocols=OpenFlow13'] == calls[0][-8:-4]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
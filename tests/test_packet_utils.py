@@ -0,0 +1,76 @@
+"""
+Unit tests for the Ryu app packet helpers
+Run with: python3 -m pytest tests/test_packet_utils.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'ryu_apps'))
+
+import struct
+import pytest
+from packet_utils import ARP_REPLY, ARP_REQUEST, arp_packet, arp_reply, eth_header, mac_text
+
+
+class TestEthHeader:
+    """Test suite for the Ethernet fast path"""
+    
+    def test_decode_header(self):
+        """Test MACs and ethertype are read from the first 14 bytes"""
+        frame = (bytes.fromhex('ffffffffffff') + bytes.fromhex('00000000000a') +
+                 struct.pack('!H', 0x0806) + b'\x00' * 28)
+        
+        assert eth_header(frame) == ('ff:ff:ff:ff:ff:ff', '00:00:00:00:00:0a', 0x0806)
+    
+    def test_short_frame(self):
+        """Test truncated frames are rejected"""
+        assert eth_header(b'\x00' * 13) is None
+    
+    def test_mac_text_format(self):
+        """Test MACs use Ryu's lowercase colon format"""
+        assert mac_text(bytes.fromhex('AABBCCDDEEFF')) == 'aa:bb:cc:dd:ee:ff'
+
+
+
+def arp_request(sender_mac, sender_ip, target_ip):
+    """Raw ARP request frame, as a host broadcasts it"""
+    mac = bytes.fromhex(sender_mac.replace(':', ''))
+    ip = lambda text: bytes(int(part) for part in text.split('.'))
+    return (b'\xff' * 6 + mac + struct.pack('!H', 0x0806) +
+            struct.pack('!HHBBH', 1, 0x0800, 6, 4, ARP_REQUEST) +
+            mac + ip(sender_ip) + b'\x00' * 6 + ip(target_ip))
+
+
+class TestArp:
+    """Test suite for ARP decoding and replies"""
+    
+    def test_decode_request(self):
+        """Test opcode, sender and target are read from the frame"""
+        frame = arp_request('00:00:00:00:00:01', '10.0.0.1', '10.0.0.2')
+        
+        assert arp_packet(frame) == (ARP_REQUEST, '00:00:00:00:00:01', '10.0.0.1', '10.0.0.2')
+    
+    def test_short_frame(self):
+        """Test truncated ARP frames are rejected"""
+        frame = arp_request('00:00:00:00:00:01', '10.0.0.1', '10.0.0.2')
+        
+        assert arp_packet(frame[:-1]) is None
+    
+    def test_non_ipv4_arp(self):
+        """Test ARP for other protocol types is rejected"""
+        frame = bytearray(arp_request('00:00:00:00:00:01', '10.0.0.1', '10.0.0.2'))
+        frame[16:18] = struct.pack('!H', 0x86dd)
+        
+        assert arp_packet(bytes(frame)) is None
+    
+    def test_reply_answers_request(self):
+        """Test the reply is addressed to the requester and carries the answer"""
+        reply = arp_reply('00:00:00:00:00:01', '10.0.0.1', '00:00:00:00:00:02', '10.0.0.2')
+        
+        assert eth_header(reply) == ('00:00:00:00:00:01', '00:00:00:00:00:02', 0x0806)
+        assert arp_packet(reply) == (ARP_REPLY, '00:00:00:00:00:02', '10.0.0.2', '10.0.0.1')
+        assert reply[32:38] == bytes.fromhex('000000000001')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,83 @@
+"""
+Unit tests for the shortest path (ECMP) next hops used for proactive routing
+Run with: python3 -m pytest tests/test_paths.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'ryu_apps'))
+
+import pytest
+from paths import distances, edge_ports, host_routes, next_hops
+
+
+def both_ways(*links):
+    """Links plus their reverse direction, as ryu.topology reports them"""
+    return list(links) + [(dst, dst_port, src, src_port)
+                          for src, src_port, dst, dst_port in links]
+
+
+# s1 -- s2 -- s4 and s1 -- s3 -- s4 (two equal-cost paths s1 <-> s4)
+DIAMOND = both_ways((1, 2, 2, 1), (1, 3, 3, 1), (2, 4, 4, 2), (3, 4, 4, 3))
+
+# s1 -- s2 -- s3 -- s4
+LINE = both_ways((1, 2, 2, 1), (2, 3, 3, 2), (3, 4, 4, 3))
+
+
+class TestPaths:
+    """Test suite for shortest path next hops"""
+    
+    def test_distances(self):
+        """Test hop counts from every switch"""
+        assert distances(LINE, 1) == {1: 0, 2: 1, 3: 2, 4: 3}
+    
+    def test_ecmp_keeps_all_tied_ports(self):
+        """Test a switch with two equal-cost paths gets both ports"""
+        hops = next_hops(DIAMOND, 4)
+        
+        assert hops[1] == (2, 3)
+        assert hops[2] == (4,)
+        assert hops[3] == (4,)
+        assert 4 not in hops
+    
+    def test_next_hops_on_line(self):
+        """Test each switch on a line forwards toward the destination"""
+        assert next_hops(LINE, 1) == {2: (1,), 3: (2,), 4: (3,)}
+    
+    def test_next_hops_never_loop(self):
+        """Test every next hop in a mesh leads strictly closer"""
+        links = both_ways(*[(a, b, b, a) for a in range(1, 6) for b in range(a + 1, 6)])
+        peer = {(src, port): dst for src, port, dst, _ in links}
+        dist = distances(links, 5)
+        
+        for dpid, ports in next_hops(links, 5).items():
+            for port in ports:
+                assert dist[peer[(dpid, port)]] == dist[dpid] - 1
+    
+    def test_host_routes_end_at_host_port(self):
+        """Test the host's own switch outputs on the host port"""
+        routes = host_routes(DIAMOND, 4, 9)
+        
+        assert routes[4] == (9,)
+        assert routes[1] == (2, 3)
+    
+    def test_unreachable_switches_get_no_route(self):
+        """Test switches in another component are left out"""
+        links = LINE + both_ways((5, 6, 6, 5))
+        
+        assert set(host_routes(links, 1, 9)) == {1, 2, 3, 4}
+    
+    def test_isolated_switch(self):
+        """Test a switch without links only reaches its own hosts"""
+        assert host_routes([], 7, 1) == {7: (1,)}
+    
+    def test_edge_ports(self):
+        """Test only ports without a switch on the other end are edge ports"""
+        switch_ports = {1: {1, 2, 3}, 2: {1, 2}}
+        links = both_ways((1, 2, 2, 1))
+        
+        assert edge_ports(switch_ports, links) == {1: {1, 3}, 2: {2}}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
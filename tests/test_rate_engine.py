@@ -0,0 +1,91 @@
+"""
+Unit tests for the port rate engine
+Run with: python3 -m pytest tests/test_rate_engine.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import pytest
+from rate_engine import PortRateEngine
+
+
+def port(port_no, rx_packets=0, tx_packets=0, rx_bytes=0, tx_bytes=0, duration_sec=100):
+    """Build a Ryu-style port stats entry"""
+    return {
+        "port_no": port_no,
+        "rx_packets": rx_packets,
+        "tx_packets": tx_packets,
+        "rx_bytes": rx_bytes,
+        "tx_bytes": tx_bytes,
+        "duration_sec": duration_sec
+    }
+
+
+class TestPortRateEngine:
+    """Test suite for PortRateEngine"""
+    
+    def setup_method(self):
+        """Setup before each test"""
+        self.engine = PortRateEngine(stale_after=10)
+    
+    def test_first_sample_has_no_rates(self):
+        """Test the first sample only sets the baseline"""
+        result = self.engine.update({"1": [port(1, 10, 10, 1000, 1000)]}, 100.0)
+        
+        assert result['ports'] == {}
+        assert result['totals']['rx_pps'] == 0.0
+    
+    def test_rates_per_port_and_direction(self):
+        """Test pps and bps are computed per port and direction"""
+        self.engine.update({"1": [port(1, 10, 20, 1000, 2000)]}, 100.0)
+        result = self.engine.update({"1": [port(1, 30, 20, 3000, 2400, 102)]}, 102.0)
+        
+        rates = result['ports']['1'][1]
+        assert rates['rx_pps'] == pytest.approx(10.0)
+        assert rates['tx_pps'] == pytest.approx(0.0)
+        assert rates['rx_bps'] == pytest.approx(8000.0)
+        assert rates['tx_bps'] == pytest.approx(1600.0)
+        assert result['totals']['rx_bps'] == pytest.approx(8000.0)
+    
+    def test_totals_sum_across_switches(self):
+        """Test totals add up every port of every switch"""
+        self.engine.update({"1": [port(1)], "2": [port(1)]}, 0.0)
+        result = self.engine.update({"1": [port(1, 5)], "2": [port(1, 15)]}, 1.0)
+        
+        assert result['totals']['rx_pps'] == pytest.approx(20.0)
+    
+    def test_32bit_counter_wrap(self):
+        """Test a wrap near the top of a 32-bit counter yields a rate"""
+        self.engine.update({"1": [port(1, rx_bytes=2 ** 32 - 100)]}, 0.0)
+        result = self.engine.update({"1": [port(1, rx_bytes=100)]}, 1.0)
+        
+        assert result['ports']['1'][1]['rx_bps'] == pytest.approx(200 * 8)
+    
+    def test_64bit_counter_wrap(self):
+        """Test a wrap near the top of a 64-bit counter yields a rate"""
+        self.engine.update({"1": [port(1, rx_packets=2 ** 64 - 5)]}, 0.0)
+        result = self.engine.update({"1": [port(1, rx_packets=5)]}, 1.0)
+        
+        assert result['ports']['1'][1]['rx_pps'] == pytest.approx(10.0)
+    
+    def test_counter_reset_rebaselines(self):
+        """Test a switch reconnect drops the rate for one sample"""
+        self.engine.update({"1": [port(1, rx_packets=5000)]}, 0.0)
+        result = self.engine.update({"1": [port(1, rx_packets=10, duration_sec=1)]}, 1.0)
+        assert result['ports'] == {}
+        
+        result = self.engine.update({"1": [port(1, rx_packets=20, duration_sec=2)]}, 2.0)
+        assert result['ports']['1'][1]['rx_pps'] == pytest.approx(10.0)
+    
+    def test_stale_sample_has_no_rate(self):
+        """Test samples further apart than stale_after give no rate"""
+        self.engine.update({"1": [port(1, rx_packets=0)]}, 0.0)
+        result = self.engine.update({"1": [port(1, rx_packets=100)]}, 60.0)
+        
+        assert result['ports'] == {}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
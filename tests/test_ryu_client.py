@@ -0,0 +1,107 @@
+"""
+Unit tests for the Ryu REST API client fan-out
+Run with: python3 -m pytest tests/test_ryu_client.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import threading
+import time
+import pytest
+from ryu_client import RyuClient
+
+
+class FakeRyuClient(RyuClient):
+    """RyuClient answering from canned data with a fixed latency"""
+    
+    LATENCY = 0.01
+    
+    def __init__(self):
+        super().__init__(base_url="http://ryu.invalid")
+        self.requests = []
+        self.failing = set()
+    
+    def _get(self, endpoint, timeout=None, session=None):
+        self.requests.append((endpoint, time.monotonic()))
+        time.sleep(self.LATENCY)
+        if endpoint in self.failing:
+            raise ConnectionError("Ryu down")
+        if endpoint.startswith("/v1.0/topology/"):
+            return [{"dpid": "0000000000000001"}] if endpoint.endswith("switches") else []
+        dpid = endpoint.rsplit('/', 1)[1]
+        return {dpid: [{"port_no": 1}]}
+
+
+class TestFanout:
+    """Test suite for per-switch fan-out"""
+    
+    def setup_method(self):
+        """Create a fake client"""
+        self.client = FakeRyuClient()
+    
+    def teardown_method(self):
+        """Close the client's pools"""
+        self.client.close()
+    
+    def test_fanout_merges_switches(self):
+        """Test hex and decimal DPIDs are queried once and merged"""
+        stats = self.client.get_port_stats_fanout(["0000000000000001", 2, "3"])
+        
+        assert stats == {"1": [{"port_no": 1}], "2": [{"port_no": 1}], "3": [{"port_no": 1}]}
+    
+    def test_all_digit_hex_dpid(self):
+        """Test a 16-digit hex DPID made of digits only is read as hex"""
+        stats = self.client.get_port_stats_fanout(["0000000000000010"])
+        
+        assert stats == {"16": [{"port_no": 1}]}
+        assert self.client.requests[0][0] == "/stats/port/16"
+    
+    def test_spread_paces_requests(self):
+        """Test requests of a spread sweep are issued over the window"""
+        self.client.get_port_stats_fanout(range(1, 11), spread=0.5)
+        
+        times = sorted(at for _, at in self.client.requests)
+        assert times[-1] - times[0] >= 0.3
+    
+    def test_topology_not_blocked_by_spread_sweep(self):
+        """Test topology reads return promptly while a long sweep runs"""
+        sweep = threading.Thread(target=self.client.get_aggregate_flow_stats_fanout,
+                                 args=(range(1, 21), 1.0))
+        sweep.start()
+        time.sleep(0.1)
+        
+        started = time.monotonic()
+        topology = self.client.get_topology(timeout=1.0)
+        elapsed = time.monotonic() - started
+        sweep.join()
+        
+        assert topology["errors"] == {}
+        assert topology["switches"][0]["dpid_int"] == 1
+        assert elapsed < 0.5
+    
+    def test_failed_topology_read_reuses_last_good(self):
+        """Test a failed read carries over the last good list"""
+        self.client.get_topology(timeout=1.0)
+        self.client.failing.add("/v1.0/topology/switches")
+        
+        topology = self.client.get_topology(timeout=1.0)
+        
+        assert "switches" in topology["errors"]
+        assert topology["stale"] == ["switches"]
+        assert topology["switches"][0]["dpid"] == "0000000000000001"
+    
+    def test_failed_first_topology_read_is_empty(self):
+        """Test a failed read with nothing to carry over contributes an empty list"""
+        self.client.failing.add("/v1.0/topology/links")
+        
+        topology = self.client.get_topology(timeout=1.0)
+        
+        assert "links" in topology["errors"]
+        assert topology["stale"] == []
+        assert topology["links"] == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,110 @@
+"""
+Unit tests for the tiered task scheduler
+Run with: python3 -m pytest tests/test_scheduler.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import threading
+import time
+import pytest
+from scheduler import ScheduledTask, TieredScheduler, spread_offsets
+
+
+class TestSpreadOffsets:
+    """Test suite for per-switch request spreading"""
+    
+    def test_offsets_are_stable_and_within_window(self):
+        """Test every switch keeps the same offset inside the window"""
+        first = spread_offsets(range(1, 21), 1.0, jitter=0.2)
+        second = spread_offsets(range(1, 21), 1.0, jitter=0.2)
+        
+        assert first == second
+        assert all(0.0 <= offset <= 1.0 for offset in first.values())
+    
+    def test_offsets_are_evenly_spread(self):
+        """Test offsets without jitter are one slot apart"""
+        offsets = sorted(spread_offsets(range(10), 1.0).values())
+        
+        gaps = [b - a for a, b in zip(offsets, offsets[1:])]
+        assert gaps == pytest.approx([0.1] * 9)
+    
+    def test_no_window_means_no_offset(self):
+        """Test a zero window sends every request at once"""
+        assert set(spread_offsets([1, 2, 3], 0.0).values()) == {0.0}
+
+
+class TestTieredScheduler:
+    """Test suite for TieredScheduler"""
+    
+    def test_ticks_stay_on_fixed_rate_grid(self):
+        """Test a late tick advances to the next slot of the grid"""
+        scheduler = TieredScheduler(max_workers=1)
+        task = ScheduledTask('t', 1.0, lambda: None)
+        task.next_run = 100.0
+        
+        scheduler._advance(task, 100.4)
+        
+        assert task.next_run == 101.0
+        assert task.overruns == 0
+        assert task.max_lateness == pytest.approx(0.4)
+    
+    def test_missed_ticks_are_counted(self):
+        """Test ticks skipped by a stall are counted as overruns"""
+        scheduler = TieredScheduler(max_workers=1)
+        task = ScheduledTask('t', 1.0, lambda: None)
+        task.next_run = 100.0
+        
+        scheduler._advance(task, 103.5)
+        
+        assert task.next_run == 104.0
+        assert task.overruns == 3
+    
+    def test_slow_task_is_not_run_concurrently(self):
+        """Test a tick is skipped while the previous run is still going"""
+        release = threading.Event()
+        scheduler = TieredScheduler(max_workers=2)
+        scheduler.add_task('slow', 0.05, lambda: release.wait(1))
+        
+        scheduler.start()
+        time.sleep(0.3)
+        release.set()
+        scheduler.stop()
+        time.sleep(0.05)
+        
+        stats = scheduler.stats()['slow']
+        assert stats['runs'] == 1
+        assert stats['overruns'] >= 3
+    
+    def test_tasks_run_at_their_own_rate(self):
+        """Test each tier ticks at its own interval"""
+        counts = {'fast': 0, 'slow': 0}
+        scheduler = TieredScheduler(max_workers=2)
+        scheduler.add_task('fast', 0.05, lambda: counts.__setitem__('fast', counts['fast'] + 1))
+        scheduler.add_task('slow', 0.2, lambda: counts.__setitem__('slow', counts['slow'] + 1))
+        
+        scheduler.start()
+        time.sleep(0.42)
+        scheduler.stop()
+        
+        assert 7 <= counts['fast'] <= 10
+        assert 2 <= counts['slow'] <= 3
+    
+    def test_failures_are_counted(self):
+        """Test an exception in a task is recorded, not raised"""
+        def fail():
+            raise RuntimeError("boom")
+        
+        scheduler = TieredScheduler(max_workers=1)
+        scheduler.add_task('fail', 10, fail)
+        scheduler.start()
+        time.sleep(0.1)
+        scheduler.stop()
+        
+        assert scheduler.stats()['fail']['failures'] == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
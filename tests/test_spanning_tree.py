@@ -0,0 +1,77 @@
+"""
+Unit tests for the spanning tree used for loop-free flooding
+Run with: python3 -m pytest tests/test_spanning_tree.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'ryu_apps'))
+
+import itertools
+import pytest
+from spanning_tree import flood_ports, spanning_tree
+
+
+def mesh_links(n):
+    """Both directions of a full mesh where port p of sN leads to s(p)"""
+    links = []
+    for a, b in itertools.permutations(range(1, n + 1), 2):
+        links.append((a, b, b, a))
+    return links
+
+
+class TestSpanningTree:
+    """Test suite for spanning tree flood ports"""
+    
+    def test_mesh_tree_has_n_minus_one_links(self):
+        """Test a full mesh is reduced to a tree"""
+        tree = spanning_tree(mesh_links(4))
+        
+        assert len(tree) == 2 * 3
+        assert tree == {(1, 2), (2, 1), (1, 3), (3, 1), (1, 4), (4, 1)}
+    
+    def test_tree_is_deterministic(self):
+        """Test link order does not change the tree"""
+        links = mesh_links(5)
+        
+        assert spanning_tree(links) == spanning_tree(reversed(links))
+    
+    def test_flood_ports_keep_host_ports(self):
+        """Test host ports flood while non-tree switch ports are blocked"""
+        # Host on port 10 of every switch
+        switch_ports = {dpid: {1, 2, 3, 10} - {dpid} for dpid in (1, 2, 3)}
+        
+        flood = flood_ports(switch_ports, mesh_links(3))
+        
+        assert flood[1] == {2, 3, 10}
+        assert flood[2] == {1, 10}  # 2-3 is off the tree
+        assert flood[3] == {1, 10}
+    
+    def test_flooding_is_loop_free(self):
+        """Test flood ports form no cycle between switches"""
+        links = mesh_links(6)
+        switch_ports = {dpid: set(range(1, 7)) - {dpid} for dpid in range(1, 7)}
+        flood = flood_ports(switch_ports, links)
+        
+        used = {frozenset((a, b)) for a, pa, b, pb in links
+                if pa in flood[a] and pb in flood[b]}
+        
+        assert len(used) == 5  # a tree on 6 switches
+    
+    def test_link_removal_recomputes(self):
+        """Test a failed tree link is replaced by another path"""
+        links = [l for l in mesh_links(3) if {l[0], l[2]} != {1, 2}]
+        
+        tree = spanning_tree(links)
+        
+        assert tree == {(1, 3), (3, 1), (3, 2), (2, 3)}
+    
+    def test_separate_islands(self):
+        """Test each connected group gets its own tree"""
+        links = [(1, 1, 2, 1), (2, 1, 1, 1), (3, 1, 4, 1), (4, 1, 3, 1)]
+        
+        assert len(spanning_tree(links)) == 4
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
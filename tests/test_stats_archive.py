@@ -0,0 +1,101 @@
+"""
+Unit tests for the memory-mapped stats archive
+Run with: python3 -m pytest tests/test_stats_archive.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import pytest
+from stats_archive import StatsArchive
+
+
+def append_samples(archive, count):
+    """Append count samples for switches 1 and 2, one per second"""
+    for t in range(count):
+        port_stats = {
+            "1": [{"port_no": 1, "rx_packets": t}, {"port_no": "LOCAL", "rx_packets": t}],
+            "2": [{"port_no": 1, "rx_packets": 100 + t}]
+        }
+        rates = {"ports": {"1": {1: {"rx_pps": 1.5}}}}
+        archive.append(port_stats, rates, float(t))
+
+
+class TestStatsArchive:
+    """Test suite for StatsArchive"""
+    
+    def test_range_query_spans_segments(self, tmp_path):
+        """Test a range query slices every overlapping segment"""
+        archive = StatsArchive(str(tmp_path), segment_records=4, max_segments=10)
+        append_samples(archive, 6)
+        
+        result = archive.query(2, 4, dpid=1, port=1, columns=['rx_packets', 'rx_pps'])
+        
+        assert result['timestamp'] == [2.0, 3.0, 4.0]
+        assert result['rx_packets'] == [2, 3, 4]
+        assert result['rx_pps'] == [1.5, 1.5, 1.5]
+        assert result['truncated'] is False
+    
+    def test_missing_rates_are_null(self, tmp_path):
+        """Test records without a rate report None"""
+        archive = StatsArchive(str(tmp_path), segment_records=4, max_segments=10)
+        append_samples(archive, 1)
+        
+        result = archive.query(0, 0, dpid=2, columns=['rx_pps'])
+        assert result['rx_pps'] == [None]
+    
+    def test_retention_deletes_oldest_segments(self, tmp_path):
+        """Test the archive keeps at most max_segments segments"""
+        archive = StatsArchive(str(tmp_path), segment_records=3, max_segments=2)
+        append_samples(archive, 10)
+        
+        result = archive.query(0, 100, dpid=2, columns=['rx_packets'])
+        assert result['rx_packets'] == [108, 109]
+    
+    def test_reopen_existing_archive(self, tmp_path):
+        """Test records survive closing and reopening the archive"""
+        archive = StatsArchive(str(tmp_path), segment_records=4, max_segments=10)
+        append_samples(archive, 3)
+        archive.close()
+        
+        reopened = StatsArchive(str(tmp_path), segment_records=4, max_segments=10)
+        append_samples(reopened, 1)
+        
+        result = reopened.query(0, 100, dpid=2, columns=['rx_packets'])
+        assert result['rx_packets'] == [100, 101, 102, 100]
+    
+    def test_query_limit_truncates(self, tmp_path):
+        """Test large results are capped at the limit"""
+        archive = StatsArchive(str(tmp_path), segment_records=4, max_segments=10)
+        append_samples(archive, 5)
+        
+        result = archive.query(0, 100, limit=4)
+        assert len(result['timestamp']) == 4
+        assert result['truncated'] is True
+    
+    def test_query_exactly_at_limit_not_truncated(self, tmp_path):
+        """Test a result of exactly limit records is not flagged truncated"""
+        archive = StatsArchive(str(tmp_path), segment_records=4, max_segments=10)
+        append_samples(archive, 2)
+        
+        result = archive.query(0, 100, limit=6)
+        assert len(result['timestamp']) == 6
+        assert result['truncated'] is False
+    
+    def test_recovers_records_after_crash(self, tmp_path):
+        """Test records appended since the last index write survive a crash"""
+        archive = StatsArchive(str(tmp_path), segment_records=8, max_segments=10)
+        for t in (1000.0, 1001.0):
+            archive.append({"2": [{"port_no": 1, "rx_packets": int(t) - 900}]}, {}, t)
+        for segment in archive._segments.values():
+            segment.flush()
+        
+        reopened = StatsArchive(str(tmp_path), segment_records=8, max_segments=10)
+        
+        result = reopened.query(0, 2000, dpid=2, columns=['rx_packets'])
+        assert result['rx_packets'] == [100, 101]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
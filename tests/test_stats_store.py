@@ -0,0 +1,113 @@
+"""
+Unit tests for the in-memory stats history
+Run with: python3 -m pytest tests/test_stats_store.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import pytest
+from stats_store import StatsHistory
+
+
+def sample(rx_packets, rx_pps=None):
+    """Build port stats and rates for switch 1 port 1"""
+    port_stats = {"1": [{"port_no": 1, "rx_packets": rx_packets, "tx_packets": 0,
+                         "rx_bytes": 0, "tx_bytes": 0}]}
+    rates = {"ports": {}}
+    if rx_pps is not None:
+        rates["ports"] = {"1": {1: {"rx_pps": rx_pps, "tx_pps": 0.0,
+                                    "rx_bps": 0.0, "tx_bps": 0.0}}}
+    return port_stats, rates
+
+
+class TestStatsHistory:
+    """Test suite for StatsHistory"""
+    
+    def setup_method(self):
+        """Setup before each test"""
+        self.history = StatsHistory(
+            max_ports=2,
+            raw_samples=5,
+            tiers=[('10s', 10, 10), ('1m', 60, 10)]
+        )
+    
+    def record_series(self, count, interval=2.0):
+        """Record count samples with rx_packets and rx_pps increasing"""
+        for i in range(count):
+            port_stats, rates = sample(i * 10, float(i))
+            self.history.record(port_stats, rates, i * interval)
+    
+    def test_unknown_port_returns_none(self):
+        """Test querying an unrecorded port"""
+        assert self.history.query("1", 7, 0, 100) is None
+    
+    def test_raw_query(self):
+        """Test raw samples are returned oldest first"""
+        self.record_series(3)
+        result = self.history.query("1", 1, 0, 100, columns=['rx_packets', 'rx_pps'])
+        
+        assert result['tier'] == 'raw'
+        assert result['timestamps'] == [0.0, 2.0, 4.0]
+        assert result['series']['rx_packets'] == [0.0, 10.0, 20.0]
+        assert result['series']['rx_pps'] == [0.0, 1.0, 2.0]
+    
+    def test_raw_ring_is_bounded(self):
+        """Test the raw ring keeps only the newest samples"""
+        self.record_series(8)
+        result = self.history.query("1", 1, 10, 100)
+        
+        assert result['timestamps'] == [10.0, 12.0, 14.0]
+    
+    def test_rollup_tier_used_for_coarse_step(self):
+        """Test a 10s step reads the 10s tier (mean rates, last counters)"""
+        self.record_series(11)  # t = 0..20, buckets [0,10) and [10,20) are complete
+        result = self.history.query("1", 1, 0, 100, step=10)
+        
+        assert result['tier'] == '10s'
+        assert result['timestamps'] == [0.0, 10.0]
+        assert result['series']['rx_pps'] == [2.0, 7.0]
+        assert result['series']['rx_packets'] == [40.0, 90.0]
+    
+    def test_missing_rates_are_null(self):
+        """Test samples without a rate report None"""
+        port_stats, rates = sample(5)
+        self.history.record(port_stats, rates, 1.0)
+        
+        result = self.history.query("1", 1, 0, 10)
+        assert result['series']['rx_pps'] == [None]
+    
+    def test_downsample_raw_to_step(self):
+        """Test raw samples are re-bucketed when no tier matches the step"""
+        self.record_series(4)  # t = 0, 2, 4, 6
+        result = self.history.query("1", 1, 0, 100, step=4)
+        
+        assert result['tier'] == 'raw'
+        assert result['timestamps'] == [0.0, 4.0]
+        assert result['series']['rx_pps'] == [0.5, 2.5]
+        assert result['series']['rx_packets'] == [10.0, 30.0]
+    
+    def test_unknown_counter_rejected(self):
+        """Test unknown counters raise ValueError"""
+        self.record_series(1)
+        with pytest.raises(ValueError):
+            self.history.query("1", 1, 0, 10, columns=['bogus'])
+    
+    def test_max_ports_evicts_least_recent(self):
+        """Test memory stays capped by evicting the oldest port"""
+        for dpid in ("1", "2", "3"):
+            self.history.record(
+                {dpid: [{"port_no": 1, "rx_packets": 1}]}, {"ports": {}}, 0.0
+            )
+        
+        assert self.history.query("1", 1, 0, 10) is None
+        assert self.history.query("3", 1, 0, 10) is not None
+        first_size = self.history.nbytes
+        
+        self.record_series(5)
+        assert self.history.nbytes == first_size
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
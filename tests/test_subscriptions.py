@@ -0,0 +1,121 @@
+"""
+Unit tests for Socket.IO client subscriptions
+Run with: python3 -m pytest tests/test_subscriptions.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import pytest
+from subscriptions import Subscription, SubscriptionRegistry, normalize_dpid
+
+
+STATS = {
+    "port_stats": {
+        "1": [{"port_no": 1, "rx_packets": 1, "tx_packets": 2, "rx_bytes": 10, "tx_bytes": 20},
+              {"port_no": 2, "rx_packets": 3, "tx_packets": 4, "rx_bytes": 30, "tx_bytes": 40}],
+        "2": [{"port_no": 1, "rx_packets": 5, "tx_packets": 6, "rx_bytes": 50, "tx_bytes": 60}]
+    },
+    "port_rates": {
+        "1": {1: {"rx_pps": 1.0}, 2: {"rx_pps": 2.0}},
+        "2": {1: {"rx_pps": 4.0}}
+    },
+    "total_packets": 21,
+    "timestamp": 1.0
+}
+
+
+class TestSubscription:
+    """Test suite for Subscription"""
+    
+    def test_default_subscribes_to_everything(self):
+        """Test the default subscription shares the 'all' room"""
+        subscription = Subscription()
+        
+        assert subscription.room == 'sub:all'
+        assert subscription.wants('stats')
+        assert subscription.slice_stats(STATS) is STATS
+    
+    def test_hex_and_decimal_dpids_share_a_room(self):
+        """Test equivalent subscriptions map to the same room"""
+        a = Subscription(dpids=["0000000000000001"], ports=["2"])
+        b = Subscription(dpids=[1], ports=[2])
+        
+        assert a.room == b.room
+        assert a.room != 'sub:all'
+    
+    def test_normalize_dpid_reads_16_digit_dpids_as_hex(self):
+        """Test all-digit 16-character DPIDs are parsed as hex, not decimal"""
+        assert normalize_dpid("0000000000000001") == "1"
+        assert normalize_dpid("0000000000000010") == "16"
+        assert normalize_dpid("10") == "10"
+        assert normalize_dpid("a") == "10"
+    
+    def test_slice_by_dpid(self):
+        """Test only subscribed switches are kept and totals recomputed"""
+        sliced = Subscription(dpids=["2"]).slice_stats(STATS)
+        
+        assert list(sliced['port_stats']) == ["2"]
+        assert sliced['total_packets'] == 11
+        assert sliced['total_rates'] == {"rx_pps": 4.0}
+        assert sliced['timestamp'] == 1.0
+    
+    def test_slice_by_port(self):
+        """Test port filters apply on every switch"""
+        sliced = Subscription(ports=[2]).slice_stats(STATS)
+        
+        assert sliced['port_stats'] == {"1": [STATS['port_stats']['1'][1]]}
+        assert sliced['port_rates'] == {"1": {2: {"rx_pps": 2.0}}}
+    
+    def test_unknown_event_kind_rejected(self):
+        """Test invalid event kinds raise ValueError"""
+        with pytest.raises(ValueError):
+            Subscription(events=['bogus'])
+    
+    def test_non_list_filters_rejected(self):
+        """Test a string or number instead of a list raises TypeError"""
+        for kwargs in ({'dpids': "0000000000000001"}, {'ports': 1}, {'events': "stats"}):
+            with pytest.raises(TypeError):
+                Subscription(**kwargs)
+
+
+class TestSubscriptionRegistry:
+    """Test suite for SubscriptionRegistry"""
+    
+    def test_rooms_track_members(self):
+        """Test rooms reflect current client subscriptions"""
+        registry = SubscriptionRegistry()
+        registry.set("a", Subscription())
+        previous = registry.set("a", Subscription(dpids=[1]))
+        registry.set("b", Subscription(dpids=[1]))
+        
+        assert previous == 'sub:all'
+        assert len(registry.rooms()) == 1
+        
+        assert registry.wants_stats()
+        assert registry.wanted_dpids() == {"1"}
+        
+        registry.remove("a")
+        registry.remove("b")
+        assert registry.rooms() == {}
+        assert len(registry) == 0
+    
+    
+    def test_wanted_dpids(self):
+        """Test stats demand is the union of stats subscriptions"""
+        registry = SubscriptionRegistry()
+        assert not registry.wants_stats()
+        assert registry.wanted_dpids() == set()
+        
+        registry.set("a", Subscription(dpids=[1], events=['stats']))
+        registry.set("b", Subscription(dpids=[2]))
+        registry.set("c", Subscription(events=['topology']))
+        assert registry.wanted_dpids() == {"1", "2"}
+        
+        registry.set("d", Subscription())
+        assert registry.wanted_dpids() is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,171 @@
+"""
+Unit tests for the topology snapshot cache
+Run with: python3 -m pytest tests/test_topology_cache.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import time
+import pytest
+from topology_cache import TopologyCache, diff_snapshots
+
+
+def make_snapshot(*switch_ids):
+    """Build a minimal topology snapshot with the given switches"""
+    return {
+        "nodes": [{"id": s, "type": "switch"} for s in switch_ids],
+        "edges": [],
+        "topology_type": "star"
+    }
+
+
+class TestTopologyCache:
+    """Test suite for TopologyCache"""
+    
+    def setup_method(self):
+        """Setup before each test"""
+        self.snapshots = [make_snapshot("s1")]
+        self.builds = 0
+        self.cache = TopologyCache(self.build, refresh_interval=1, max_age=60)
+    
+    def build(self):
+        """Builder returning the current fake snapshot"""
+        self.builds += 1
+        return self.snapshots[-1]
+    
+    def test_first_get_builds_snapshot(self):
+        """Test the first read builds version 1"""
+        snapshot, etag = self.cache.get()
+        
+        assert snapshot['version'] == 1
+        assert etag == TopologyCache.content_hash(make_snapshot("s1"))
+        assert self.builds == 1
+    
+    def test_fresh_snapshot_is_served_from_cache(self):
+        """Test reads within max_age do not rebuild"""
+        self.cache.get()
+        self.cache.get()
+        
+        assert self.builds == 1
+    
+    def test_unchanged_content_keeps_version(self):
+        """Test refreshing identical content keeps version and ETag"""
+        _, etag = self.cache.get()
+        
+        assert self.cache.refresh() is False
+        snapshot, new_etag = self.cache.get()
+        assert snapshot['version'] == 1
+        assert new_etag == etag
+    
+    def test_changed_content_bumps_version(self):
+        """Test new content bumps the version and notifies listeners"""
+        published = []
+        self.cache.add_listener(lambda snapshot, delta: published.append((snapshot, delta)))
+        self.cache.get()
+        
+        self.snapshots.append(make_snapshot("s1", "s2"))
+        assert self.cache.refresh() is True
+        
+        snapshot, _ = self.cache.get()
+        assert snapshot['version'] == 2
+        assert [s['version'] for s, _ in published] == [1, 2]
+        assert published[0][1] is None
+        assert published[1][1]['from_version'] == 1
+        assert published[1][1]['nodes']['added'] == [{"id": "s2", "type": "switch"}]
+    
+    def test_failed_build_keeps_previous_snapshot(self):
+        """Test an error snapshot does not replace a good one"""
+        self.cache.get()
+        
+        self.snapshots.append({"nodes": [], "edges": [], "error": "Ryu down"})
+        assert self.cache.refresh() is False
+        
+        snapshot, _ = self.cache.get()
+        assert snapshot['nodes'] == [{"id": "s1", "type": "switch"}]
+    
+    def test_failed_rebuild_backs_off(self):
+        """Test stale reads during an outage do not each retry the rebuild"""
+        cache = TopologyCache(self.build, refresh_interval=1, max_age=0.01, retry_backoff=60)
+        cache.get()
+        time.sleep(0.02)
+        
+        self.snapshots.append({"nodes": [], "edges": [], "error": "Ryu down"})
+        cache.get()
+        cache.get()
+        cache.get()
+        
+        assert self.builds == 2
+        assert cache.get()[0]['nodes'] == [{"id": "s1", "type": "switch"}]
+    
+    def test_all_failed_reads_keep_previous_snapshot(self):
+        """Test an empty snapshot from failed reads does not replace a good one"""
+        self.cache.get()
+        self.snapshots.append({
+            "nodes": [],
+            "edges": [],
+            "partial": True,
+            "errors": {"switches": "down", "links": "down", "hosts": "down"}
+        })
+        
+        assert self.cache.refresh() is False
+        
+        snapshot, _ = self.cache.get()
+        assert snapshot['version'] == 1
+        assert snapshot['nodes'] == [{"id": "s1", "type": "switch"}]
+    
+    def test_partial_snapshot_replaces_partial(self):
+        """Test a partial snapshot is stored when the cached one is partial too"""
+        partial = dict(make_snapshot("s1"), partial=True, errors={"hosts": "down"})
+        self.snapshots = [partial]
+        self.cache.get()
+        
+        self.snapshots.append(dict(make_snapshot("s1", "s2"), partial=True,
+                                   errors={"hosts": "down"}))
+        
+        assert self.cache.refresh() is True
+        assert len(self.cache.get()[0]['nodes']) == 2
+
+
+class TestDiffSnapshots:
+    """Test suite for topology delta computation"""
+    
+    def test_diff_nodes_and_edges(self):
+        """Test added, removed and changed nodes and edges"""
+        old = {
+            "version": 4,
+            "nodes": [{"id": "s1", "type": "switch"}, {"id": "h1", "ip": "Unknown"}],
+            "edges": [{"source": "h1", "target": "s1", "type": "host-switch"}],
+            "switch_count": 1
+        }
+        new = {
+            "version": 5,
+            "nodes": [{"id": "s2", "type": "switch"}, {"id": "h1", "ip": "10.0.0.1"}],
+            "edges": [{"source": "h1", "target": "s2", "type": "host-switch"}],
+            "switch_count": 1
+        }
+        
+        delta = diff_snapshots(old, new)
+        
+        assert delta['from_version'] == 4
+        assert delta['version'] == 5
+        assert delta['nodes']['added'] == [{"id": "s2", "type": "switch"}]
+        assert delta['nodes']['removed'] == ["s1"]
+        assert delta['nodes']['changed'] == [{"id": "h1", "ip": "10.0.0.1"}]
+        assert delta['edges']['added'][0]['target'] == "s2"
+        assert delta['edges']['removed'] == ["h1-s1"]
+        assert delta['meta'] == {"switch_count": 1}
+    
+    def test_identical_snapshots_have_empty_delta(self):
+        """Test identical content produces no changes"""
+        snapshot = make_snapshot("s1")
+        delta = diff_snapshots(dict(snapshot, version=1), dict(snapshot, version=1))
+        
+        for part in ('nodes', 'edges'):
+            for kind in ('added', 'removed', 'changed'):
+                assert delta[part][kind] == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,139 @@
+"""
+Unit tests for topology generators
+Run with: python3 -m pytest tests/test_topology_generators.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from collections import Counter
+import pytest
+import config
+from topology_generators import (AddressAllocator, fat_tree, from_spec, leaf_spine,
+                                 random_regular, size_limits, torus)
+
+
+def degrees(spec):
+    """Inter-switch link count of every switch"""
+    counts = Counter()
+    for a, b in spec.links:
+        counts[a] += 1
+        counts[b] += 1
+    return counts
+
+
+class TestGenerators:
+    """Test suite for generated topologies"""
+    
+    def test_fat_tree_counts(self):
+        """Test a k=4 fat-tree has the textbook shape"""
+        spec = fat_tree(4)
+        spec.validate()
+        
+        assert spec.switches == 20  # 4 core + 8 aggregation + 8 edge
+        assert len(spec.hosts) == 16
+        assert len(spec.links) == 32
+        assert set(degrees(spec).values()) == {4, 2}  # core/aggregation 4, edge 2 uplinks
+    
+    def test_fat_tree_large(self):
+        """Test the largest allowed fat-tree reaches hundreds of switches"""
+        spec = fat_tree(size_limits('fat_tree')[1])
+        spec.validate()
+        
+        assert spec.switches == 320
+        assert len(spec.hosts) == 1024
+    
+    def test_fat_tree_odd_k(self):
+        """Test odd k is rejected"""
+        with pytest.raises(ValueError):
+            fat_tree(5)
+    
+    def test_leaf_spine(self):
+        """Test every leaf links to every spine"""
+        spec = leaf_spine(8, spines=2, hosts_per_leaf=3)
+        spec.validate()
+        
+        assert spec.switches == 10
+        assert len(spec.links) == 16
+        assert len(spec.hosts) == 24
+        assert all(degrees(spec)[spine] == 8 for spine in (1, 2))
+    
+    def test_torus(self):
+        """Test every torus switch has four neighbors"""
+        spec = torus(4)
+        spec.validate()
+        
+        assert spec.switches == 16
+        assert len(spec.links) == 32
+        assert set(degrees(spec).values()) == {4}
+    
+    def test_random_regular(self):
+        """Test the random graph is regular, simple and reproducible"""
+        spec = random_regular(50, degree=4, seed=7)
+        spec.validate()
+        
+        assert set(degrees(spec).values()) == {4}
+        assert spec.links == random_regular(50, degree=4, seed=7).links
+    
+    def test_random_regular_impossible(self):
+        """Test degree/size combinations without a regular graph are rejected"""
+        with pytest.raises(ValueError):
+            random_regular(5, degree=3)
+
+
+class TestSpecs:
+    """Test suite for declarative topology specs"""
+    
+    def test_from_spec(self):
+        """Test names, numbers and per-switch host overrides"""
+        spec = from_spec({
+            "switches": 3,
+            "links": [["s1", "s2"], [2, 3]],
+            "hosts": {"s3": 2}
+        })
+        
+        assert spec.links == [(1, 2), (2, 3)]
+        assert spec.hosts == [1, 2, 3, 3]
+    
+    def test_invalid_specs(self):
+        """Test broken specs are rejected"""
+        for data in ({"links": []},
+                     {"switches": 2, "links": [["s1", "s3"]]},
+                     {"switches": 2, "links": [["s1", "s2"], ["s2", "s1"]]},
+                     {"switches": 2, "links": [["s1", "s1"]]},
+                     {"switches": config.CUSTOM_TOPOLOGY_MAX_SWITCHES + 1},
+                     {"switches": 2, "links": "s1-s2"},
+                     {"switches": 2, "hosts_per_switch": "two"},
+                     {"switches": 2, "hosts_per_switch": -1},
+                     {"switches": 2, "hosts": ["s1"]},
+                     {"switches": 2, "hosts": {"s1": None}},
+                     {"switches": 1, "hosts": {"s1": config.CUSTOM_TOPOLOGY_MAX_HOSTS + 1}}):
+            with pytest.raises(ValueError):
+                from_spec(data)
+
+
+class TestAddressAllocator:
+    """Test suite for host address allocation"""
+    
+    def test_addresses_past_254_hosts(self):
+        """Test addressing continues beyond the first /24"""
+        allocator = AddressAllocator('10.0.0.0/16')
+        
+        assert allocator.address(1) == '10.0.0.1/16'
+        assert allocator.address(300) == '10.0.1.44/16'
+    
+    def test_network_exhausted(self):
+        """Test allocating past the prefix fails loudly"""
+        with pytest.raises(ValueError):
+            AddressAllocator('10.0.0.0/30').address(3)
+    
+    def test_next_free(self):
+        """Test the lowest unused address is picked"""
+        allocator = AddressAllocator('10.0.0.0/16')
+        
+        assert allocator.next_free(['10.0.0.1', '10.0.0.3']) == '10.0.0.2/16'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])